@@ -6,7 +6,7 @@ import os
 
 from app.models.user import User
 from app.api.deps import get_db
-from app.core.security import create_access_token
+from app.core.security import build_token_claims, create_access_token
 
 router = APIRouter(prefix="/api/auth", tags=["Auth"])
 
@@ -73,7 +73,7 @@ def google_login(payload: dict, db: Session = Depends(get_db)):
     # =========================
     # CREATE JWT TOKEN
     # =========================
-    access_token = create_access_token({"sub": str(user.id)})
+    access_token = create_access_token(build_token_claims(user))
 
     # =========================
     # RESPONSE
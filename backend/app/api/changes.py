@@ -0,0 +1,216 @@
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.api.deps import get_async_db
+from app.api.pagination import MAX_PAGE_SIZE
+from app.core.config import CHANGE_FEED_SETTLE_SECONDS
+from app.core.security import get_async_auth_context
+from app.models.change_log import ChangeLog
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.change import ChangeFeed
+from app.services.auth_service import AuthContext, is_admin
+from app.services.change_log import UPSERT
+
+router = APIRouter(prefix="/api/changes", tags=["Changes"])
+
+DEFAULT_CHANGE_PAGE_SIZE = 200
+
+
+# ==========================================================
+# HELPERS: CURRENT STATE FOR UPSERTED ROWS (one query per entity)
+# ==========================================================
+async def load_tasks(db, ids):
+    result = await db.execute(
+        select(Task).options(selectinload(Task.assignees)).where(Task.id.in_(ids))
+    )
+    return {
+        t.id: {
+            "id": t.id,
+            "title": t.title,
+            "description": t.description,
+            "status": t.status,
+            "due_date": t.due_date,
+            "project_id": t.project_id,
+            "created_by_id": t.created_by_id,
+            "created_at": t.created_at,
+            "updated_at": t.updated_at,
+            "assignees": [a.user_id for a in t.assignees],
+        }
+        for t in result.scalars()
+    }
+
+
+async def load_projects(db, ids):
+    result = await db.execute(select(Project).where(Project.id.in_(ids)))
+    return {
+        p.id: {
+            "id": p.id,
+            "name": p.name,
+            "description": p.description,
+            "start_date": p.start_date,
+            "end_date": p.end_date,
+            "created_by_id": p.created_by_id,
+            "created_at": p.created_at,
+            "updated_at": p.updated_at,
+        }
+        for p in result.scalars()
+    }
+
+
+async def load_members(db, keys):
+    result = await db.execute(
+        select(ProjectMember).where(
+            ProjectMember.project_id.in_({project_id for project_id, _ in keys}),
+            ProjectMember.user_id.in_({user_id for _, user_id in keys}),
+        )
+    )
+    return {
+        (m.project_id, m.user_id): {
+            "project_id": m.project_id,
+            "user_id": m.user_id,
+            "role": m.role,
+            "joined_at": m.joined_at,
+        }
+        for m in result.scalars()
+    }
+
+
+async def load_users(db, ids):
+    result = await db.execute(
+        select(User.id, User.name, User.email, User.role_id).where(User.id.in_(ids))
+    )
+    return {
+        user_id: {"id": user_id, "name": name, "email": email, "role_id": role_id}
+        for user_id, name, email, role_id in result.all()
+    }
+
+
+def parse_since(since: str) -> int:
+    try:
+        value = int(since)
+    except ValueError:
+        raise HTTPException(400, "Invalid cursor")
+
+    if value < 0:
+        raise HTTPException(400, "Invalid cursor")
+
+    return value
+
+
+# ==========================================================
+# CHANGE FEED
+# ==========================================================
+@router.get("", response_model=ChangeFeed)
+async def get_changes(
+    since: str | None = None,
+    limit: int = Query(DEFAULT_CHANGE_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+    ctx: AuthContext = Depends(get_async_auth_context),
+):
+    """
+    Tasks, memberships and projects (plus users, for admins) changed
+    since the cursor. Upserts carry the row's current state; deletions
+    come back as tombstones. A project tombstone implies its tasks and
+    memberships are gone too; members of a deleted project get their own
+    `member` tombstone for it, since they are no longer in its scope.
+
+    Without `since`, only the current cursor is returned: fetch a full
+    snapshot, then follow the feed from there. A `member` upsert for the
+    caller means they joined a project, whose earlier history is not in
+    their feed; fetch that project's detail.
+
+    Cost scales with the number of change-log rows after the cursor. The
+    log is read by primary key and each entity type is loaded with one
+    IN query.
+    """
+    if is_admin(ctx.user):
+        scope = None
+    else:
+        scope = or_(
+            ChangeLog.project_id.in_(list(ctx.memberships)),
+            # Tombstones for the caller's own removals outlive the membership
+            and_(ChangeLog.entity == "member", ChangeLog.entity_id == ctx.user.id),
+        )
+
+    if since is None:
+        result = await db.execute(select(func.max(ChangeLog.id)))
+        return {
+            "changes": [],
+            "next_cursor": str(result.scalar() or 0),
+            "has_more": False,
+        }
+
+    cursor = parse_since(since)
+    settled = datetime.utcnow() - timedelta(seconds=CHANGE_FEED_SETTLE_SECONDS)
+
+    stmt = (
+        select(ChangeLog)
+        .where(ChangeLog.id > cursor, ChangeLog.created_at <= settled)
+        .order_by(ChangeLog.id)
+        .limit(limit + 1)
+    )
+    if scope is not None:
+        stmt = stmt.where(scope)
+
+    entries = (await db.execute(stmt)).scalars().all()
+
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    next_cursor = str(entries[-1].id if entries else cursor)
+
+    # =========================
+    # COLLAPSE: latest op per row wins
+    # =========================
+    latest = {}
+    for entry in entries:
+        key = (entry.entity, entry.project_id, entry.entity_id)
+        latest.pop(key, None)
+        latest[key] = entry
+
+    upserts = {}
+    for (entity, project_id, entity_id), entry in latest.items():
+        if entry.op == UPSERT:
+            upserts.setdefault(entity, set()).add(
+                (project_id, entity_id) if entity == "member" else entity_id
+            )
+
+    loaders = {
+        "task": load_tasks,
+        "project": load_projects,
+        "member": load_members,
+        "user": load_users,
+    }
+    current = {
+        entity: await loaders[entity](db, keys) for entity, keys in upserts.items()
+    }
+
+    changes = []
+    for (entity, project_id, entity_id), entry in latest.items():
+        change = {
+            "entity": entity,
+            "op": entry.op,
+            "id": entity_id,
+            "project_id": project_id,
+            "at": entry.created_at,
+        }
+
+        if entry.op == UPSERT:
+            key = (project_id, entity_id) if entity == "member" else entity_id
+            data = current[entity].get(key)
+
+            # Deleted since; its tombstone is further along the log
+            if data is None:
+                continue
+
+            change["data"] = data
+
+        changes.append(change)
+
+    return {"changes": changes, "next_cursor": next_cursor, "has_more": has_more}
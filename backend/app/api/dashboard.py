@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.api.etag import compute_etag, etag_matches, not_modified, set_etag
+from app.api.projects import (
+    format_project,
+    visible_projects_clause,
+    visible_projects_stmt,
+)
+from app.core.enums import TaskStatus
+from app.core.security import Principal, get_current_user
+from app.models.project import Project
+from app.models.task import Task, TaskAssignee
+from app.schemas.dashboard import DashboardRead
+from app.services.stats_service import get_project_stats
+
+router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
+
+DUE_SOON_LIMIT = 20
+
+
+# ==========================================================
+# DASHBOARD SUMMARY
+# ==========================================================
+@router.get("", response_model=DashboardRead)
+async def get_dashboard(
+    request: Request,
+    response: Response,
+    days: int = Query(7, ge=1, le=90),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    # Same tag inputs as the project list (task writes bump the revision),
+    # plus the minute: overdue counts and the due-soon window follow the clock
+    result = await db.execute(
+        select(
+            func.count(Project.id),
+            func.max(Project.updated_at),
+            func.sum(Project.revision),
+        ).where(visible_projects_clause(current_user))
+    )
+    now = datetime.utcnow()
+    etag = compute_etag(
+        "dashboard",
+        current_user.id,
+        current_user.role_name,
+        request.url.query,
+        now.replace(second=0, microsecond=0),
+        *result.one(),
+    )
+
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    set_etag(response, etag)
+
+    projects = (await db.execute(visible_projects_stmt(current_user))).scalars().all()
+    stats = await get_project_stats(db, [p.id for p in projects])
+
+    assigned = (
+        select(Task).join(TaskAssignee).where(TaskAssignee.user_id == current_user.id)
+    )
+
+    due_soon = (
+        (
+            await db.execute(
+                assigned.where(
+                    Task.status != TaskStatus.DONE.value,
+                    Task.due_date.is_not(None),
+                    Task.due_date <= now + timedelta(days=days),
+                )
+                .order_by(Task.due_date, Task.id)
+                .limit(DUE_SOON_LIMIT)
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    result = await db.execute(
+        select(Task.status, func.count(Task.id))
+        .join(TaskAssignee)
+        .where(TaskAssignee.user_id == current_user.id)
+        .group_by(Task.status)
+    )
+    status_totals = {status.value: 0 for status in TaskStatus}
+    status_totals.update(dict(result.all()))
+
+    return {
+        "projects": [
+            {
+                **format_project(p),
+                # Live GROUP BY counts: overdue is exact, not the snapshot
+                "task_counts": {
+                    key: stats[p.id][key]
+                    for key in ("total", "by_status", "overdue", "progress")
+                },
+            }
+            for p in projects
+        ],
+        "due_soon": [
+            {
+                "id": t.id,
+                "title": t.title,
+                "description": t.description,
+                "status": t.status,
+                "project_id": t.project_id,
+                "due_date": t.due_date,
+            }
+            for t in due_soon
+        ],
+        "status_totals": status_totals,
+    }
@@ -0,0 +1,45 @@
+import hashlib
+
+from fastapi import Request, Response
+
+# Revalidate on every use; a matching ETag turns the refetch into a 304
+CACHE_CONTROL = "private, no-cache"
+
+
+# =========================
+# ETAG HELPERS
+# =========================
+def compute_etag(*parts) -> str:
+    """
+    Strong ETag over cheap version data (ids, revisions, max updated_at,
+    counts). Callers include everything the body depends on, such as the
+    caller's id and the query string.
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    tags = (tag.strip() for tag in header.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.headers["Vary"] = "Authorization"
+
+
+def not_modified(etag: str) -> Response:
+    response = Response(status_code=304)
+    set_etag(response, etag)
+    return response
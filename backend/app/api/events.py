@@ -0,0 +1,100 @@
+import asyncio
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.core.security import decode_access_token, get_current_user
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.services.auth_service import is_admin
+from app.services.events import broker
+
+router = APIRouter(prefix="/api/events", tags=["Events"])
+
+
+# ==========================================================
+# HELPER: EVENTS THAT END A SUBSCRIPTION
+# ==========================================================
+def ends_subscription(event, user) -> bool:
+    if event["type"] == "project.deleted":
+        return True
+
+    # A member removed from the project stops receiving its events
+    return (
+        event["type"] == "member.removed"
+        and user.id in event["data"].get("user_ids", ())
+        and not is_admin(user)
+    )
+
+
+# ==========================================================
+# PROJECT EVENT STREAM
+# ==========================================================
+@router.websocket("/projects/{project_id}")
+async def project_events(
+    websocket: WebSocket,
+    project_id: str,
+    token: str = Query(...),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Pushes task/member delta events for one project. Browsers can't set
+    headers on WebSocket requests, so the access token is a query param.
+    Only admins and project members may subscribe.
+    """
+    try:
+        user = await get_current_user(decode_access_token(token), db)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    if is_admin(user):
+        query = select(Project.id).where(Project.id == project_id)
+    else:
+        query = select(ProjectMember.project_id).where(
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id == user.id,
+        )
+
+    allowed = (await db.execute(query)).first() is not None
+
+    # Don't hold a pooled connection for the lifetime of the socket
+    await db.close()
+
+    if not allowed:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    subscription = broker.subscribe(project_id)
+    await websocket.accept()
+
+    async def forward():
+        while True:
+            event = await subscription.get()
+            await websocket.send_text(orjson.dumps(event).decode())
+
+            if ends_subscription(event, user):
+                return True
+
+    async def until_disconnect():
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return False
+
+    tasks = {asyncio.create_task(forward()), asyncio.create_task(until_disconnect())}
+
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+        for task in pending:
+            task.cancel()
+
+        # forward() returns True when an event ended the subscription
+        if any(task.exception() is None and task.result() for task in done):
+            await websocket.close()
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.core.security import Principal, get_current_user
+from app.schemas.job import JobRead
+from app.services.auth_service import is_admin
+from app.services.jobs import jobs
+
+router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
+
+
+# ==========================================================
+# JOB STATUS (Admin or whoever started it)
+# ==========================================================
+@router.get("/{job_id}", response_model=JobRead)
+async def get_job(
+    job_id: str,
+    current_user: Principal = Depends(get_current_user),
+):
+    job = jobs.get(job_id)
+
+    # Other users' jobs are indistinguishable from unknown ones
+    if not job or (job.created_by_id != current_user.id and not is_admin(current_user)):
+        raise HTTPException(404, "Job not found")
+
+    return job
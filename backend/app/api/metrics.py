@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends
+
+from app.core.security import require_role
+from app.core.config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+from app.db.session import (
+    async_engine,
+    async_pool_metrics,
+    engine,
+    sync_pool_metrics,
+)
+
+router = APIRouter(prefix="/api/metrics", tags=["Metrics"])
+
+
+# ==========================================================
+# CONNECTION POOL METRICS (Admin only, per worker process)
+# ==========================================================
+@router.get("/pool")
+async def pool_metrics(admin_user=Depends(require_role("Admin"))):
+    return {
+        "config": {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_timeout": DB_POOL_TIMEOUT,
+            "pool_recycle": DB_POOL_RECYCLE,
+            "pre_ping": DB_POOL_PRE_PING,
+        },
+        "sync": sync_pool_metrics.snapshot(engine.pool),
+        "async": async_pool_metrics.snapshot(async_engine.sync_engine.pool),
+    }
@@ -0,0 +1,83 @@
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+# =========================
+# CURSOR ENCODING
+# =========================
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(row_id)
+    except Exception:
+        raise HTTPException(400, "Invalid cursor")
+
+
+def is_paginated(limit: int | None, cursor: str | None) -> bool:
+    return limit is not None or cursor is not None
+
+
+# =========================
+# KEYSET PAGINATION
+# =========================
+def apply_keyset(query, model, limit: int, cursor: str | None):
+    """
+    Orders by (created_at, id) and seeks past the cursor. Works on both
+    ORM Query objects and select() statements. Fetches one extra row so
+    the caller can tell whether another page exists.
+    """
+    query = query.order_by(model.created_at, model.id)
+
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                model.created_at > created_at,
+                and_(model.created_at == created_at, model.id > last_id),
+            )
+        )
+
+    return query.limit(limit + 1)
+
+
+def split_page(rows, limit: int):
+    next_cursor = None
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return rows, next_cursor
+
+
+def paginate(query, model, limit: int | None, cursor: str | None):
+    """
+    Keyset pagination ordered by (created_at, id).
+
+    Every page is a range scan starting right after the previous page's
+    last row, so deep pages cost the same as the first one.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    limit = limit or DEFAULT_PAGE_SIZE
+    rows = apply_keyset(query, model, limit, cursor).all()
+    return split_page(rows, limit)
+
+
+async def paginate_async(db, stmt, model, limit: int | None, cursor: str | None):
+    """paginate() for select() statements on an AsyncSession."""
+    limit = limit or DEFAULT_PAGE_SIZE
+    result = await db.execute(apply_keyset(stmt, model, limit, cursor))
+    return split_page(result.scalars().all(), limit)
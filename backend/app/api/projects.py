@@ -1,35 +1,155 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from sqlalchemy import delete, func, insert, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, sessionmaker
 
 from app.models.project import Project
-from app.schemas.project import CreateProjectRequest, UpdateProjectRequest
+from app.schemas.project import (
+    BulkMembersRequest,
+    CreateProjectRequest,
+    ProjectDetail,
+    ProjectPage,
+    ProjectRead,
+    ProjectStats,
+    UpdateProjectRequest,
+)
 from app.models.project_member import ProjectMember
 from app.models.task import Task, TaskAssignee
 from app.models.user import User
-from app.core.security import get_current_user
-from app.api.deps import get_db
+from app.core.security import (
+    Principal,
+    get_async_auth_context,
+    get_auth_context,
+    get_current_user,
+)
+from app.api.deps import get_async_db, get_db
+from app.api.etag import compute_etag, etag_matches, not_modified, set_etag
+from app.api.pagination import MAX_PAGE_SIZE, is_paginated, paginate_async
+from app.core.config import PROJECT_DELETE_BATCH_SIZE
 
 from app.services.auth_service import (
+    AuthContext,
     can_view_project,
     can_modify_project,
     can_create_task,
+    is_admin,
+)
+from app.services.change_log import DELETE, UPSERT, record_change, record_changes
+from app.services.search_index import (
+    index_document,
+    reindex_document,
+    remove_documents,
+    remove_project_documents,
 )
+from app.services.events import publish
+from app.services.jobs import jobs
+from app.services.revision_service import touch_projects
+from app.services.task_counters import STATUS_COUNTERS, count_tasks
+from app.services.stats_service import get_project_stats
 
 from app.core.enums import TaskStatus
 
 router = APIRouter(prefix="/api/projects", tags=["Projects"])
 
 
+# =========================
+# HELPER: MISSING USER IDS
+# =========================
+def find_missing_users(db: Session, user_ids) -> list[str]:
+    if not user_ids:
+        return []
+
+    found = {user_id for (user_id,) in db.query(User.id).filter(User.id.in_(user_ids))}
+    return [user_id for user_id in user_ids if user_id not in found]
+
+
+# =========================
+# HELPER: VISIBLE PROJECTS
+# =========================
+def visible_projects_clause(user):
+    if user.role_name == "Admin":
+        return true()
+
+    member_project_ids = select(ProjectMember.project_id).where(
+        ProjectMember.user_id == user.id
+    )
+    return (Project.created_by_id == user.id) | (Project.id.in_(member_project_ids))
+
+
+def visible_projects_stmt(user):
+    # Creator and members (with their users) are batch-loaded with one
+    # IN query per relationship, so the query count stays constant
+    # regardless of how many projects are returned.
+    return (
+        select(Project)
+        .options(
+            selectinload(Project.created_by),
+            selectinload(Project.members).selectinload(ProjectMember.user),
+        )
+        .where(visible_projects_clause(user))
+    )
+
+
+def format_project(p):
+    creator = p.created_by
+
+    return {
+        "id": p.id,
+        "name": p.name,
+        "description": p.description,
+        "start_date": p.start_date,
+        "end_date": p.end_date,
+        "created_by": (
+            {
+                "id": creator.id,
+                "name": creator.name,
+                "email": creator.email,
+            }
+            if creator
+            else None
+        ),
+        "members": [
+            {
+                "id": m.user.id,
+                "name": m.user.name,
+                "email": m.user.email,
+                "role": m.role,
+            }
+            for m in p.members
+            if m.user
+        ],
+        "created_at": p.created_at,
+        # Maintained counters: no tasks query, however many projects
+        "task_counts": {
+            "total": p.task_count,
+            "by_status": {
+                status: getattr(p, column) for status, column in STATUS_COUNTERS.items()
+            },
+            "overdue": p.overdue_count,
+            "overdue_as_of": p.overdue_as_of,
+            "progress": round(p.done_count * 100 / p.task_count) if p.task_count else 0,
+        },
+    }
+
+
 # =========================
 # CREATE PROJECT
 # =========================
-@router.post("/")
+@router.post("/", response_model=ProjectRead)
 def create_project(
     payload: CreateProjectRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    ctx: AuthContext = Depends(get_auth_context),
 ):
-    can_create_task(current_user)
+    can_create_task(ctx.user)
 
     # =========================
     # DATE VALIDATION (NEW)
@@ -55,207 +175,220 @@ def create_project(
         description=payload.description,
         start_date=payload.start_date,
         end_date=payload.end_date,
-        created_by_id=current_user.id,
+        created_by_id=ctx.user.id,
     )
 
+    # Members: validated with one IN query, inserted in one batch
+    member_ids = [
+        user_id
+        for user_id in dict.fromkeys(payload.member_ids or [])
+        if user_id != ctx.user.id
+    ]
+
+    missing = find_missing_users(db, member_ids)
+    if missing:
+        raise HTTPException(400, f"Users not found: {', '.join(missing)}")
+
     db.add(project)
     db.flush()
 
-    # Owner
-    db.add(
-        ProjectMember(
-            project_id=project.id,
-            user_id=current_user.id,
-            role="Owner",
-        )
+    db.execute(
+        insert(ProjectMember),
+        [{"project_id": project.id, "user_id": ctx.user.id, "role": "Owner"}]
+        + [
+            {"project_id": project.id, "user_id": user_id, "role": "Member"}
+            for user_id in member_ids
+        ],
     )
 
-    # Members
-    for user_id in payload.member_ids or []:
-        if user_id == current_user.id:
-            continue
-
-        exists = (
-            db.query(ProjectMember)
-            .filter(
-                ProjectMember.project_id == project.id,
-                ProjectMember.user_id == user_id,
-            )
-            .first()
-        )
-
-        if not exists:
-            db.add(
-                ProjectMember(
-                    project_id=project.id,
-                    user_id=user_id,
-                    role="Member",
-                )
-            )
+    index_document(
+        db, "project", project.id, project.id, project.name, project.description
+    )
+    record_change(db, "project", UPSERT, project.id, project.id)
+    record_changes(
+        db,
+        "member",
+        UPSERT,
+        [(user_id, project.id) for user_id in [ctx.user.id, *member_ids]],
+    )
 
     db.commit()
-    db.refresh(project)
 
-    return project
+    # Same shape as the list: creator and members batch-loaded
+    project = db.scalars(
+        select(Project)
+        .options(
+            selectinload(Project.created_by),
+            selectinload(Project.members).selectinload(ProjectMember.user),
+        )
+        .where(Project.id == project.id)
+    ).one()
+
+    return format_project(project)
 
 
 # =========================
 # LIST PROJECTS
 # =========================
-@router.get("/")
-def list_projects(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@router.get("/", response_model=list[ProjectRead] | ProjectPage)
+async def list_projects(
+    request: Request,
+    response: Response,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user),
 ):
-    if current_user.role.name == "Admin":
-        projects = db.query(Project).all()
-    else:
-        projects = (
-            db.query(Project)
-            .join(ProjectMember)
-            .filter(
-                (Project.created_by_id == current_user.id)
-                | (ProjectMember.user_id == current_user.id)
-            )
-            .distinct()
-            .all()
-        )
-
-    project_list = []
+    # Any write to a visible project bumps its revision and updated_at;
+    # joining or leaving one changes the count. One aggregate decides 304.
+    result = await db.execute(
+        select(
+            func.count(Project.id),
+            func.max(Project.updated_at),
+            func.sum(Project.revision),
+        ).where(visible_projects_clause(current_user))
+    )
+    etag = compute_etag(
+        "projects",
+        current_user.id,
+        current_user.role_name,
+        request.url.query,
+        *result.one(),
+    )
 
-    for p in projects:
-        creator = db.query(User).filter(User.id == p.created_by_id).first()
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-        members = db.query(ProjectMember).filter(ProjectMember.project_id == p.id).all()
+    set_etag(response, etag)
 
-        formatted_members = []
+    stmt = visible_projects_stmt(current_user)
 
-        for m in members:
-            user = db.query(User).filter(User.id == m.user_id).first()
+    next_cursor = None
+    if is_paginated(limit, cursor):
+        projects, next_cursor = await paginate_async(db, stmt, Project, limit, cursor)
+    else:
+        projects = (await db.execute(stmt)).scalars().all()
 
-            if user:
-                formatted_members.append(
-                    {
-                        "id": user.id,
-                        "name": user.name,
-                        "email": user.email,
-                        "role": m.role,
-                    }
-                )
+    project_list = [format_project(p) for p in projects]
 
-        project_list.append(
-            {
-                "id": p.id,
-                "name": p.name,
-                "description": p.description,
-                "start_date": p.start_date,
-                "end_date": p.end_date,
-                "created_by": (
-                    {
-                        "id": creator.id,
-                        "name": creator.name,
-                        "email": creator.email,
-                    }
-                    if creator
-                    else None
-                ),
-                "members": formatted_members,
-                "created_at": p.created_at,
-            }
-        )
+    if is_paginated(limit, cursor):
+        return {"items": project_list, "next_cursor": next_cursor}
 
     return project_list
 
 
 # =========================
-# PROJECT DETAIL (FIXED)
+# PROJECT STATS (MULTI)
 # =========================
-@router.get("/{project_id}")
-def get_project_detail(
+# Declared before /{project_id} so "stats" isn't taken for a project id
+@router.get("/stats", response_model=list[ProjectStats])
+async def list_project_stats(
+    ids: list[str] | None = Query(None, max_length=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+    ctx: AuthContext = Depends(get_async_auth_context),
+):
+    if ids:
+        for project_id in ids:
+            can_view_project(ctx, project_id)
+        query = select(Project.id).where(Project.id.in_(ids))
+    elif is_admin(ctx.user):
+        query = select(Project.id)
+    else:
+        query = select(Project.id).where(Project.id.in_(ctx.memberships))
+
+    result = await db.execute(query)
+    stats = await get_project_stats(db, result.scalars().all())
+
+    return list(stats.values())
+
+
+# =========================
+# PROJECT STATS
+# =========================
+@router.get("/{project_id}/stats", response_model=ProjectStats)
+async def get_project_stats_detail(
     project_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    ctx: AuthContext = Depends(get_async_auth_context),
 ):
-    project = db.query(Project).filter(Project.id == project_id).first()
+    result = await db.execute(select(Project.id).where(Project.id == project_id))
 
-    if not project:
+    if result.scalar() is None:
         raise HTTPException(404, "Project not found")
 
-    membership = (
-        db.query(ProjectMember)
-        .filter(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == current_user.id,
-        )
-        .first()
-    )
+    can_view_project(ctx, project_id)
 
-    can_view_project(current_user, project, membership)
+    stats = await get_project_stats(db, [project_id])
+    return stats[project_id]
 
-    # MEMBERS ADDED
-    members = (
-        db.query(ProjectMember).filter(ProjectMember.project_id == project_id).all()
-    )
 
-    formatted_members = []
+# =========================
+# PROJECT DETAIL (FIXED)
+# =========================
+@router.get("/{project_id}", response_model=ProjectDetail)
+async def get_project_detail(
+    project_id: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    ctx: AuthContext = Depends(get_async_auth_context),
+):
+    result = await db.execute(
+        select(Project.revision, Project.updated_at).where(Project.id == project_id)
+    )
+    version = result.first()
 
-    for m in members:
-        user = db.query(User).filter(User.id == m.user_id).first()
+    if not version:
+        raise HTTPException(404, "Project not found")
 
-        if user:
-            formatted_members.append(
-                {
-                    "id": user.id,
-                    "name": user.name,
-                    "email": user.email,
-                    "role": m.role,
-                }
-            )
+    can_view_project(ctx, project_id)
 
-    tasks = db.query(Task).filter(Task.project_id == project_id).all()
+    etag = compute_etag("project", project_id, *version)
 
-    formatted_tasks = []
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    for task in tasks:
-        assignees = db.query(TaskAssignee).filter(TaskAssignee.task_id == task.id).all()
+    set_etag(response, etag)
 
-        formatted_tasks.append(
-            {
-                "id": task.id,
-                "title": task.title,
-                "description": task.description,
-                "status": task.status,
-                "due_date": task.due_date,
-                "assignees": [
-                    {
-                        "id": a.user_id,
-                    }
-                    for a in assignees
-                ],
-            }
+    # Constant number of queries: project, creator, members + users and
+    # tasks + assignees + users, each relationship loaded with one IN query.
+    result = await db.execute(
+        select(Project)
+        .options(
+            selectinload(Project.created_by),
+            selectinload(Project.members).selectinload(ProjectMember.user),
+            selectinload(Project.tasks)
+            .selectinload(Task.assignees)
+            .selectinload(TaskAssignee.user),
         )
+        .where(Project.id == project_id)
+    )
+    project = result.scalars().first()
 
-    creator = db.query(User).filter(User.id == project.created_by_id).first()
+    if not project:
+        raise HTTPException(404, "Project not found")
 
-    return {
-        "id": project.id,
-        "name": project.name,
-        "description": project.description,
-        "start_date": project.start_date,
-        "end_date": project.end_date,
-        "created_by": (
-            {
-                "id": creator.id,
-                "name": creator.name,
-                "email": creator.email,
-            }
-            if creator
-            else None
-        ),
-        "members": formatted_members,
-        "tasks": formatted_tasks,
-        "created_at": project.created_at,
-    }
+    formatted_tasks = [
+        {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status,
+            "due_date": task.due_date,
+            "assignees": [
+                {
+                    "id": a.user_id,
+                    "name": a.user.name if a.user else None,
+                    "email": a.user.email if a.user else None,
+                }
+                for a in task.assignees
+            ],
+        }
+        for task in project.tasks
+    ]
+
+    # Project fields and task counters as in the list, plus the tasks
+    return {**format_project(project), "tasks": formatted_tasks}
 
 
 # =========================
@@ -266,24 +399,15 @@ def update_project(
     project_id: str,
     payload: UpdateProjectRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    ctx: AuthContext = Depends(get_auth_context),
 ):
     project = db.query(Project).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(404, "Project not found")
 
-    membership = (
-        db.query(ProjectMember)
-        .filter(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == current_user.id,
-        )
-        .first()
-    )
-
     # IMPORTANT: permission check
-    can_modify_project(current_user, project, membership)
+    can_modify_project(ctx, project)
 
     if payload.name is not None:
         project.name = payload.name
@@ -305,21 +429,54 @@ def update_project(
     if new_end < new_start:
         raise HTTPException(400, "end_date must be >= start_date")
 
-    tasks = db.query(Task).filter(Task.project_id == project_id).all()
+    # MIN/MAX are index seeks on (project_id, due_date); tasks are only
+    # counted when the new range actually strands some
+    earliest, latest = (
+        db.query(func.min(Task.due_date), func.max(Task.due_date))
+        .filter(Task.project_id == project_id)
+        .one()
+    )
 
-    for t in tasks:
-        if t.due_date and (t.due_date < new_start or t.due_date > new_end):
-            raise HTTPException(
-                400,
-                "Cannot shrink project timeline. Tasks exist outside new range",
+    if (earliest and earliest < new_start) or (latest and latest > new_end):
+        outside = (
+            db.query(func.count(Task.id))
+            .filter(
+                Task.project_id == project_id,
+                or_(Task.due_date < new_start, Task.due_date > new_end),
             )
+            .scalar()
+        )
+        raise HTTPException(
+            400,
+            "Cannot shrink project timeline. "
+            f"{outside} task(s) exist outside new range",
+        )
 
     project.start_date = new_start
     project.end_date = new_end
+    project.revision = Project.revision + 1
 
+    if payload.name is not None or payload.description is not None:
+        reindex_document(db, "project", project_id, project.name, project.description)
+
+    db.flush()
+    record_change(db, "project", UPSERT, project_id, project_id)
     db.commit()
     db.refresh(project)
 
+    publish(
+        project_id,
+        "project.updated",
+        {
+            "fields": {
+                "name": project.name,
+                "description": project.description,
+                "start_date": project.start_date,
+                "end_date": project.end_date,
+            }
+        },
+    )
+
     return {
         "id": project.id,
         "name": project.name,
@@ -331,31 +488,108 @@ def update_project(
 # =========================
 # DELETE PROJECT
 # =========================
+def project_member_ids(db, project_id: str):
+    return db.scalars(
+        select(ProjectMember.user_id).where(ProjectMember.project_id == project_id)
+    ).all()
+
+
+def record_project_deletion(db, project_id: str, member_ids):
+    # The project tombstone only reaches current members, whom the cascade
+    # removes; a member's own tombstone outlives the membership
+    record_changes(
+        db, "member", DELETE, [(user_id, project_id) for user_id in member_ids]
+    )
+    record_change(db, "project", DELETE, project_id, project_id)
+
+
+def purge_project(job, session_factory, project_id: str):
+    """
+    Background delete: tasks go in batches of PROJECT_DELETE_BATCH_SIZE,
+    one short transaction each, then the project row itself. Readers see
+    the task list shrink; the project tombstone is recorded at the end.
+    """
+    with session_factory() as db:
+        while True:
+            batch = db.execute(
+                select(Task.id, Task.status, Task.due_date)
+                .where(Task.project_id == project_id)
+                .limit(PROJECT_DELETE_BATCH_SIZE)
+            ).all()
+
+            if not batch:
+                break
+
+            task_ids = [task_id for task_id, _, _ in batch]
+
+            # Assignees follow through ON DELETE CASCADE
+            db.execute(delete(Task).where(Task.id.in_(task_ids)))
+            remove_documents(db, "task", task_ids)
+            count_tasks(
+                db,
+                project_id,
+                removed=[(status, due_date) for _, status, due_date in batch],
+            )
+            db.commit()
+
+            job.result["deleted_tasks"] += len(task_ids)
+
+        member_ids = project_member_ids(db, project_id)
+        db.execute(delete(Project).where(Project.id == project_id))
+        remove_project_documents(db, project_id)
+        record_project_deletion(db, project_id, member_ids)
+        db.commit()
+
+    publish(project_id, "project.deleted")
+
+
 @router.delete("/{project_id}")
 def delete_project(
     project_id: str,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    ctx: AuthContext = Depends(get_auth_context),
 ):
+    """
+    Memberships, tasks and their assignees go with the project through
+    ON DELETE CASCADE: a single DELETE, however large the project.
+
+    With `background=true` the response is 202 with a job id to poll at
+    /api/jobs/{id}, and tasks are removed in batches after the response,
+    so no single transaction holds locks on the whole project.
+    """
     project = db.query(Project).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(404, "Project not found")
 
-    membership = (
-        db.query(ProjectMember)
-        .filter(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == current_user.id,
+    can_modify_project(ctx, project)
+
+    if background:
+        job = jobs.create("project.delete", ctx.user.id)
+        job.result = {"project_id": project_id, "deleted_tasks": 0}
+
+        # The request's session is closed by the time the job runs
+        session_factory = sessionmaker(bind=db.get_bind(), autoflush=False)
+        background_tasks.add_task(
+            jobs.run, job, purge_project, session_factory, project_id
         )
-        .first()
-    )
 
-    can_modify_project(current_user, project, membership)
+        response.status_code = 202
+        return {"job_id": job.id, "status": job.status}
 
+    member_ids = project_member_ids(db, project_id)
     db.delete(project)
+    remove_project_documents(db, project_id)
+    # Change-log ids are taken after the cascade, just before commit
+    db.flush()
+    record_project_deletion(db, project_id, member_ids)
     db.commit()
 
+    publish(project_id, "project.deleted")
+
     return {"message": "Project deleted successfully"}
 
 
@@ -367,7 +601,7 @@ def add_member(
     project_id: str,
     payload: dict,  # simple for now: { "user_id": "..." }
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    ctx: AuthContext = Depends(get_auth_context),
 ):
     user_id = payload.get("user_id")
 
@@ -379,17 +613,8 @@ def add_member(
     if not project:
         raise HTTPException(404, "Project not found")
 
-    membership = (
-        db.query(ProjectMember)
-        .filter(
-            ProjectMember.project_id == project_id,
-            ProjectMember.user_id == current_user.id,
-        )
-        .first()
-    )
-
     # 🔥 permission check
-    can_modify_project(current_user, project, membership)
+    can_modify_project(ctx, project)
 
     # ---------------------
     # VALIDATIONS
@@ -423,12 +648,134 @@ def add_member(
             role="Member",
         )
     )
+    db.flush()
+    touch_projects(db, [project_id])
+    record_change(db, "member", UPSERT, user_id, project_id)
 
     db.commit()
 
+    publish(
+        project_id,
+        "member.added",
+        {"members": [{"id": user.id, "name": user.name, "email": user.email}]},
+    )
+
     return {"message": "Member added successfully"}
 
 
+# =========================
+# BULK ADD / REMOVE MEMBERS
+# =========================
+@router.post("/{project_id}/members/bulk")
+def update_members_bulk(
+    project_id: str,
+    payload: BulkMembersRequest,
+    db: Session = Depends(get_db),
+    ctx: AuthContext = Depends(get_auth_context),
+):
+    project = db.query(Project).filter(Project.id == project_id).first()
+
+    if not project:
+        raise HTTPException(404, "Project not found")
+
+    can_modify_project(ctx, project)
+
+    to_add = list(dict.fromkeys(payload.add))
+    to_remove = list(dict.fromkeys(payload.remove))
+
+    if set(to_add) & set(to_remove):
+        raise HTTPException(400, "A user cannot be both added and removed")
+
+    if project.created_by_id in to_remove:
+        raise HTTPException(400, "Cannot remove owner")
+
+    # ---------------------
+    # SET-BASED VALIDATIONS
+    # ---------------------
+    missing = find_missing_users(db, to_add)
+    if missing:
+        raise HTTPException(400, f"Users not found: {', '.join(missing)}")
+
+    touched = to_add + to_remove
+    current = {
+        user_id
+        for (user_id,) in db.query(ProjectMember.user_id).filter(
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id.in_(touched),
+        )
+    }
+
+    added = [user_id for user_id in to_add if user_id not in current]
+    removed = [user_id for user_id in to_remove if user_id in current]
+
+    if removed:
+        busy = sorted(
+            user_id
+            for (user_id,) in db.query(TaskAssignee.user_id)
+            .join(Task)
+            .filter(
+                Task.project_id == project_id,
+                TaskAssignee.user_id.in_(removed),
+                Task.status != TaskStatus.DONE.value,
+            )
+            .distinct()
+        )
+
+        if busy:
+            raise HTTPException(400, f"Users have active tasks: {', '.join(busy)}")
+
+    # ---------------------
+    # APPLY (one transaction)
+    # ---------------------
+    if removed:
+        db.execute(
+            delete(ProjectMember).where(
+                ProjectMember.project_id == project_id,
+                ProjectMember.user_id.in_(removed),
+            )
+        )
+
+    if added:
+        db.execute(
+            insert(ProjectMember),
+            [
+                {"project_id": project_id, "user_id": user_id, "role": "Member"}
+                for user_id in added
+            ],
+        )
+
+    if added or removed:
+        touch_projects(db, [project_id])
+
+    record_changes(db, "member", UPSERT, [(user_id, project_id) for user_id in added])
+    record_changes(db, "member", DELETE, [(user_id, project_id) for user_id in removed])
+
+    db.commit()
+
+    if added:
+        publish(
+            project_id,
+            "member.added",
+            {
+                "members": [
+                    {"id": user_id, "name": name, "email": email}
+                    for user_id, name, email in db.query(
+                        User.id, User.name, User.email
+                    ).filter(User.id.in_(added))
+                ]
+            },
+        )
+
+    if removed:
+        publish(project_id, "member.removed", {"user_ids": removed})
+
+    return {
+        "added": added,
+        "removed": removed,
+        "skipped": [user_id for user_id in touched if user_id not in added + removed],
+    }
+
+
 # =========================
 # REMOVE MEMBER (FIXED STATUS)
 # =========================
@@ -437,29 +784,31 @@ def remove_member(
     project_id: str,
     user_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    ctx: AuthContext = Depends(get_auth_context),
 ):
     project = db.query(Project).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(404, "Project not found")
 
+    can_modify_project(ctx, project)
+
     if user_id == project.created_by_id:
         raise HTTPException(400, "Cannot remove owner")
 
     active_tasks = (
-        db.query(Task)
-        .join(TaskAssignee)
+        db.query(func.count(TaskAssignee.task_id))
+        .join(Task)
         .filter(
             Task.project_id == project_id,
             TaskAssignee.user_id == user_id,
             Task.status != TaskStatus.DONE.value,
         )
-        .all()
+        .scalar()
     )
 
     if active_tasks:
-        raise HTTPException(400, "User has active tasks")
+        raise HTTPException(400, f"User has {active_tasks} active task(s)")
 
     member = (
         db.query(ProjectMember)
@@ -469,7 +818,15 @@ def remove_member(
         .first()
     )
 
+    if not member:
+        raise HTTPException(404, "Member not found")
+
     db.delete(member)
+    db.flush()
+    touch_projects(db, [project_id])
+    record_change(db, "member", DELETE, user_id, project_id)
     db.commit()
 
+    publish(project_id, "member.removed", {"user_ids": [user_id]})
+
     return {"message": "Member removed"}
@@ -0,0 +1,128 @@
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db
+from app.core.security import get_async_auth_context
+from app.models.search_document import (
+    SEARCH_FTS_TABLE,
+    SEARCH_VECTOR,
+    SearchDocument,
+)
+from app.schemas.search import SearchPage
+from app.services.auth_service import AuthContext, is_admin
+
+router = APIRouter(prefix="/api/search", tags=["Search"])
+
+DEFAULT_SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_PAGE_SIZE = 100
+MAX_SEARCH_TERMS = 8
+
+# bm25 column weights (title, body): title hits rank first
+TITLE_WEIGHT, BODY_WEIGHT = 10.0, 1.0
+
+
+# ==========================================================
+# HELPERS: QUERY BUILDING PER DIALECT
+# ==========================================================
+def search_terms(q: str) -> list[str]:
+    # Words only: FTS5 and tsquery syntax in user input is never interpreted
+    return re.findall(r"[^\W_]+", q.lower())[:MAX_SEARCH_TERMS]
+
+
+def sqlite_search(terms):
+    fts = table(SEARCH_FTS_TABLE, column("rowid"))
+    fts_ref = literal_column(SEARCH_FTS_TABLE)
+
+    # Every term, each as a prefix: "desi"* "rev"*
+    match = " ".join(f'"{term}"*' for term in terms)
+    rank = func.bm25(fts_ref, TITLE_WEIGHT, BODY_WEIGHT)
+
+    return (
+        select(SearchDocument)
+        .join_from(fts, SearchDocument, SearchDocument.id == fts.c.rowid)
+        .where(fts_ref.op("MATCH")(match))
+        .order_by(rank, SearchDocument.id)
+    )
+
+
+def postgres_search(terms):
+    query = func.to_tsquery(
+        literal_column("'english'::regconfig"),
+        " & ".join(f"{term}:*" for term in terms),
+    )
+
+    return (
+        select(SearchDocument)
+        .where(SEARCH_VECTOR.op("@@")(query))
+        .order_by(func.ts_rank(SEARCH_VECTOR, query).desc(), SearchDocument.id)
+    )
+
+
+SEARCH_BUILDERS = {
+    "sqlite": sqlite_search,
+    "postgresql": postgres_search,
+}
+
+
+def parse_offset(cursor: str | None) -> int:
+    if cursor is None:
+        return 0
+
+    if not cursor.isdigit():
+        raise HTTPException(400, "Invalid cursor")
+
+    return int(cursor)
+
+
+# ==========================================================
+# SEARCH TASKS AND PROJECTS
+# ==========================================================
+@router.get("", response_model=SearchPage)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_SEARCH_PAGE_SIZE, ge=1, le=MAX_SEARCH_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    ctx: AuthContext = Depends(get_async_auth_context),
+):
+    """
+    Ranked full-text search over task titles/descriptions and project
+    names/descriptions, limited to projects the caller can see. Every
+    word must match, each as a prefix. Served from the text index
+    (FTS5 on SQLite, GIN on PostgreSQL), never by scanning tasks.
+    """
+    offset = parse_offset(cursor)
+    terms = search_terms(q)
+
+    if not terms:
+        return {"items": [], "next_cursor": None}
+
+    dialect = db.get_bind().dialect.name
+    if dialect not in SEARCH_BUILDERS:
+        raise HTTPException(501, f"Search is not supported on {dialect}")
+
+    stmt = SEARCH_BUILDERS[dialect](terms)
+
+    if not is_admin(ctx.user):
+        stmt = stmt.where(SearchDocument.project_id.in_(list(ctx.memberships)))
+
+    result = await db.execute(stmt.offset(offset).limit(limit + 1))
+    documents = result.scalars().all()
+
+    next_cursor = str(offset + limit) if len(documents) > limit else None
+
+    return {
+        "items": [
+            {
+                "entity": d.entity,
+                "id": d.entity_id,
+                "project_id": d.project_id,
+                "title": d.title,
+            }
+            for d in documents[:limit]
+        ],
+        "next_cursor": next_cursor,
+    }
@@ -1,146 +1,374 @@
-from fastapi import APIRouter, Depends, HTTPException
+import uuid
+from collections import defaultdict
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import and_, case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Literal
 
 from app.models.project import Project
 from app.models.task import Task, TaskAssignee
 from app.models.project_member import ProjectMember
-from app.models.user import User
-from app.core.security import get_current_user
+from app.core.security import Principal, get_auth_context, get_current_user
 from app.core.enums import TaskStatus
-from app.api.deps import get_db
-
+from app.schemas.task import (
+    BulkTaskCreateRequest,
+    BulkTaskCreateResponse,
+    MyTaskPage,
+    MyTaskRead,
+    TaskCreate,
+    TaskRead,
+    TaskUpdate,
+    TaskUpdateResult,
+)
+from app.api.deps import get_async_db, get_db
+from app.api.etag import compute_etag, etag_matches, not_modified, set_etag
+from app.api.pagination import MAX_PAGE_SIZE, is_paginated, paginate_async
+
+from app.services.change_log import DELETE, UPSERT, record_change, record_changes
+from app.services.search_index import (
+    index_document,
+    index_documents,
+    reindex_document,
+    remove_document,
+)
+from app.services.events import publish
+from app.services.task_counters import count_tasks
 from app.services.auth_service import (
+    AuthContext,
     can_create_task,
+    can_create_task_in_project,
     can_modify_task,
+    is_admin,
 )
 
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
 
 # ==========================================================
-# HELPER: PARSE DATE SAFELY
+# HELPER: NORMALIZE TIMEZONE
 # ==========================================================
-def parse_due_date(raw_due_date: str | None):
-    if not raw_due_date:
-        return None
-    try:
-        parsed = datetime.fromisoformat(raw_due_date)
-        return parsed  # change to parsed.date() if DB uses Date
-    except Exception:
-        raise HTTPException(400, "Invalid due_date format")
+def to_naive_utc(value: datetime | None):
+    # Project dates are stored naive (UTC); aware input would not compare
+    if value and value.tzinfo:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
 
 
 # ==========================================================
-# CREATE TASK
+# HELPER: DUE DATE WITHIN PROJECT TIMELINE
 # ==========================================================
-@router.post("/")
-def create_task(
-    payload: dict,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    project_id = payload.get("project_id")
+def within_timeline(due_date, project) -> bool:
+    if due_date and project.start_date and project.end_date:
+        return project.start_date <= due_date <= project.end_date
+    return True
 
-    if not project_id:
-        raise HTTPException(400, "project_id is required")
 
-    can_create_task(current_user)
+# ==========================================================
+# HELPER: TASK RESPONSE WITH CHANGE REPORT
+# ==========================================================
+def task_response(task, changed_fields, added=(), removed=()):
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status,
+        "due_date": task.due_date,
+        "project_id": task.project_id,
+        "created_by_id": task.created_by_id,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+        "changes": {
+            "fields": changed_fields,
+            "assignees_added": list(added),
+            "assignees_removed": list(removed),
+        },
+    }
 
-    # Ensure user is project member (unless admin)
-    if current_user.role.name != "Admin":
-        membership = (
-            db.query(ProjectMember)
-            .filter(
-                ProjectMember.project_id == project_id,
-                ProjectMember.user_id == current_user.id,
-            )
-            .first()
-        )
 
-        if not membership:
-            raise HTTPException(403, "Not a project member")
+# ==========================================================
+# HELPER: PUSH EVENTS (sent after commit)
+# ==========================================================
+TASK_EVENT_FIELDS = ("id", "title", "description", "status", "due_date")
 
-    # Validate status
-    status = payload.get("status", TaskStatus.NEW.value)
 
-    if status not in [s.value for s in TaskStatus]:
-        raise HTTPException(400, "Invalid status")
+def task_event_payload(values: dict, assignee_ids):
+    return {
+        **{field: values[field] for field in TASK_EVENT_FIELDS},
+        "assignees": list(assignee_ids),
+    }
 
-    assignee_ids = payload.get("assignees", [])
+
+def publish_task_update(task, changed_fields, added=(), removed=()):
+    publish(
+        task.project_id,
+        "task.updated",
+        {
+            "id": task.id,
+            "fields": {field: getattr(task, field) for field in changed_fields},
+            "assignees_added": list(added),
+            "assignees_removed": list(removed),
+        },
+    )
+
+
+# ==========================================================
+# CREATE TASK
+# ==========================================================
+@router.post("/", response_model=TaskRead)
+def create_task(
+    payload: TaskCreate,
+    db: Session = Depends(get_db),
+    ctx: AuthContext = Depends(get_auth_context),
+):
+    project_id = payload.project_id
+
+    # Role + project membership (unless admin), answered from the context
+    can_create_task_in_project(ctx, project_id)
+
+    assignee_ids = list(dict.fromkeys(payload.assignees))
 
     # Validate assignees
     if assignee_ids:
-        members = (
-            db.query(ProjectMember)
-            .filter(
+        member_ids = {
+            user_id
+            for (user_id,) in db.query(ProjectMember.user_id).filter(
                 ProjectMember.project_id == project_id,
                 ProjectMember.user_id.in_(assignee_ids),
             )
-            .all()
-        )
-
-        member_ids = {m.user_id for m in members}
+        }
 
-        for user_id in assignee_ids:
-            if user_id not in member_ids:
-                raise HTTPException(400, "Assignee must be a project member")
+        if any(user_id not in member_ids for user_id in assignee_ids):
+            raise HTTPException(400, "Assignee must be a project member")
 
     # Fetch project
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
         raise HTTPException(404, "Project not found")
 
-    # Parse + validate due_date
-    due_date = parse_due_date(payload.get("due_date"))
+    due_date = to_naive_utc(payload.due_date)
 
-    if due_date and project.start_date and project.end_date:
-        if due_date < project.start_date or due_date > project.end_date:
-            raise HTTPException(400, "Due date must be within project timeline")
+    if not within_timeline(due_date, project):
+        raise HTTPException(400, "Due date must be within project timeline")
 
     # Create task
     task = Task(
-        title=payload["title"],
-        description=payload.get("description"),
+        title=payload.title,
+        description=payload.description,
         due_date=due_date,
-        status=status,
+        status=payload.status.value,
         project_id=project_id,
-        created_by_id=current_user.id,
+        created_by_id=ctx.user.id,
     )
 
     db.add(task)
     db.flush()  # better than early commit
 
     # Add assignees
-    for user_id in assignee_ids:
-        db.add(TaskAssignee(task_id=task.id, user_id=user_id))
+    if assignee_ids:
+        db.execute(
+            insert(TaskAssignee),
+            [{"task_id": task.id, "user_id": user_id} for user_id in assignee_ids],
+        )
+
+    count_tasks(db, project_id, added=[(task.status, task.due_date)])
+    index_document(db, "task", task.id, project_id, task.title, task.description)
+    record_change(db, "task", UPSERT, task.id, project_id)
 
     db.commit()
     db.refresh(task)
 
+    publish(
+        project_id,
+        "task.created",
+        {
+            "tasks": [
+                task_event_payload(
+                    {field: getattr(task, field) for field in TASK_EVENT_FIELDS},
+                    assignee_ids,
+                )
+            ]
+        },
+    )
+
+    return task
+
+
+# ==========================================================
+# BULK CREATE TASKS
+# ==========================================================
+@router.post(
+    "/bulk", response_model=BulkTaskCreateResponse, response_model_exclude_none=True
+)
+def create_tasks_bulk(
+    payload: BulkTaskCreateRequest,
+    db: Session = Depends(get_db),
+    ctx: AuthContext = Depends(get_auth_context),
+):
+    can_create_task(ctx.user)
+
+    items = payload.tasks
+    project_ids = {item.project_id for item in items}
+    assignee_ids = {user_id for item in items for user_id in item.assignees}
+
+    # =========================
+    # SET-BASED LOOKUPS (one query each, regardless of item count)
+    # =========================
+    projects = {
+        row.id: row
+        for row in db.query(Project.id, Project.start_date, Project.end_date)
+        .filter(Project.id.in_(project_ids))
+        .all()
+    }
+
+    project_members = set()
+    if assignee_ids:
+        project_members = set(
+            db.query(ProjectMember.project_id, ProjectMember.user_id)
+            .filter(
+                ProjectMember.project_id.in_(project_ids),
+                ProjectMember.user_id.in_(assignee_ids),
+            )
+            .all()
+        )
+
+    # =========================
+    # VALIDATE PER ITEM
+    # =========================
+    results = []
+    task_rows = []
+    assignee_rows = []
+    now = datetime.utcnow()
+
+    for index, item in enumerate(items):
+        project = projects.get(item.project_id)
+        error = None
+
+        if not project:
+            error = "Project not found"
+        elif not is_admin(ctx.user) and not ctx.is_member(item.project_id):
+            error = "Not a project member"
+        elif any(
+            (item.project_id, user_id) not in project_members
+            for user_id in item.assignees
+        ):
+            error = "Assignee must be a project member"
+
+        due_date = to_naive_utc(item.due_date)
+
+        if not error and not within_timeline(due_date, project):
+            error = "Due date must be within project timeline"
+
+        if error:
+            results.append({"index": index, "ok": False, "error": error})
+            continue
+
+        task_id = str(uuid.uuid4())
+        task_rows.append(
+            {
+                "id": task_id,
+                "title": item.title,
+                "description": item.description,
+                "due_date": due_date,
+                "status": item.status.value,
+                "project_id": item.project_id,
+                "created_by_id": ctx.user.id,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+        assignee_rows.extend(
+            {"task_id": task_id, "user_id": user_id}
+            for user_id in dict.fromkeys(item.assignees)
+        )
+        results.append({"index": index, "ok": True, "id": task_id})
+
+    # =========================
+    # BATCHED INSERTS, ONE TRANSACTION
+    # =========================
+    if task_rows:
+        db.execute(insert(Task), task_rows)
+
+        if assignee_rows:
+            db.execute(insert(TaskAssignee), assignee_rows)
+
+        added_by_project = defaultdict(list)
+        for row in task_rows:
+            added_by_project[row["project_id"]].append((row["status"], row["due_date"]))
+        for project_id, added_tasks in added_by_project.items():
+            count_tasks(db, project_id, added=added_tasks)
+
+        record_changes(
+            db, "task", UPSERT, [(row["id"], row["project_id"]) for row in task_rows]
+        )
+        index_documents(
+            db,
+            "task",
+            [
+                (row["id"], row["project_id"], row["title"], row["description"])
+                for row in task_rows
+            ],
+        )
+
+        db.commit()
+
+        # One event per project, carrying all of its new tasks
+        assignees_by_task = defaultdict(list)
+        for row in assignee_rows:
+            assignees_by_task[row["task_id"]].append(row["user_id"])
+
+        tasks_by_project = defaultdict(list)
+        for row in task_rows:
+            tasks_by_project[row["project_id"]].append(
+                task_event_payload(row, assignees_by_task[row["id"]])
+            )
+
+        for project_id, tasks in tasks_by_project.items():
+            publish(project_id, "task.created", {"tasks": tasks})
+
+    return {
+        "created": len(task_rows),
+        "failed": len(items) - len(task_rows),
+        "results": results,
+    }
+
 
 # ==========================================================
 # UPDATE TASK
 # ==========================================================
-@router.put("/{task_id}")
+@router.put("/{task_id}", response_model=TaskUpdateResult)
 def update_task(
     task_id: str,
-    payload: dict,
+    payload: TaskUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    ctx: AuthContext = Depends(get_auth_context),
 ):
     task = db.query(Task).filter(Task.id == task_id).first()
 
     if not task:
         raise HTTPException(404, "Task not found")
 
+    # Counter deltas are taken against the values before the edit
+    before = (task.status, task.due_date)
+
+    fields = payload.model_fields_set
+    changed_fields = []
+
+    def apply(field, value):
+        # Only real changes are written and reported
+        if getattr(task, field) != value:
+            setattr(task, field, value)
+            changed_fields.append(field)
+
     # READ-ONLY USER
-    if current_user.role.name == "Read-Only":
+    if ctx.user.role_name == "Read-Only":
         assignment = (
             db.query(TaskAssignee)
             .filter(
                 TaskAssignee.task_id == task_id,
-                TaskAssignee.user_id == current_user.id,
+                TaskAssignee.user_id == ctx.user.id,
             )
             .first()
         )
@@ -148,106 +376,224 @@ def update_task(
         if not assignment:
             raise HTTPException(403, "You can only update your assigned tasks")
 
-        if payload.get("status") != TaskStatus.DONE.value:
+        if payload.status != TaskStatus.DONE:
             raise HTTPException(403, "Read-only user can only mark task as DONE")
 
-        task.status = TaskStatus.DONE.value
-        db.commit()
-        db.refresh(task)
-        return task
+        apply("status", TaskStatus.DONE.value)
+
+        if changed_fields:
+            count_tasks(
+                db,
+                task.project_id,
+                removed=[before],
+                added=[(task.status, task.due_date)],
+            )
+            db.flush()
+            record_change(db, "task", UPSERT, task_id, task.project_id)
+            db.commit()
+            db.refresh(task)
+            publish_task_update(task, changed_fields)
+
+        return task_response(task, changed_fields)
 
     # ADMIN / CREATOR
-    can_modify_task(current_user, task)
+    can_modify_task(ctx.user, task)
 
-    if "title" in payload:
-        task.title = payload["title"]
+    if "title" in fields:
+        apply("title", payload.title)
 
-    if "description" in payload:
-        task.description = payload["description"]
+    if "description" in fields:
+        apply("description", payload.description)
 
-    if "status" in payload:
-        if payload["status"] not in [s.value for s in TaskStatus]:
-            raise HTTPException(400, "Invalid status")
-        task.status = payload["status"]
+    if "status" in fields:
+        apply("status", payload.status.value)
 
     # =========================
-    # DUE DATE UPDATE (FIXED)
+    # DUE DATE UPDATE
     # =========================
-    if "due_date" in payload:
-        project = db.query(Project).filter(Project.id == task.project_id).first()
+    if "due_date" in fields:
+        due_date = to_naive_utc(payload.due_date)
+
+        if due_date:
+            project = (
+                db.query(Project.start_date, Project.end_date)
+                .filter(Project.id == task.project_id)
+                .first()
+            )
 
-        if not project:
-            raise HTTPException(404, "Project not found")
-
-        raw_due_date = payload.get("due_date")
-
-        # Parse
-        if raw_due_date:
-            try:
-                due_date = datetime.fromisoformat(raw_due_date)
-            except Exception:
-                raise HTTPException(400, "Invalid due_date format")
-        else:
-            due_date = None
-
-        # Validate ONLY if all values exist
-        if due_date and project.start_date and project.end_date:
-            if due_date < project.start_date or due_date > project.end_date:
-                raise HTTPException(
-                    400,
-                    "Due date must be within project timeline",
-                )
+            if not project:
+                raise HTTPException(404, "Project not found")
 
-        task.due_date = due_date
+            if not within_timeline(due_date, project):
+                raise HTTPException(400, "Due date must be within project timeline")
+
+        apply("due_date", due_date)
 
     # =========================
-    # UPDATE ASSIGNEES
+    # UPDATE ASSIGNEES (DELTA ONLY)
     # =========================
-    if payload.get("assignees") is not None:
-        assignee_ids = payload["assignees"]
+    added, removed = [], []
 
-        members = (
-            db.query(ProjectMember)
-            .filter(
-                ProjectMember.project_id == task.project_id,
-                ProjectMember.user_id.in_(assignee_ids),
-            )
+    if payload.assignees is not None:
+        wanted = list(dict.fromkeys(payload.assignees))
+
+        current = {
+            user_id
+            for (user_id,) in db.query(TaskAssignee.user_id)
+            .filter(TaskAssignee.task_id == task_id)
             .all()
-        )
+        }
 
-        member_ids = {m.user_id for m in members}
+        added = [user_id for user_id in wanted if user_id not in current]
+        removed = sorted(current - set(wanted))
+
+        # Only newly added users need the membership check
+        if added:
+            member_ids = {
+                user_id
+                for (user_id,) in db.query(ProjectMember.user_id)
+                .filter(
+                    ProjectMember.project_id == task.project_id,
+                    ProjectMember.user_id.in_(added),
+                )
+                .all()
+            }
 
-        for user_id in assignee_ids:
-            if user_id not in member_ids:
+            if any(user_id not in member_ids for user_id in added):
                 raise HTTPException(400, "Assignee must be project member")
 
-        db.query(TaskAssignee).filter(TaskAssignee.task_id == task_id).delete()
+        if removed:
+            db.execute(
+                delete(TaskAssignee).where(
+                    TaskAssignee.task_id == task_id,
+                    TaskAssignee.user_id.in_(removed),
+                )
+            )
 
-        for user_id in assignee_ids:
-            db.add(TaskAssignee(task_id=task_id, user_id=user_id))
+        if added:
+            db.execute(
+                insert(TaskAssignee),
+                [{"task_id": task_id, "user_id": user_id} for user_id in added],
+            )
 
-    db.commit()
-    db.refresh(task)
+    if changed_fields or added or removed:
+        # Column changes get updated_at from onupdate; assignee-only
+        # changes don't touch the row, so stamp it here
+        if not changed_fields:
+            task.updated_at = datetime.utcnow()
+        count_tasks(
+            db, task.project_id, removed=[before], added=[(task.status, task.due_date)]
+        )
+        if {"title", "description"} & set(changed_fields):
+            reindex_document(db, "task", task_id, task.title, task.description)
+        db.flush()
+        record_change(db, "task", UPSERT, task_id, task.project_id)
+        db.commit()
+        db.refresh(task)
+        publish_task_update(task, changed_fields, added, removed)
 
-    return task
+    return task_response(task, changed_fields, added, removed)
 
 
 # ==========================================================
 # GET MY TASKS
 # ==========================================================
-@router.get("/my")
-def get_my_tasks(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+MyTasksSort = Literal[
+    "created_at", "-created_at", "due_date", "-due_date", "title", "status"
+]
+
+MY_TASKS_SORTS = {
+    "created_at": (Task.created_at.asc(), Task.id.asc()),
+    "-created_at": (Task.created_at.desc(), Task.id.desc()),
+    "due_date": (Task.due_date.asc().nulls_last(), Task.id.asc()),
+    "-due_date": (Task.due_date.desc().nulls_last(), Task.id.asc()),
+    "title": (Task.title.asc(), Task.id.asc()),
+    "status": (Task.status.asc(), Task.id.asc()),
+}
+
+
+@router.get("/my", response_model=list[MyTaskRead] | MyTaskPage)
+async def get_my_tasks(
+    request: Request,
+    response: Response,
+    status: list[TaskStatus] | None = Query(None),
+    project_id: str | None = None,
+    due_from: datetime | None = None,
+    due_to: datetime | None = None,
+    overdue: bool = False,
+    sort: MyTasksSort | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user),
 ):
-    tasks = (
-        db.query(Task)
+    # Task writes stamp updated_at, including assignee changes, so count +
+    # max(updated_at) over the caller's assignments moves on every change.
+    # The overdue count covers ?overdue=true results shifting with time.
+    now = datetime.utcnow()
+    result = await db.execute(
+        select(
+            func.count(Task.id),
+            func.max(Task.updated_at),
+            func.sum(
+                case(
+                    (
+                        and_(Task.due_date < now, Task.status != TaskStatus.DONE.value),
+                        1,
+                    ),
+                    else_=0,
+                )
+            ),
+        )
         .join(TaskAssignee)
-        .filter(TaskAssignee.user_id == current_user.id)
-        .all()
+        .where(TaskAssignee.user_id == current_user.id)
     )
+    etag = compute_etag("my-tasks", current_user.id, request.url.query, *result.one())
 
-    return [
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    set_etag(response, etag)
+
+    query = (
+        select(Task).join(TaskAssignee).where(TaskAssignee.user_id == current_user.id)
+    )
+
+    # =========================
+    # FILTERS (plain column predicates, evaluated in SQL)
+    # =========================
+    if status:
+        query = query.filter(Task.status.in_([s.value for s in status]))
+
+    if project_id:
+        query = query.filter(Task.project_id == project_id)
+
+    if due_from:
+        query = query.filter(Task.due_date >= to_naive_utc(due_from))
+
+    if due_to:
+        query = query.filter(Task.due_date <= to_naive_utc(due_to))
+
+    if overdue:
+        query = query.filter(
+            Task.due_date < now,
+            Task.status != TaskStatus.DONE.value,
+        )
+
+    # =========================
+    # SORT + PAGINATION
+    # =========================
+    next_cursor = None
+    if is_paginated(limit, cursor):
+        if sort not in (None, "created_at"):
+            raise HTTPException(400, "Cursor pagination requires sort=created_at")
+        tasks, next_cursor = await paginate_async(db, query, Task, limit, cursor)
+    else:
+        if sort:
+            query = query.order_by(*MY_TASKS_SORTS[sort])
+        tasks = (await db.execute(query)).scalars().all()
+
+    items = [
         {
             "id": t.id,
             "title": t.title,
@@ -259,6 +605,11 @@ def get_my_tasks(
         for t in tasks
     ]
 
+    if is_paginated(limit, cursor):
+        return {"items": items, "next_cursor": next_cursor}
+
+    return items
+
 
 # ==========================================================
 # DELETE TASK
@@ -267,17 +618,23 @@ def get_my_tasks(
 def delete_task(
     task_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    ctx: AuthContext = Depends(get_auth_context),
 ):
     task = db.query(Task).filter(Task.id == task_id).first()
 
     if not task:
         raise HTTPException(404, "Task not found")
 
-    can_modify_task(current_user, task)
+    can_modify_task(ctx.user, task)
 
     db.query(TaskAssignee).filter(TaskAssignee.task_id == task_id).delete()
     db.delete(task)
+    db.flush()
+    count_tasks(db, task.project_id, removed=[(task.status, task.due_date)])
+    remove_document(db, "task", task_id)
+    record_change(db, "task", DELETE, task_id, task.project_id)
     db.commit()
 
+    publish(task.project_id, "task.deleted", {"id": task_id})
+
     return {"message": "Task deleted successfully"}
@@ -1,18 +1,92 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.models.user import User
+from app.models.project import Project
 from app.models.role import Role
-from app.schemas.user import UserCreate, UserRead, UserBase, UserLookup
-from app.core.security import require_role, get_current_user
-from app.api.deps import get_db
+from app.models.project_member import ProjectMember
+from app.models.task import Task, TaskAssignee
+from app.schemas.user import (
+    UserCreate,
+    UserRead,
+    UserBase,
+    UserLookup,
+    UserLookupPage,
+    UserPage,
+)
+from app.core.security import (
+    Principal,
+    get_current_user,
+    invalidate_principal,
+    require_role,
+)
+from app.api.deps import get_async_db, get_db
+from app.api.pagination import (
+    MAX_PAGE_SIZE,
+    is_paginated,
+    paginate,
+    paginate_async,
+)
+from app.services.auth_service import is_admin
+from app.services.change_log import DELETE, UPSERT, record_change
+from app.services.revision_service import touch_projects
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
 
+DEFAULT_LOOKUP_LIMIT = 20
+
+# delete_user dependency counts, in query order
+DEPENDENCY_LABELS = (
+    "created projects",
+    "project memberships",
+    "created tasks",
+    "task assignments",
+)
+
+
+# ==========================================================
+# HELPER: PICKER SEARCH
+# ==========================================================
+# Shorter terms contain no complete trigram, so the substring query could
+# not use the trigram indexes; they get prefix matches only.
+SUBSTRING_MIN_LENGTH = 3
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_users(db, stmt, term: str, limit: int):
+    pattern = escape_like(term)
+    name, email = func.lower(User.name), func.lower(User.email)
+
+    def matching(like):
+        return stmt.where(
+            or_(name.like(like, escape="\\"), email.like(like, escape="\\"))
+        ).order_by(name, User.id)
+
+    # Prefix matches can use the lower(name)/lower(email) indexes
+    result = await db.execute(matching(f"{pattern}%").limit(limit))
+    users = list(result.scalars())
+
+    # Substring matches use the trigram indexes on PostgreSQL
+    if len(users) < limit and len(term) >= SUBSTRING_MIN_LENGTH:
+        found = [u.id for u in users]
+        result = await db.execute(
+            matching(f"%{pattern}%")
+            .where(User.id.not_in(found))
+            .limit(limit - len(users))
+        )
+        users.extend(result.scalars())
+
+    return users
+
 
 # ==========================================================
 # CREATE USER (Admin only)
@@ -44,6 +118,8 @@ def create_user(
     )
 
     db.add(user)
+    db.flush()
+    record_change(db, "user", UPSERT, user.id)
     db.commit()
     db.refresh(user)
 
@@ -53,28 +129,73 @@ def create_user(
 # ==========================================================
 # LIST USERS (Admin only)
 # ==========================================================
-@router.get("/", response_model=list[UserRead])
+@router.get("/", response_model=list[UserRead] | UserPage)
 def list_users(
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     admin_user=Depends(require_role("Admin")),
 ):
-    return db.query(User).all()
+    query = db.query(User)
+
+    if is_paginated(limit, cursor):
+        users, next_cursor = paginate(query, User, limit, cursor)
+        return {"items": users, "next_cursor": next_cursor}
+
+    return query.all()
 
 
 # ==========================================================
 # USER LOOKUP (Used for dropdowns, assignment, etc.)
 # ==========================================================
-@router.get("/lookup", response_model=list[UserLookup])
-def lookup_users(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+@router.get("/lookup", response_model=list[UserLookup] | UserLookupPage)
+async def lookup_users(
+    q: str | None = Query(None, max_length=100),
+    project_id: str | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user),
 ):
-    # NOTE:
-    # This returns minimal info only (safe)
-    # Can be scoped to project later if needed
-    users = db.query(User).all()
+    """
+    Minimal user info for pickers. With `q`, returns the best `limit`
+    (default 20) matches: name/email prefix matches first, then substring
+    matches for terms of three or more characters. `project_id` restricts
+    results to that project's members.
+    """
+    stmt = select(User)
+
+    if project_id:
+        if not is_admin(current_user):
+            member = await db.execute(
+                select(ProjectMember.project_id).where(
+                    ProjectMember.project_id == project_id,
+                    ProjectMember.user_id == current_user.id,
+                )
+            )
+            if member.first() is None:
+                raise HTTPException(403, "Access denied")
 
-    return [
+        stmt = stmt.join(ProjectMember, ProjectMember.user_id == User.id).where(
+            ProjectMember.project_id == project_id
+        )
+
+    term = (q or "").strip().lower()
+
+    if term:
+        if cursor:
+            raise HTTPException(400, "cursor is not supported with q")
+
+        users = await search_users(db, stmt, term, limit or DEFAULT_LOOKUP_LIMIT)
+        return [{"id": u.id, "name": u.name, "email": u.email} for u in users]
+
+    next_cursor = None
+    if is_paginated(limit, cursor):
+        users, next_cursor = await paginate_async(db, stmt, User, limit, cursor)
+    else:
+        users = (await db.execute(stmt)).scalars().all()
+
+    items = [
         {
             "id": u.id,
             "name": u.name,
@@ -83,6 +204,11 @@ def lookup_users(
         for u in users
     ]
 
+    if is_paginated(limit, cursor):
+        return {"items": items, "next_cursor": next_cursor}
+
+    return items
+
 
 # ==========================================================
 # GET USER (Admin or Self)
@@ -91,14 +217,14 @@ def lookup_users(
 def get_user(
     user_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     user = db.query(User).filter(User.id == user_id).first()
 
     if not user:
         raise HTTPException(404, "User not found")
 
-    if current_user.role.name != "Admin" and current_user.id != user_id:
+    if current_user.role_name != "Admin" and current_user.id != user_id:
         raise HTTPException(403, "Not authorized")
 
     return user
@@ -130,13 +256,34 @@ def update_user(
         if existing:
             raise HTTPException(400, "Email already registered")
 
+    if user.role_id != payload.role_id:
+        # Tokens carry the role claim; revoke the ones issued for the old role
+        user.token_version = (user.token_version or 0) + 1
+
+    if (user.name, user.email) != (payload.name, payload.email):
+        # Project reads embed member and assignee names; refresh their ETags
+        touch_projects(
+            db,
+            select(ProjectMember.project_id)
+            .where(ProjectMember.user_id == user_id)
+            .union(
+                select(Task.project_id)
+                .join(TaskAssignee)
+                .where(TaskAssignee.user_id == user_id)
+            ),
+        )
+
     user.email = payload.email
     user.name = payload.name
     user.role_id = payload.role_id
+    db.flush()
+    record_change(db, "user", UPSERT, user_id)
 
     db.commit()
     db.refresh(user)
 
+    invalidate_principal(user_id)
+
     return user
 
 
@@ -147,7 +294,7 @@ def update_user(
 def delete_user(
     user_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role("Admin")),
+    current_user: Principal = Depends(require_role("Admin")),
 ):
     try:
         user = db.query(User).filter(User.id == user_id).first()
@@ -165,26 +312,47 @@ def delete_user(
             if admin_count <= 1:
                 raise HTTPException(400, "At least one admin must exist")
 
-        # HARD CHECK dependencies
-        from app.models.project_member import ProjectMember
-        from app.models.task import TaskAssignee, Task
-        from app.models.project import Project
-
-        if (
-            db.query(Project).filter(Project.created_by_id == user_id).first()
-            or db.query(ProjectMember).filter(ProjectMember.user_id == user_id).first()
-            or db.query(Task).filter(Task.created_by_id == user_id).first()
-            or db.query(TaskAssignee).filter(TaskAssignee.user_id == user_id).first()
-        ):
+        # HARD CHECK dependencies: one round trip, each count an index scan
+        def count(model, column):
+            return (
+                select(func.count())
+                .select_from(model)
+                .where(column == user_id)
+                .scalar_subquery()
+            )
+
+        dependencies = dict(
+            zip(
+                DEPENDENCY_LABELS,
+                db.execute(
+                    select(
+                        count(Project, Project.created_by_id),
+                        count(ProjectMember, ProjectMember.user_id),
+                        count(Task, Task.created_by_id),
+                        count(TaskAssignee, TaskAssignee.user_id),
+                    )
+                ).one(),
+            )
+        )
+
+        if any(dependencies.values()):
+            details = ", ".join(
+                f"{n} {label}" for label, n in dependencies.items() if n
+            )
             raise HTTPException(
                 400,
-                "User is linked to projects/tasks. Remove dependencies first.",
+                f"User is linked to projects/tasks ({details}). "
+                "Remove dependencies first.",
             )
 
         # DELETE
         db.delete(user)
+        db.flush()
+        record_change(db, "user", DELETE, user_id)
         db.commit()
 
+        invalidate_principal(user_id)
+
         return {"message": "User deleted successfully"}
 
     except HTTPException:
@@ -7,3 +7,37 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set")
+
+# Optional; derived from DATABASE_URL (aiosqlite / asyncpg) when unset
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+# Connection pool (applied to both the sync and async engines, per process)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Seconds before a connection is replaced; -1 keeps connections forever
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# "true" pings on every checkout; "false" relies on DB_POOL_RECYCLE instead
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# Resolved principals (id, email, name, role) cached per worker process
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+
+# Embed role name and token version in access tokens (see build_token_claims)
+TOKEN_ROLE_CLAIMS = os.getenv("TOKEN_ROLE_CLAIMS", "true").lower() == "true"
+
+# Responses at least this many bytes are gzip-compressed when accepted
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+
+# Change-log entries younger than this are held back from GET /api/changes,
+# so a slower transaction with a lower id can't commit behind a client's cursor.
+# Writers record their log rows last, after flushing the rest of the change, so
+# this only has to cover the time from those inserts to commit.
+CHANGE_FEED_SETTLE_SECONDS = float(os.getenv("CHANGE_FEED_SETTLE_SECONDS", "1"))
+
+# Finished background jobs (e.g. project deletes) stay pollable this long
+JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+
+# Tasks removed per transaction by background project deletes
+PROJECT_DELETE_BATCH_SIZE = int(os.getenv("PROJECT_DELETE_BATCH_SIZE", "1000"))
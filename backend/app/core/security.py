@@ -1,10 +1,22 @@
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+from app.models.project_member import ProjectMember
+from app.models.role import Role
 from app.models.user import User
-from app.api.deps import get_db
+from app.api.deps import get_async_db, get_db
+from app.core.cache import TTLCache
+from app.services.auth_service import AuthContext, is_admin
+from app.core.config import (
+    PRINCIPAL_CACHE_SIZE,
+    PRINCIPAL_CACHE_TTL_SECONDS,
+    TOKEN_ROLE_CLAIMS,
+)
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 SECRET_KEY = "your-secret-key"
@@ -14,6 +26,45 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60
 security = HTTPBearer()
 
 
+# =========================
+# AUTHENTICATED PRINCIPAL
+# =========================
+@dataclass(frozen=True)
+class Principal:
+    id: str
+    email: str
+    name: str
+    role_name: str | None
+    token_version: int = 0
+
+
+principal_cache = TTLCache(PRINCIPAL_CACHE_SIZE, PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def invalidate_principal(user_id: str):
+    principal_cache.delete(str(user_id))
+
+
+async def load_principal(db: AsyncSession, user_id: str) -> Principal | None:
+    result = await db.execute(
+        select(User.id, User.email, User.name, Role.name, User.token_version)
+        .outerjoin(Role, User.role_id == Role.id)
+        .where(User.id == user_id)
+    )
+    row = result.first()
+
+    if not row:
+        return None
+
+    return Principal(
+        id=row[0],
+        email=row[1],
+        name=row[2],
+        role_name=row[3],
+        token_version=row[4] or 0,
+    )
+
+
 # =========================
 # CREATE TOKEN (NEW ADDITION)
 # =========================
@@ -24,36 +75,113 @@ def create_access_token(data: dict):
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
+def build_token_claims(user: User) -> dict:
+    claims = {"sub": str(user.id)}
+
+    # Role + version let role-gated routes authorize from the token alone;
+    # bumping users.token_version revokes every outstanding token.
+    if TOKEN_ROLE_CLAIMS:
+        claims["role"] = user.role.name if user.role else None
+        claims["ver"] = user.token_version or 0
+
+    return claims
+
+
 # =========================
-# GET CURRENT USER
+# DECODE TOKEN
 # =========================
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-):
-    token = credentials.credentials
-
+def decode_access_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.query(User).filter(User.id == user_id).first()
 
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
+async def decode_token(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> dict:
+    return decode_access_token(credentials.credentials)
+
+
+# =========================
+# GET CURRENT USER
+# =========================
+# Async so the cached hot path never leaves the event loop; sync handlers
+# can still depend on it.
+async def get_current_user(
+    claims: dict = Depends(decode_token),
+    db: AsyncSession = Depends(get_async_db),
+):
+    user_id = str(claims.get("sub"))
+
+    # Hot path: resolved from the per-process cache, no DB round trip
+    principal = principal_cache.get(user_id)
+    version = claims.get("ver")
+
+    # A newer version than cached was issued after a change handled by
+    # another worker: this process's entry is stale, so re-read it
+    if principal is None or (version is not None and version > principal.token_version):
+        principal = await load_principal(db, user_id)
+
+        if not principal:
+            raise HTTPException(status_code=401, detail="User not found")
+
+        principal_cache.set(user_id, principal)
+
+    if version is not None and version != principal.token_version:
+        raise HTTPException(status_code=401, detail="Token revoked")
+
+    return principal
+
+
+# =========================
+# REQUEST AUTH CONTEXT
+# =========================
+def get_auth_context(
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> AuthContext:
+    return AuthContext(current_user, db)
+
+
+async def get_async_auth_context(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> AuthContext:
+    # Async handlers can't lazy-load, so memberships are fetched up front
+    memberships = {}
+
+    if not is_admin(current_user):
+        result = await db.execute(
+            select(ProjectMember.project_id, ProjectMember.role).where(
+                ProjectMember.user_id == current_user.id
+            )
+        )
+        memberships = dict(result.all())
 
-    return user
+    return AuthContext(current_user, memberships=memberships)
 
 
 # =========================
 # ROLE CHECKER
 # =========================
 def require_role(role_name: str):
-    def role_checker(current_user: User = Depends(get_current_user)):
+    async def role_checker(
+        claims: dict = Depends(decode_token),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        token_role = claims.get("role")
+
+        # Role claim present: reject before resolving the user at all
+        if token_role is not None and token_role != role_name:
+            raise HTTPException(
+                status_code=403,
+                detail=f"{role_name} access required",
+            )
+
+        current_user = await get_current_user(claims, db)
 
-        if current_user.role.name != role_name:
+        if (token_role or current_user.role_name) != role_name:
             raise HTTPException(
                 status_code=403,
                 detail=f"{role_name} access required",
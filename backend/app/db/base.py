@@ -1,3 +1,13 @@
+from sqlalchemy import MetaData
 from sqlalchemy.orm import declarative_base
 
-Base = declarative_base()
+# Matches PostgreSQL's default constraint names, so databases created
+# before migrations existed line up with the migration history.
+NAMING_CONVENTION = {
+    "ix": "ix_%(table_name)s_%(column_0_N_name)s",
+    "uq": "%(table_name)s_%(column_0_name)s_key",
+    "fk": "%(table_name)s_%(column_0_name)s_fkey",
+    "pk": "%(table_name)s_pkey",
+}
+
+Base = declarative_base(metadata=MetaData(naming_convention=NAMING_CONVENTION))
@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Created by raw DDL (SQLite full-text index), not part of the ORM metadata
+UNMANAGED_TABLE_PREFIXES = ("search_documents_fts",)
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """Autogenerate filter that leaves unmanaged tables alone."""
+    if type_ == "table":
+        return not name.startswith(UNMANAGED_TABLE_PREFIXES)
+    return True
+
+
+def get_alembic_config(database_url: str | None = None) -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+
+    if database_url:
+        config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+
+    return config
+
+
+def upgrade_database(database_url: str | None = None, revision: str = "head"):
+    command.upgrade(get_alembic_config(database_url), revision)
@@ -0,0 +1,83 @@
+import bisect
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+# Upper bounds (ms) of the checkout latency histogram buckets
+LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class PoolMetrics:
+    """Checkout counters and latency histogram for one connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, seconds: float, timed_out: bool = False):
+        index = bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self.buckets[index] += 1
+
+    def snapshot(self, pool) -> dict:
+        with self._lock:
+            # Cumulative, Prometheus style: le_Xms counts checkouts <= X ms
+            histogram = {}
+            running = 0
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+                running += count
+                histogram[f"le_{bound}ms"] = running
+            histogram["le_inf"] = running + self.buckets[-1]
+            attempts = self.checkouts + self.timeouts
+
+            stats = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": (
+                    round(self.total_wait / attempts * 1000, 3) if attempts else 0.0
+                ),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "checkout_latency_histogram": histogram,
+            }
+
+        # QueuePool-style pools expose live occupancy
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            value = getattr(pool, name, None)
+            if callable(value):
+                stats[name] = value()
+
+        stats["status"] = pool.status()
+        return stats
+
+
+def instrument_pool_class(pool_class, metrics: PoolMetrics):
+    """
+    Subclass of `pool_class` that times every checkout, including time spent
+    waiting for a free connection and opening new ones.
+    """
+
+    class InstrumentedPool(pool_class):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                metrics.observe(time.perf_counter() - start, timed_out=True)
+                raise
+            metrics.observe(time.perf_counter() - start)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{pool_class.__name__}"
+    return InstrumentedPool
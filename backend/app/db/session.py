@@ -1,11 +1,111 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from app.core.config import DATABASE_URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from app.core.config import (
+    ASYNC_DATABASE_URL,
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+from app.db.pool_metrics import PoolMetrics, instrument_pool_class
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Maps a sync DATABASE_URL onto the matching asyncio driver."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}'")
+
+    parsed = parsed.set(drivername=ASYNC_DRIVERS[backend])
+
+    # asyncpg takes "ssl" rather than libpq's "sslmode"
+    if "sslmode" in parsed.query:
+        query = dict(parsed.query)
+        query["ssl"] = query.pop("sslmode")
+        parsed = parsed.set(query=query)
+
+    return parsed.render_as_string(hide_password=False)
+
+
+def pool_options(url: str, pool_class, metrics: PoolMetrics) -> dict:
+    options = {
+        # pre-ping prevents stale connections (important for cloud DB)
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+
+    parsed = make_url(url)
+
+    # In-memory SQLite must keep SQLAlchemy's single-connection pool
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        return options
+
+    options.update(
+        poolclass=instrument_pool_class(pool_class, metrics),
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+    return options
+
+
+def enable_sqlite_foreign_keys(engine):
+    """
+    SQLite ignores foreign keys, ON DELETE CASCADE included, unless each
+    connection opts in. Not applied to the migration engine: batch
+    migrations drop and rebuild tables, which would cascade.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _foreign_keys_on(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+sync_pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
 
 engine = create_engine(
     DATABASE_URL,
     future=True,
-    pool_pre_ping=True,  # prevents stale connections (important for cloud DB)
+    **pool_options(DATABASE_URL, QueuePool, sync_pool_metrics),
 )
 
+enable_sqlite_foreign_keys(engine)
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+_async_url = ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+
+async_engine = create_async_engine(
+    _async_url,
+    **pool_options(_async_url, AsyncAdaptedQueuePool, async_pool_metrics),
+)
+
+enable_sqlite_foreign_keys(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
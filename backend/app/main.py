@@ -1,15 +1,35 @@
 from fastapi import FastAPI
-from app.api import users, roles, projects, tasks, auth
+from fastapi.responses import ORJSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from app.api import (
+    auth,
+    changes,
+    dashboard,
+    events,
+    jobs,
+    metrics,
+    projects,
+    roles,
+    search,
+    tasks,
+    users,
+)
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
+from app.core.config import GZIP_MINIMUM_SIZE
+
 load_dotenv()
 
 app = FastAPI(
     title="FSE Task Tracker",
     swagger_ui_parameters={"persistAuthorization": True},
+    default_response_class=ORJSONResponse,
 )
 
+# Small payloads aren't worth the CPU; large lists shrink ~10x
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -29,3 +49,9 @@ app.include_router(users.router)
 app.include_router(roles.router)
 app.include_router(projects.router)
 app.include_router(tasks.router)
+app.include_router(metrics.router)
+app.include_router(dashboard.router)
+app.include_router(events.router)
+app.include_router(changes.router)
+app.include_router(search.router)
+app.include_router(jobs.router)
@@ -0,0 +1,39 @@
+# Rebuilds derived data from the projects and tasks tables: after seeding or
+# manual SQL, and `recount` periodically so overdue counts follow the clock.
+#
+#     python -m app.maintenance recount [project_id ...]
+#     python -m app.maintenance reindex [project_id ...]
+
+import sys
+
+from app.db.session import SessionLocal
+from app.services.search_index import rebuild_search_index
+from app.services.task_counters import recount_projects
+
+# Register every mapper the commands' queries touch
+from app.models import project, project_member, role, task, user  # noqa: F401
+
+COMMANDS = {
+    "recount": (recount_projects, "Recounted task counters for {} project(s)."),
+    "reindex": (rebuild_search_index, "Indexed {} search document(s)."),
+}
+
+
+def run(command: str, project_ids=None):
+    rebuild, message = COMMANDS[command]
+    db = SessionLocal()
+
+    try:
+        count = rebuild(db, project_ids)
+        db.commit()
+    finally:
+        db.close()
+
+    print(message.format(count))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        sys.exit(f"usage: python -m app.maintenance {{{'|'.join(COMMANDS)}}} [id ...]")
+
+    run(sys.argv[1], sys.argv[2:] or None)
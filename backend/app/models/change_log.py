@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from datetime import datetime
+from app.db.base import Base
+
+
+class ChangeLog(Base):
+    """
+    Append-only log behind GET /api/changes. Each write handler adds rows
+    in the same transaction as the change they describe. No foreign keys:
+    delete tombstones outlive the rows they refer to.
+    """
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        # Non-admin feeds: "changes in my projects after cursor"
+        Index("ix_change_log_project_id_id", "project_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    entity = Column(String, nullable=False)  # project | task | member | user
+    entity_id = Column(String, nullable=False)  # user_id for members
+    project_id = Column(String)  # null for users (admin-only)
+    op = Column(String, nullable=False)  # upsert | delete
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
@@ -7,6 +7,10 @@ from app.db.base import Base
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created_by_id", "created_by_id"),
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String, nullable=False)
@@ -16,20 +20,41 @@ class Project(Base):
 
     created_by_id = Column(String, ForeignKey("users.id"), nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Bumped by every write that changes what project reads return (ETags)
+    revision = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Task counters, kept current by every task write in the same transaction
+    # (app/services/task_counters.py) and recomputed by
+    # `python -m app.maintenance recount`
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    new_count = Column(Integer, nullable=False, default=0, server_default="0")
+    in_progress_count = Column(Integer, nullable=False, default=0, server_default="0")
+    blocked_count = Column(Integer, nullable=False, default=0, server_default="0")
+    done_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Open tasks due before overdue_as_of. Writes keep it exact for that
+    # instant; the recount moves the instant forward.
+    overdue_count = Column(Integer, nullable=False, default=0, server_default="0")
+    overdue_as_of = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     created_by = relationship("User", back_populates="created_projects")
 
+    # ON DELETE CASCADE removes members and tasks (and, through tasks, their
+    # assignees) in the database; the ORM doesn't load them to delete them
     members = relationship(
         "ProjectMember",
         back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     tasks = relationship(
         "Task",
         back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
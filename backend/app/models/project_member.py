@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime
+from sqlalchemy import Column, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
@@ -6,8 +6,14 @@ from app.db.base import Base
 
 class ProjectMember(Base):
     __tablename__ = "project_members"
+    __table_args__ = (
+        # PK leads with project_id; this serves "projects of user" lookups
+        Index("ix_project_members_user_id_project_id", "user_id", "project_id"),
+    )
 
-    project_id = Column(String, ForeignKey("projects.id"), primary_key=True)
+    project_id = Column(
+        String, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
     user_id = Column(String, ForeignKey("users.id"), primary_key=True)
 
     role = Column(String, default="Member")  # Owner | Member
@@ -0,0 +1,84 @@
+from sqlalchemy import (
+    DDL,
+    Column,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    event,
+    literal_column,
+)
+from app.db.base import Base
+
+# SQLite: FTS5 table over search_documents (external content, so the text
+# is stored once). Its own shadow tables share the name as a prefix.
+SEARCH_FTS_TABLE = "search_documents_fts"
+
+# PostgreSQL: the GIN index and the search query must use this exact
+# expression for the planner to match them. Titles rank above bodies.
+SEARCH_VECTOR = literal_column(
+    "(setweight(to_tsvector('english'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, body), 'B'))"
+)
+
+
+class SearchDocument(Base):
+    """
+    One row per searchable task or project, kept current by the task and
+    project write handlers (app/services/search_index.py) in the same
+    transaction as the change itself. The text index on top of it is
+    dialect-specific: FTS5 on SQLite, a tsvector GIN index on PostgreSQL.
+    """
+
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        UniqueConstraint("entity", "entity_id"),
+        # Visibility filter and project deletion
+        Index("ix_search_documents_project_id", "project_id"),
+        Index(
+            "ix_search_documents_vector", SEARCH_VECTOR, postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    # Integer key doubles as the FTS5 rowid
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    entity = Column(String, nullable=False)  # task | project
+    entity_id = Column(String, nullable=False)
+    project_id = Column(String, nullable=False)
+
+    title = Column(String, nullable=False)
+    body = Column(Text, nullable=False, default="")
+
+
+# Mirrored in migration 0007
+SQLITE_FTS_DDL = [
+    f"CREATE VIRTUAL TABLE {SEARCH_FTS_TABLE} USING fts5("
+    "title, body, content='search_documents', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    "CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+    "CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); END",
+    "CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+]
+
+for statement in SQLITE_FTS_DDL:
+    event.listen(
+        SearchDocument.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+
+event.listen(
+    SearchDocument.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
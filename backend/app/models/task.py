@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
@@ -8,6 +8,11 @@ from app.core.enums import TaskStatus
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_project_id_status", "project_id", "status"),
+        Index("ix_tasks_project_id_due_date", "project_id", "due_date"),
+        Index("ix_tasks_created_by_id", "created_by_id"),
+    )
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String, nullable=False)
@@ -16,11 +21,13 @@ class Task(Base):
     due_date = Column(DateTime)
     status = Column(String, default=TaskStatus.NEW.value)
 
-    project_id = Column(String, ForeignKey("projects.id"), nullable=False)
+    project_id = Column(
+        String, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
     created_by_id = Column(String, ForeignKey("users.id"), nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     project = relationship("Project", back_populates="tasks")
 
@@ -34,13 +41,20 @@ class Task(Base):
         "TaskAssignee",
         back_populates="task",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
 class TaskAssignee(Base):
     __tablename__ = "task_assignees"
+    __table_args__ = (
+        # PK leads with task_id; this serves "tasks assigned to user" lookups
+        Index("ix_task_assignees_user_id_task_id", "user_id", "task_id"),
+    )
 
-    task_id = Column(String, ForeignKey("tasks.id"), primary_key=True)
+    task_id = Column(
+        String, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True
+    )
     user_id = Column(String, ForeignKey("users.id"), primary_key=True)
 
     task = relationship("Task", back_populates="assignees")
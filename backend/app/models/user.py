@@ -1,5 +1,15 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey, DateTime
+from sqlalchemy import (
+    DDL,
+    Column,
+    String,
+    ForeignKey,
+    DateTime,
+    Index,
+    Integer,
+    event,
+    func,
+)
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base import Base
@@ -7,6 +17,7 @@ from app.db.base import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     email = Column(String, unique=True, nullable=False)
@@ -15,7 +26,10 @@ class User(Base):
     role_id = Column(String, ForeignKey("roles.id"))
     role = relationship("Role")
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Bumped to revoke outstanding access tokens (role change, deletion)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     created_projects = relationship(
@@ -34,3 +48,39 @@ class User(Base):
         foreign_keys="Task.created_by_id",
         back_populates="created_by",
     )
+
+
+# Prefix search for the member pickers. text_pattern_ops lets PostgreSQL use
+# the index for LIKE 'abc%' whatever the database collation.
+Index(
+    "ix_users_lower_name",
+    func.lower(User.name).label("lower_name"),
+    postgresql_ops={"lower_name": "text_pattern_ops"},
+)
+Index(
+    "ix_users_lower_email",
+    func.lower(User.email).label("lower_email"),
+    postgresql_ops={"lower_email": "text_pattern_ops"},
+)
+
+# Substring search (LIKE '%abc%') on PostgreSQL: trigram GIN indexes. SQLite
+# has no equivalent and scans users for the substring top-up.
+Index(
+    "ix_users_lower_name_trgm",
+    func.lower(User.name).label("lower_name"),
+    postgresql_using="gin",
+    postgresql_ops={"lower_name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_users_lower_email_trgm",
+    func.lower(User.email).label("lower_email"),
+    postgresql_using="gin",
+    postgresql_ops={"lower_email": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+# Mirrored in migration 0010
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel
+
+
+class Change(BaseModel):
+    entity: Literal["project", "task", "member", "user"]
+    op: Literal["upsert", "delete"]
+    id: str
+    project_id: Optional[str] = None
+    at: datetime
+    data: Optional[dict[str, Any]] = None
+
+
+class ChangeFeed(BaseModel):
+    changes: list[Change]
+    next_cursor: str
+    has_more: bool
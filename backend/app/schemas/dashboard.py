@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+
+from app.schemas.project import ProjectRead
+from app.schemas.task import MyTaskRead
+
+
+class TaskCounts(BaseModel):
+    total: int
+    by_status: dict[str, int]
+    overdue: int
+    progress: int
+
+
+class DashboardProject(ProjectRead):
+    task_counts: TaskCounts
+
+
+class DashboardRead(BaseModel):
+    projects: list[DashboardProject]
+    due_soon: list[MyTaskRead]
+    status_totals: dict[str, int]
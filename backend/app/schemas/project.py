@@ -17,3 +17,76 @@ class UpdateProjectRequest(BaseModel):
     description: Optional[str] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
+
+
+class BulkMembersRequest(BaseModel):
+    add: list[str] = []
+    remove: list[str] = []
+
+
+# ---------- RESPONSES ----------
+
+
+class UserSummary(BaseModel):
+    id: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+
+
+class MemberRead(UserSummary):
+    role: Optional[str] = None
+
+
+class ProjectTaskCounts(BaseModel):
+    total: int
+    by_status: dict[str, int]
+    overdue: int
+    overdue_as_of: Optional[datetime] = None
+    progress: int
+
+
+class ProjectRead(BaseModel):
+    id: str
+    name: str
+    description: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    created_by: Optional[UserSummary] = None
+    members: list[MemberRead] = []
+    created_at: Optional[datetime] = None
+    task_counts: Optional[ProjectTaskCounts] = None
+
+
+class ProjectPage(BaseModel):
+    items: list[ProjectRead]
+    next_cursor: Optional[str] = None
+
+
+class ProjectTaskRead(BaseModel):
+    id: str
+    title: str
+    description: Optional[str] = None
+    status: Optional[str] = None
+    due_date: Optional[datetime] = None
+    assignees: list[UserSummary] = []
+
+
+class ProjectDetail(ProjectRead):
+    tasks: list[ProjectTaskRead] = []
+
+
+class WorkloadRead(BaseModel):
+    user_id: str
+    name: Optional[str] = None
+    total: int
+    open: int
+
+
+class ProjectStats(BaseModel):
+    project_id: str
+    total: int
+    by_status: dict[str, int]
+    overdue: int
+    unassigned: int
+    progress: int
+    workload: list[WorkloadRead]
@@ -0,0 +1,15 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    entity: Literal["project", "task"]
+    id: str
+    project_id: str
+    title: str
+
+
+class SearchPage(BaseModel):
+    items: list[SearchHit]
+    next_cursor: Optional[str] = None
@@ -1,21 +1,100 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator, model_validator
 from app.core.enums import TaskStatus
 from typing import Optional
 from datetime import datetime
 
 
+def blank_to_none(value):
+    # The task forms send "" for a cleared date input
+    return None if value == "" else value
+
+
 class TaskCreate(BaseModel):
-    title: str
-    description: Optional[str]
-    due_date: Optional[datetime]
+    project_id: str
+    title: str = Field(..., min_length=1)
+    description: Optional[str] = None
+    due_date: Optional[datetime] = None
     status: TaskStatus = TaskStatus.NEW
+    assignees: list[str] = []
+
+    _blank_due_date = field_validator("due_date", mode="before")(blank_to_none)
+
+
+class TaskUpdate(BaseModel):
+    """
+    Partial update: only fields present in the body are applied (see
+    `model_fields_set`); an explicit null clears description / due_date.
+    """
+
+    title: Optional[str] = Field(None, min_length=1)
+    description: Optional[str] = None
+    due_date: Optional[datetime] = None
+    status: Optional[TaskStatus] = None
+    assignees: Optional[list[str]] = None
+
+    _blank_due_date = field_validator("due_date", mode="before")(blank_to_none)
+
+    @model_validator(mode="after")
+    def reject_null_required(self):
+        for field in ("title", "status"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
 
 
 class TaskRead(BaseModel):
     id: str
     title: str
-    description: Optional[str]
+    description: Optional[str] = None
     status: TaskStatus
+    due_date: Optional[datetime] = None
+    project_id: str
+    created_by_id: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class BulkTaskCreateRequest(BaseModel):
+    tasks: list[TaskCreate] = Field(..., min_length=1, max_length=1000)
+
+
+# ---------- RESPONSES ----------
+
+
+class MyTaskRead(BaseModel):
+    id: str
+    title: str
+    description: Optional[str] = None
+    status: Optional[str] = None
+    project_id: str
+    due_date: Optional[datetime] = None
+
+
+class MyTaskPage(BaseModel):
+    items: list[MyTaskRead]
+    next_cursor: Optional[str] = None
+
+
+class TaskChanges(BaseModel):
+    fields: list[str]
+    assignees_added: list[str]
+    assignees_removed: list[str]
+
+
+class TaskUpdateResult(TaskRead):
+    changes: TaskChanges
+
+
+class BulkTaskResult(BaseModel):
+    index: int
+    ok: bool
+    id: Optional[str] = None
+    error: Optional[str] = None
+
 
-    class Config:
-        orm_mode = True
+class BulkTaskCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkTaskResult]
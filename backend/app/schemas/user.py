@@ -33,3 +33,13 @@ class UserLookup(BaseModel):
     id: str
     name: str
     email: str
+
+
+class UserPage(BaseModel):
+    items: list[UserRead]
+    next_cursor: Optional[str] = None
+
+
+class UserLookupPage(BaseModel):
+    items: list[UserLookup]
+    next_cursor: Optional[str] = None
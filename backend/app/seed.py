@@ -1,11 +1,13 @@
 from app.db.session import engine, SessionLocal
-from app.db.base import Base
+from app.db.migrations import upgrade_database
 from app.models.role import Role
 from app.models.user import User
 from app.models.project import Project
 from app.models.task import Task, TaskAssignee
 from app.models.project_member import ProjectMember
 from app.core.enums import TaskStatus
+from app.services.search_index import rebuild_search_index
+from app.services.task_counters import recount_projects
 from sqlalchemy import text
 from datetime import datetime, timedelta
 import os
@@ -23,7 +25,7 @@ def reset_database():
         conn.execute(text("CREATE SCHEMA public"))
         conn.commit()
 
-    Base.metadata.create_all(bind=engine)
+    upgrade_database()
     print("Database reset complete.")
 
 
@@ -155,6 +157,11 @@ def run():
             # else → leave unassigned
 
     db.commit()
+
+    # Tasks were inserted directly, not through the API
+    recount_projects(db)
+    rebuild_search_index(db)
+    db.commit()
     db.close()
 
     print("✅ Database seeded with SSO-compatible clean data.")
@@ -1,33 +1,66 @@
 from fastapi import HTTPException
 
+from app.models.project_member import ProjectMember
+
 
 def is_admin(user):
-    return user.role.name == "Admin"
+    return user.role_name == "Admin"
 
 
 def is_task_creator(user):
-    return user.role.name == "Task Creator"
+    return user.role_name == "Task Creator"
 
 
 def is_read_only(user):
-    return user.role.name == "Read-Only"
+    return user.role_name == "Read-Only"
+
+
+# ---------- REQUEST CONTEXT ----------
+
+
+class AuthContext:
+    """
+    Per-request authorization state: the caller and their project
+    memberships. Memberships are fetched with one query on first use and
+    then answered from memory, so repeated checks cost nothing.
+    """
+
+    def __init__(self, user, db=None, memberships=None):
+        self.user = user
+        self._db = db
+        self._memberships = memberships
+
+    @property
+    def memberships(self) -> dict[str, str]:
+        """project_id -> membership role (Owner | Member)"""
+        if self._memberships is None:
+            rows = (
+                self._db.query(ProjectMember.project_id, ProjectMember.role)
+                .filter(ProjectMember.user_id == self.user.id)
+                .all()
+            )
+            self._memberships = {project_id: role for project_id, role in rows}
+        return self._memberships
+
+    def is_member(self, project_id):
+        return project_id in self.memberships
 
 
 # ---------- PROJECT ----------
 
 
-def can_view_project(user, project, membership):
-    if is_admin(user):
+def can_view_project(ctx, project_id):
+    if is_admin(ctx.user):
         return True
-    if membership:
+    if ctx.is_member(project_id):
         return True
     raise HTTPException(status_code=403, detail="Access denied")
 
 
-def can_modify_project(user, project, membership):
-    if is_admin(user):
+def can_modify_project(ctx, project):
+    if is_admin(ctx.user):
         return True
-    if project.created_by_id == user.id:
+    if project.created_by_id == ctx.user.id:
         return True
     raise HTTPException(status_code=403, detail="Only owner can modify project")
 
@@ -41,6 +74,15 @@ def can_create_task(user):
     raise HTTPException(status_code=403, detail="Not allowed to create task")
 
 
+def can_create_task_in_project(ctx, project_id):
+    can_create_task(ctx.user)
+    if is_admin(ctx.user):
+        return True
+    if ctx.is_member(project_id):
+        return True
+    raise HTTPException(status_code=403, detail="Not a project member")
+
+
 def can_modify_task(user, task):
     if is_admin(user):
         return True
@@ -0,0 +1,22 @@
+from sqlalchemy import insert
+
+from app.models.change_log import ChangeLog
+
+UPSERT = "upsert"
+DELETE = "delete"
+
+
+# Call last, right before commit: ids order the change feed, so the rest of
+# the change must already be flushed (see CHANGE_FEED_SETTLE_SECONDS)
+def record_changes(db, entity: str, op: str, items):
+    rows = [
+        {"entity": entity, "entity_id": entity_id, "project_id": project_id, "op": op}
+        for entity_id, project_id in items
+    ]
+
+    if rows:
+        db.execute(insert(ChangeLog), rows)
+
+
+def record_change(db, entity: str, op: str, entity_id: str, project_id=None):
+    record_changes(db, entity, op, [(entity_id, project_id)])
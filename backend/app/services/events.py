@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from collections import defaultdict
+from datetime import datetime
+
+# Buffered events per subscriber before it is told to resync
+SUBSCRIBER_QUEUE_SIZE = 256
+
+RESYNC = {"type": "resync"}
+
+
+class Subscription:
+    """A subscriber's bounded queue, bound to the loop that consumes it."""
+
+    def __init__(self, project_id: str, queue_size: int):
+        self.project_id = project_id
+        self.queue = asyncio.Queue(queue_size)
+        self.loop = asyncio.get_running_loop()
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+    def deliver(self, event: dict):
+        # Runs on self.loop
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+class EventBroker:
+    """
+    In-process pub/sub keyed by project id.
+
+    Write handlers publish compact delta events after commit; every
+    WebSocket subscribed to that project receives them. Sync handlers run
+    in the threadpool, so delivery hops onto each subscriber's event loop
+    with call_soon_threadsafe. A subscriber that falls too far behind gets
+    a single "resync" event instead of an unbounded backlog.
+
+    Events only reach subscribers in the same worker process; running
+    several workers needs an external fan-out (e.g. Redis pub/sub).
+    """
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self._queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, project_id: str) -> Subscription:
+        subscription = Subscription(project_id, self._queue_size)
+
+        with self._lock:
+            self._subscribers[project_id].add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.project_id]
+
+    def subscriber_count(self, project_id: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(project_id, ()))
+
+    def publish(self, project_id: str, event_type: str, data: dict | None = None):
+        with self._lock:
+            subscribers = list(self._subscribers.get(project_id, ()))
+
+        if not subscribers:
+            return
+
+        event = {
+            "type": event_type,
+            "project_id": project_id,
+            "at": datetime.utcnow(),
+            "data": data or {},
+        }
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # Subscriber's loop already closed; it unsubscribes on exit
+                pass
+
+
+broker = EventBroker()
+
+
+def publish(project_id: str, event_type: str, data: dict | None = None):
+    broker.publish(project_id, event_type, data)
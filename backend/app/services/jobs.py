@@ -0,0 +1,69 @@
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.core.cache import TTLCache
+from app.core.config import JOB_RETENTION_SECONDS
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+MAX_RETAINED_JOBS = 1000
+
+
+@dataclass
+class Job:
+    kind: str
+    created_by_id: str
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = PENDING
+    result: dict = field(default_factory=dict)
+    error: str | None = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: datetime | None = None
+
+
+class JobRegistry:
+    """
+    In-process registry of background jobs started by request handlers.
+
+    Handlers create a job, schedule run() as a FastAPI background task and
+    return the job id; clients poll GET /api/jobs/{id}. Finished jobs are
+    kept for JOB_RETENTION_SECONDS. Like the event broker, jobs are only
+    visible in the worker process that runs them.
+    """
+
+    def __init__(self, maxsize: int = MAX_RETAINED_JOBS, ttl=JOB_RETENTION_SECONDS):
+        self._jobs = TTLCache(maxsize, ttl)
+
+    def create(self, kind: str, created_by_id: str) -> Job:
+        job = Job(kind=kind, created_by_id=created_by_id)
+        self._jobs.set(job.id, job)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def run(self, job: Job, fn, *args):
+        """Runs fn(job, *args), recording progress in job.result."""
+        job.status = RUNNING
+
+        try:
+            fn(job, *args)
+            job.status = DONE
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed", job.id, job.kind)
+            job.status = FAILED
+            job.error = str(exc)
+        finally:
+            job.finished_at = datetime.utcnow()
+            # Retention counts from completion
+            self._jobs.set(job.id, job)
+
+
+jobs = JobRegistry()
@@ -0,0 +1,14 @@
+from sqlalchemy import update
+
+from app.models.project import Project
+
+
+# Bumps `revision` (and through onupdate, `updated_at`) so conditional GETs
+# see the change. `project_ids` may be a list or a subquery.
+def touch_projects(db, project_ids):
+    db.execute(
+        update(Project)
+        .where(Project.id.in_(project_ids))
+        .values(revision=Project.revision + 1)
+        .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,86 @@
+from sqlalchemy import delete, func, insert, literal, select, union_all, update
+
+from app.models.project import Project
+from app.models.search_document import SearchDocument
+from app.models.task import Task
+
+
+# (entity_id, project_id, title, body) rows in one executemany; the text
+# index follows through FTS5 triggers (SQLite) or the GIN index (PostgreSQL)
+def index_documents(db, entity: str, items):
+    rows = [
+        {
+            "entity": entity,
+            "entity_id": entity_id,
+            "project_id": project_id,
+            "title": title,
+            "body": body or "",
+        }
+        for entity_id, project_id, title, body in items
+    ]
+
+    if rows:
+        db.execute(insert(SearchDocument), rows)
+
+
+def index_document(db, entity: str, entity_id: str, project_id: str, title, body):
+    index_documents(db, entity, [(entity_id, project_id, title, body)])
+
+
+def reindex_document(db, entity: str, entity_id: str, title, body):
+    db.execute(
+        update(SearchDocument)
+        .where(SearchDocument.entity == entity, SearchDocument.entity_id == entity_id)
+        .values(title=title, body=body or "")
+    )
+
+
+def remove_documents(db, entity: str, entity_ids):
+    db.execute(
+        delete(SearchDocument).where(
+            SearchDocument.entity == entity, SearchDocument.entity_id.in_(entity_ids)
+        )
+    )
+
+
+def remove_document(db, entity: str, entity_id: str):
+    remove_documents(db, entity, [entity_id])
+
+
+# The project's own document and those of all its tasks
+def remove_project_documents(db, project_id: str):
+    db.execute(delete(SearchDocument).where(SearchDocument.project_id == project_id))
+
+
+# Rebuilds the documents of the given projects (default: all) and their tasks
+# with one DELETE and one INSERT ... SELECT. Returns the number indexed.
+def rebuild_search_index(db, project_ids=None) -> int:
+    projects = select(
+        literal("project"),
+        Project.id,
+        Project.id,
+        Project.name,
+        func.coalesce(Project.description, ""),
+    )
+    tasks = select(
+        literal("task"),
+        Task.id,
+        Task.project_id,
+        Task.title,
+        func.coalesce(Task.description, ""),
+    )
+    stale = delete(SearchDocument)
+
+    if project_ids is not None:
+        projects = projects.where(Project.id.in_(project_ids))
+        tasks = tasks.where(Task.project_id.in_(project_ids))
+        stale = stale.where(SearchDocument.project_id.in_(project_ids))
+
+    db.execute(stale)
+    result = db.execute(
+        insert(SearchDocument).from_select(
+            ["entity", "entity_id", "project_id", "title", "body"],
+            union_all(projects, tasks),
+        )
+    )
+    return result.rowcount
@@ -0,0 +1,85 @@
+from datetime import datetime
+
+from sqlalchemy import and_, case, exists, func, select
+
+from app.core.enums import TaskStatus
+from app.models.task import Task, TaskAssignee
+from app.models.user import User
+
+
+def empty_stats(project_id):
+    return {
+        "project_id": project_id,
+        "total": 0,
+        "by_status": {status.value: 0 for status in TaskStatus},
+        "overdue": 0,
+        "unassigned": 0,
+        "progress": 0,
+        "workload": [],
+    }
+
+
+async def get_project_stats(db, project_ids) -> dict[str, dict]:
+    """
+    Task statistics for many projects in two GROUP BY queries, however
+    many projects or tasks there are:
+
+    - tasks grouped by (project, status), with overdue and unassigned
+      counted alongside through conditional sums
+    - assignments grouped by (project, assignee) for the workload table
+    """
+    stats = {project_id: empty_stats(project_id) for project_id in project_ids}
+
+    if not stats:
+        return stats
+
+    not_done = Task.status != TaskStatus.DONE.value
+    is_overdue = and_(Task.due_date < datetime.utcnow(), not_done)
+    is_unassigned = ~exists().where(TaskAssignee.task_id == Task.id)
+
+    result = await db.execute(
+        select(
+            Task.project_id,
+            Task.status,
+            func.count(Task.id),
+            func.sum(case((is_overdue, 1), else_=0)),
+            func.sum(case((is_unassigned, 1), else_=0)),
+        )
+        .where(Task.project_id.in_(stats))
+        .group_by(Task.project_id, Task.status)
+    )
+
+    for project_id, status, total, overdue, unassigned in result.all():
+        entry = stats[project_id]
+        entry["by_status"][status] = entry["by_status"].get(status, 0) + total
+        entry["total"] += total
+        entry["overdue"] += overdue or 0
+        entry["unassigned"] += unassigned or 0
+
+    result = await db.execute(
+        select(
+            Task.project_id,
+            User.id,
+            User.name,
+            func.count(Task.id),
+            func.sum(case((not_done, 1), else_=0)),
+        )
+        .select_from(TaskAssignee)
+        .join(Task, TaskAssignee.task_id == Task.id)
+        .join(User, TaskAssignee.user_id == User.id)
+        .where(Task.project_id.in_(stats))
+        .group_by(Task.project_id, User.id, User.name)
+        .order_by(Task.project_id, User.name)
+    )
+
+    for project_id, user_id, name, total, open_ in result.all():
+        stats[project_id]["workload"].append(
+            {"user_id": user_id, "name": name, "total": total, "open": open_ or 0}
+        )
+
+    for entry in stats.values():
+        if entry["total"]:
+            done = entry["by_status"][TaskStatus.DONE.value]
+            entry["progress"] = round(done * 100 / entry["total"])
+
+    return stats
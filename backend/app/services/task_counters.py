@@ -0,0 +1,113 @@
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import case, func, select, update
+
+from app.core.enums import TaskStatus
+from app.models.project import Project
+from app.models.task import Task
+
+STATUS_COUNTERS = {
+    TaskStatus.NEW.value: "new_count",
+    TaskStatus.IN_PROGRESS.value: "in_progress_count",
+    TaskStatus.BLOCKED.value: "blocked_count",
+    TaskStatus.DONE.value: "done_count",
+}
+
+
+# How many of `due_dates` fall before the project's overdue_as_of, as a
+# CASE ladder over the sorted dates (highest first)
+def count_overdue(due_dates):
+    dues = sorted(due for due in due_dates if due is not None)
+    whens = []
+
+    for index in reversed(range(len(dues))):
+        # Equal dates: only the last occurrence can be the answer
+        if index + 1 < len(dues) and dues[index] == dues[index + 1]:
+            continue
+        whens.append((Project.overdue_as_of > dues[index], index + 1))
+
+    return case(*whens, else_=0) if whens else None
+
+
+# Applies (status, due_date) pairs to the project's counters in one UPDATE;
+# an edit removes the old pair and adds the new one. Also bumps `revision`,
+# so task writes need no separate touch_projects.
+def count_tasks(db, project_id: str, added=(), removed=()):
+    added, removed = Counter(added), Counter(removed)
+    unchanged = added & removed
+    added, removed = added - unchanged, removed - unchanged
+
+    values = {"revision": Project.revision + 1}
+
+    total = added.total() - removed.total()
+    if total:
+        values["task_count"] = Project.task_count + total
+
+    by_status = Counter()
+    for (status, _), n in added.items():
+        by_status[status] += n
+    for (status, _), n in removed.items():
+        by_status[status] -= n
+
+    for status, delta in by_status.items():
+        column = STATUS_COUNTERS.get(status)
+        if column and delta:
+            values[column] = getattr(Project, column) + delta
+
+    def open_dues(pairs):
+        return [
+            due
+            for (status, due), n in pairs.items()
+            for _ in range(n)
+            if status != TaskStatus.DONE.value
+        ]
+
+    overdue = Project.overdue_count
+    now_overdue = count_overdue(open_dues(added))
+    was_overdue = count_overdue(open_dues(removed))
+
+    if now_overdue is not None:
+        overdue = overdue + now_overdue
+    if was_overdue is not None:
+        overdue = overdue - was_overdue
+    if now_overdue is not None or was_overdue is not None:
+        values["overdue_count"] = overdue
+
+    db.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+# Recomputes the counters from the tasks table and moves the overdue
+# snapshot to `now`. Returns the number of projects updated.
+def recount_projects(db, project_ids=None, now: datetime | None = None) -> int:
+    now = now or datetime.utcnow()
+
+    def count_where(*conditions):
+        return (
+            select(func.count(Task.id))
+            .where(Task.project_id == Project.id, *conditions)
+            .scalar_subquery()
+        )
+
+    values = {
+        "task_count": count_where(),
+        "overdue_count": count_where(
+            Task.due_date < now, Task.status != TaskStatus.DONE.value
+        ),
+        "overdue_as_of": now,
+        "revision": Project.revision + 1,
+    }
+    for status, column in STATUS_COUNTERS.items():
+        values[column] = count_where(Task.status == status)
+
+    stmt = update(Project).values(**values)
+    if project_ids is not None:
+        stmt = stmt.where(Project.id.in_(project_ids))
+
+    result = db.execute(stmt.execution_options(synchronize_session=False))
+    return result.rowcount
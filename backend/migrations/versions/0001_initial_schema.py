@@ -0,0 +1,129 @@
+"""initial schema
+
+Databases created before migrations existed (via Base.metadata.create_all)
+already have these tables; they are skipped so such databases can be
+upgraded in place without a manual `alembic stamp`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "roles" not in existing:
+        op.create_table(
+            "roles",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("description", sa.String(), nullable=True),
+            sa.PrimaryKeyConstraint("id", name="roles_pkey"),
+            sa.UniqueConstraint("name", name="roles_name_key"),
+        )
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("role_id", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["role_id"], ["roles.id"], name="users_role_id_fkey"
+            ),
+            sa.PrimaryKeyConstraint("id", name="users_pkey"),
+            sa.UniqueConstraint("email", name="users_email_key"),
+        )
+
+    if "projects" not in existing:
+        op.create_table(
+            "projects",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("start_date", sa.DateTime(), nullable=True),
+            sa.Column("end_date", sa.DateTime(), nullable=True),
+            sa.Column("created_by_id", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["created_by_id"], ["users.id"], name="projects_created_by_id_fkey"
+            ),
+            sa.PrimaryKeyConstraint("id", name="projects_pkey"),
+        )
+
+    if "project_members" not in existing:
+        op.create_table(
+            "project_members",
+            sa.Column("project_id", sa.String(), nullable=False),
+            sa.Column("user_id", sa.String(), nullable=False),
+            sa.Column("role", sa.String(), nullable=True),
+            sa.Column("joined_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["project_id"],
+                ["projects.id"],
+                name="project_members_project_id_fkey",
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["users.id"], name="project_members_user_id_fkey"
+            ),
+            sa.PrimaryKeyConstraint(
+                "project_id", "user_id", name="project_members_pkey"
+            ),
+        )
+
+    if "tasks" not in existing:
+        op.create_table(
+            "tasks",
+            sa.Column("id", sa.String(), nullable=False),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("due_date", sa.DateTime(), nullable=True),
+            sa.Column("status", sa.String(), nullable=True),
+            sa.Column("project_id", sa.String(), nullable=False),
+            sa.Column("created_by_id", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["created_by_id"], ["users.id"], name="tasks_created_by_id_fkey"
+            ),
+            sa.ForeignKeyConstraint(
+                ["project_id"], ["projects.id"], name="tasks_project_id_fkey"
+            ),
+            sa.PrimaryKeyConstraint("id", name="tasks_pkey"),
+        )
+
+    if "task_assignees" not in existing:
+        op.create_table(
+            "task_assignees",
+            sa.Column("task_id", sa.String(), nullable=False),
+            sa.Column("user_id", sa.String(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["task_id"], ["tasks.id"], name="task_assignees_task_id_fkey"
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_id"], ["users.id"], name="task_assignees_user_id_fkey"
+            ),
+            sa.PrimaryKeyConstraint("task_id", "user_id", name="task_assignees_pkey"),
+        )
+
+
+def downgrade():
+    op.drop_table("task_assignees")
+    op.drop_table("tasks")
+    op.drop_table("project_members")
+    op.drop_table("projects")
+    op.drop_table("users")
+    op.drop_table("roles")
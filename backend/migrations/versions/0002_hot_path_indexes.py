@@ -0,0 +1,61 @@
+"""hot path indexes
+
+On PostgreSQL the indexes are built CONCURRENTLY so a live database can be
+upgraded without blocking writes.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    # /api/tasks/my, remove-member and delete-user checks
+    ("ix_task_assignees_user_id_task_id", "task_assignees", ["user_id", "task_id"]),
+    # list_projects and every membership check
+    (
+        "ix_project_members_user_id_project_id",
+        "project_members",
+        ["user_id", "project_id"],
+    ),
+    # project detail, status counts and the remove-member check
+    ("ix_tasks_project_id_status", "tasks", ["project_id", "status"]),
+    # timeline validation and due-date filters within a project
+    ("ix_tasks_project_id_due_date", "tasks", ["project_id", "due_date"]),
+    ("ix_tasks_created_by_id", "tasks", ["created_by_id"]),
+    ("ix_projects_created_by_id", "projects", ["created_by_id"]),
+    # keyset pagination on (created_at, id)
+    ("ix_projects_created_at_id", "projects", ["created_at", "id"]),
+    ("ix_users_created_at_id", "users", ["created_at", "id"]),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,31 @@
+"""project revision and updated_at backfill
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "projects",
+        sa.Column("revision", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # updated_at was never written before; start it at created_at
+    op.execute("UPDATE projects SET updated_at = created_at WHERE updated_at IS NULL")
+    op.execute("UPDATE tasks SET updated_at = created_at WHERE updated_at IS NULL")
+
+
+def downgrade():
+    with op.batch_alter_table("projects") as batch_op:
+        batch_op.drop_column("revision")
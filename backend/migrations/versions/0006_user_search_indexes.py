@@ -0,0 +1,50 @@
+"""user search indexes
+
+Expression indexes on lower(name) and lower(email) back the prefix search
+in /api/users/lookup. On PostgreSQL they use text_pattern_ops so LIKE
+'abc%' can use them under any collation, and are built CONCURRENTLY.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_users_lower_name", "name"),
+    ("ix_users_lower_email", "email"),
+]
+
+
+def upgrade():
+    ops = " text_pattern_ops" if op.get_bind().dialect.name == "postgresql" else ""
+
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.create_index(
+                name,
+                "users",
+                [sa.text(f"lower({column}){ops}")],
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="users",
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
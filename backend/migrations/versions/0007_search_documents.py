@@ -0,0 +1,99 @@
+"""search documents and full-text index
+
+Creates search_documents with its dialect-specific text index (FTS5 plus
+sync triggers on SQLite, a tsvector GIN index on PostgreSQL) and backfills
+it from existing projects and tasks.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+FTS_TABLE = "search_documents_fts"
+
+SQLITE_FTS_DDL = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    "title, body, content='search_documents', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    "CREATE TRIGGER search_documents_ai AFTER INSERT ON search_documents BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+    "CREATE TRIGGER search_documents_ad AFTER DELETE ON search_documents BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); END",
+    "CREATE TRIGGER search_documents_au AFTER UPDATE ON search_documents BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+]
+
+SEARCH_VECTOR = sa.text(
+    "(setweight(to_tsvector('english'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, body), 'B'))"
+)
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    op.create_table(
+        "search_documents",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("entity_id", sa.String(), nullable=False),
+        sa.Column("project_id", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("id", name="search_documents_pkey"),
+        sa.UniqueConstraint("entity", "entity_id", name="search_documents_entity_key"),
+    )
+    op.create_index(
+        "ix_search_documents_project_id", "search_documents", ["project_id"]
+    )
+
+    if dialect == "sqlite":
+        # Triggers fill the FTS table during the backfill below
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+
+    op.execute(
+        "INSERT INTO search_documents (entity, entity_id, project_id, title, body) "
+        "SELECT 'project', id, id, name, COALESCE(description, '') FROM projects"
+    )
+    op.execute(
+        "INSERT INTO search_documents (entity, entity_id, project_id, title, body) "
+        "SELECT 'task', id, project_id, title, COALESCE(description, '') FROM tasks"
+    )
+
+    if dialect == "postgresql":
+        # Built after the backfill: one pass instead of per-row updates
+        op.create_index(
+            "ix_search_documents_vector",
+            "search_documents",
+            [SEARCH_VECTOR],
+            postgresql_using="gin",
+        )
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        op.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+    if dialect == "postgresql":
+        op.drop_index("ix_search_documents_vector", table_name="search_documents")
+
+    op.drop_index("ix_search_documents_project_id", table_name="search_documents")
+    op.drop_table("search_documents")
@@ -0,0 +1,51 @@
+"""on delete cascade for project children
+
+Deleting a project removes its memberships and tasks, and deleting a task
+removes its assignees, in the database. SQLite rebuilds each table in
+batch mode to change the constraint. Databases created by create_all before
+the naming convention existed have unnamed foreign keys there; batch mode
+names them by the same convention when it reflects the table, so they can
+be matched and dropped.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+# (table, constraint, column, referenced table)
+FOREIGN_KEYS = [
+    ("project_members", "project_members_project_id_fkey", "project_id", "projects"),
+    ("tasks", "tasks_project_id_fkey", "project_id", "projects"),
+    ("task_assignees", "task_assignees_task_id_fkey", "task_id", "tasks"),
+]
+
+# The models' foreign-key convention (PostgreSQL's default names)
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+
+def replace_foreign_keys(ondelete):
+    for table, name, column, referent in FOREIGN_KEYS:
+        with op.batch_alter_table(
+            table, naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(
+                name, referent, [column], ["id"], ondelete=ondelete
+            )
+
+
+def upgrade():
+    replace_foreign_keys("CASCADE")
+
+
+def downgrade():
+    replace_foreign_keys(None)
@@ -0,0 +1,58 @@
+"""project task counters
+
+Adds the per-project task counters and fills them from the tasks table,
+taking the overdue snapshot at upgrade time.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+# column -> extra condition on the project's tasks
+COUNTERS = {
+    "task_count": "",
+    "new_count": "AND tasks.status = 'New'",
+    "in_progress_count": "AND tasks.status = 'In Progress'",
+    "blocked_count": "AND tasks.status = 'Blocked'",
+    "done_count": "AND tasks.status = 'Done'",
+    "overdue_count": "AND tasks.due_date < :now AND tasks.status != 'Done'",
+}
+
+
+def upgrade():
+    with op.batch_alter_table("projects") as batch_op:
+        for column in COUNTERS:
+            batch_op.add_column(
+                sa.Column(column, sa.Integer(), nullable=False, server_default="0")
+            )
+        batch_op.add_column(sa.Column("overdue_as_of", sa.DateTime(), nullable=True))
+
+    assignments = ", ".join(
+        f"{column} = (SELECT COUNT(*) FROM tasks "
+        f"WHERE tasks.project_id = projects.id {condition})"
+        for column, condition in COUNTERS.items()
+    )
+    op.execute(
+        sa.text(f"UPDATE projects SET {assignments}, overdue_as_of = :now").bindparams(
+            now=datetime.utcnow()
+        )
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("projects") as batch_op:
+        batch_op.drop_column("overdue_as_of")
+        for column in reversed(list(COUNTERS)):
+            batch_op.drop_column(column)
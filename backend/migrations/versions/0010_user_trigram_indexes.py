@@ -0,0 +1,59 @@
+"""user substring search indexes
+
+Trigram GIN indexes on lower(name) and lower(email) serve the substring
+top-up in /api/users/lookup (LIKE '%abc%'), which B-tree indexes cannot.
+PostgreSQL only: enables pg_trgm (a trusted extension, so the database
+owner can create it) and builds the indexes CONCURRENTLY. SQLite keeps
+scanning for substring matches.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_users_lower_name_trgm", "name"),
+    ("ix_users_lower_email_trgm", "email"),
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.create_index(
+                name,
+                "users",
+                [sa.text(f"lower({column}) gin_trgm_ops")],
+                if_not_exists=True,
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="users",
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,67 @@
+"""created_at not null
+
+Keyset pagination orders and seeks by (created_at, id), and the cursor
+encodes created_at, so it must always be set. Rows written before the
+column had a default are backfilled (from updated_at where there is one)
+and the column becomes NOT NULL on projects, tasks and users.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+"""
+
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+# table -> backfill expression
+BACKFILLS = {
+    "projects": "COALESCE(updated_at, :now)",
+    "tasks": "COALESCE(updated_at, :now)",
+    "users": ":now",
+}
+
+# SQLite rebuilds users in batch mode and cannot reflect these (0006)
+USER_EXPRESSION_INDEXES = [
+    ("ix_users_lower_name", "name"),
+    ("ix_users_lower_email", "email"),
+]
+
+
+def set_nullable(nullable):
+    for table in BACKFILLS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "created_at", existing_type=sa.DateTime(), nullable=nullable
+            )
+
+    if op.get_bind().dialect.name == "sqlite":
+        for name, column in USER_EXPRESSION_INDEXES:
+            op.create_index(
+                name, "users", [sa.text(f"lower({column})")], if_not_exists=True
+            )
+
+
+def upgrade():
+    now = datetime.utcnow()
+
+    for table, value in BACKFILLS.items():
+        op.execute(
+            sa.text(
+                f"UPDATE {table} SET created_at = {value} WHERE created_at IS NULL"
+            ).bindparams(now=now)
+        )
+
+    set_nullable(False)
+
+
+def downgrade():
+    set_nullable(True)
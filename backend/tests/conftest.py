@@ -0,0 +1,127 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.deps import get_async_db, get_db
+from app.core.security import create_access_token, principal_cache
+from app.db.base import Base
+from app.db.session import enable_sqlite_foreign_keys
+from app.main import app
+from app.models.role import Role
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "test.db"
+
+
+@pytest.fixture
+def engine(db_path):
+    engine = create_engine(f"sqlite:///{db_path}", future=True)
+    enable_sqlite_foreign_keys(engine)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def async_engine(engine, db_path):
+    # Same database file, reached through the aiosqlite driver
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    enable_sqlite_foreign_keys(async_engine.sync_engine)
+    return async_engine
+
+
+@pytest.fixture
+def db(engine, async_engine):
+    TestingSession = sessionmaker(bind=engine, autoflush=False, future=True)
+    AsyncTestingSession = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    def override_get_db():
+        session = TestingSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    async def override_get_async_db():
+        async with AsyncTestingSession() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    session = TestingSession()
+    yield session
+    session.close()
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def client(db):
+    return TestClient(app)
+
+
+@pytest.fixture
+def query_counter(engine, async_engine):
+    """Counts SQL statements sent to the test database by either engine."""
+
+    class Counter:
+        count = 0
+
+    counter = Counter()
+
+    def on_execute(*args):
+        counter.count += 1
+
+    engines = [engine, async_engine.sync_engine]
+    for target in engines:
+        event.listen(target, "before_cursor_execute", on_execute)
+    yield counter
+    for target in engines:
+        event.remove(target, "before_cursor_execute", on_execute)
+
+
+@pytest.fixture
+def roles(db):
+    roles = {
+        "Admin": Role(name="Admin"),
+        "Task Creator": Role(name="Task Creator"),
+        "Read-Only": Role(name="Read-Only"),
+    }
+    db.add_all(roles.values())
+    db.commit()
+    return roles
+
+
+@pytest.fixture
+def make_user(db, roles):
+    def _make_user(name, role="Task Creator"):
+        user = User(
+            name=name,
+            email=f"{name.lower()}@example.com",
+            role_id=roles[role].id,
+        )
+        db.add(user)
+        db.commit()
+        return user
+
+    return _make_user
+
+
+def auth_headers(user):
+    token = create_access_token({"sub": str(user.id)})
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,126 @@
+import pytest
+from sqlalchemy import event
+
+from app.api import changes
+from app.models.project import Project
+from tests.conftest import auth_headers
+from tests.test_projects import create_projects
+
+
+@pytest.fixture(autouse=True)
+def no_settle_window(monkeypatch):
+    monkeypatch.setattr(changes, "CHANGE_FEED_SETTLE_SECONDS", -1)
+
+
+def feed(client, user, since=None, **params):
+    if since is not None:
+        params["since"] = since
+    response = client.get("/api/changes", params=params, headers=auth_headers(user))
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_change_feed_returns_collapsed_deltas_and_tombstones(client, db, make_user):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    outsider = make_user("Outsider")
+    create_projects(db, owner, [member], 1)
+    project_id = db.query(Project).first().id
+    headers = auth_headers(owner)
+
+    cursor = feed(client, member)["next_cursor"]
+
+    kept = client.post(
+        "/api/tasks/",
+        json={"project_id": project_id, "title": "Keep"},
+        headers=headers,
+    ).json()["id"]
+    client.put(f"/api/tasks/{kept}", json={"status": "Done"}, headers=headers)
+
+    dropped = client.post(
+        "/api/tasks/",
+        json={"project_id": project_id, "title": "Drop"},
+        headers=headers,
+    ).json()["id"]
+    client.delete(f"/api/tasks/{dropped}", headers=headers)
+
+    body = feed(client, member, cursor)
+    assert [(c["entity"], c["op"], c["id"]) for c in body["changes"]] == [
+        ("task", "upsert", kept),
+        ("task", "delete", dropped),
+    ]
+    assert body["changes"][0]["data"]["status"] == "Done"
+    assert body["has_more"] is False
+
+    # Nothing new past the returned cursor; outsiders see nothing at all
+    assert feed(client, member, body["next_cursor"])["changes"] == []
+    assert feed(client, outsider, cursor)["changes"] == []
+
+    # A removed member still gets the tombstone for their own membership
+    client.delete(f"/api/projects/{project_id}/members/{member.id}", headers=headers)
+    body = feed(client, member, body["next_cursor"])
+    assert [(c["entity"], c["op"], c["id"]) for c in body["changes"]] == [
+        ("member", "delete", member.id)
+    ]
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_change_feed_tells_members_their_project_was_deleted(
+    client, db, engine, make_user, background
+):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    create_projects(db, owner, [member], 1)
+    project_id = db.query(Project).first().id
+    cursors = {user.id: feed(client, user)["next_cursor"] for user in (owner, member)}
+
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement.split()[0:3])
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.delete(
+            f"/api/projects/{project_id}",
+            params={"background": background},
+            headers=auth_headers(owner),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert response.status_code == (202 if background else 200)
+
+    # The cascade runs before the tombstones take their change-log ids, so
+    # the window before commit is short whatever the size of the project
+    project_delete = statements.index(["DELETE", "FROM", "projects"])
+    log_insert = statements.index(["INSERT", "INTO", "change_log"])
+    assert project_delete < log_insert
+
+    for user in (owner, member):
+        body = feed(client, user, cursors[user.id])
+        assert [
+            (c["entity"], c["op"], c["id"], c["project_id"]) for c in body["changes"]
+        ] == [("member", "delete", user.id, project_id)]
+
+
+def test_change_feed_pages_by_cursor(client, db, make_user):
+    owner = make_user("Owner")
+    create_projects(db, owner, [], 1)
+    project_id = db.query(Project).first().id
+    cursor = feed(client, owner)["next_cursor"]
+
+    tasks = [{"project_id": project_id, "title": f"T{i}"} for i in range(5)]
+    client.post("/api/tasks/bulk", json={"tasks": tasks}, headers=auth_headers(owner))
+
+    first = feed(client, owner, cursor, limit=3)
+    assert len(first["changes"]) == 3
+    assert first["has_more"] is True
+
+    second = feed(client, owner, first["next_cursor"], limit=3)
+    assert len(second["changes"]) == 2
+    assert second["has_more"] is False
+
+    response = client.get(
+        "/api/changes", params={"since": "abc"}, headers=auth_headers(owner)
+    )
+    assert response.status_code == 400
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+
+from app.api import dashboard
+from app.models.project import Project
+from app.models.task import Task, TaskAssignee
+from tests.conftest import auth_headers
+from tests.test_projects import create_projects
+
+
+def assign_tasks(db, project, owner, user, count, **fields):
+    for i in range(count):
+        task = Task(
+            title=f"Task {i}", project_id=project.id, created_by_id=owner.id, **fields
+        )
+        db.add(task)
+        db.flush()
+        db.add(TaskAssignee(task_id=task.id, user_id=user.id))
+    db.commit()
+
+
+def test_dashboard_is_one_constant_cost_call(client, db, make_user, query_counter):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    others = [make_user(f"Other{i}") for i in range(3)]
+    headers = auth_headers(member)
+
+    create_projects(db, owner, [member, *others], 2)
+    project = db.query(Project).first()
+    soon = datetime.utcnow() + timedelta(days=2)
+    assign_tasks(db, project, owner, member, 2, due_date=soon)
+
+    query_counter.count = 0
+    response = client.get("/api/dashboard", headers=headers)
+    assert response.status_code == 200
+    small = query_counter.count
+
+    create_projects(db, owner, [member, *others], 10)
+    later = datetime.utcnow() + timedelta(days=30)
+    assign_tasks(db, project, owner, member, 5, due_date=later)
+    assign_tasks(db, project, owner, member, 3, due_date=soon, status="Done")
+
+    query_counter.count = 0
+    response = client.get("/api/dashboard", headers=headers)
+    assert response.status_code == 200
+    assert query_counter.count <= small
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    body = response.json()
+    assert len(body["projects"]) == 12
+    assert len(body["due_soon"]) == 2
+    assert body["status_totals"]["New"] == 7
+    assert body["status_totals"]["Done"] == 3
+
+    card = next(p for p in body["projects"] if p["task_counts"]["total"])
+    assert card["task_counts"]["total"] == 10
+    assert len(card["members"]) == 5
+
+
+def test_dashboard_revalidates_and_changes_with_task_writes(
+    client, db, make_user, monkeypatch
+):
+    # Keep the tag's minute bucket fixed for the test
+    frozen = datetime.utcnow()
+    monkeypatch.setattr(
+        dashboard, "datetime", type("Frozen", (datetime,), {"utcnow": lambda: frozen})
+    )
+
+    owner = make_user("Owner")
+    headers = auth_headers(owner)
+    create_projects(db, owner, [], 1)
+    project = db.query(Project).first()
+
+    response = client.get("/api/dashboard", headers=headers)
+    etag = response.headers["etag"]
+
+    cached = client.get("/api/dashboard", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+
+    client.post(
+        "/api/tasks/", json={"project_id": project.id, "title": "New"}, headers=headers
+    )
+
+    response = client.get("/api/dashboard", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["projects"][0]["task_counts"]["total"] == 1
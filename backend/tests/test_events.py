@@ -0,0 +1,66 @@
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.security import create_access_token
+from app.models.project import Project
+from app.services.events import broker
+from tests.conftest import auth_headers
+from tests.test_projects import create_projects
+
+
+def events_url(project_id, user):
+    token = create_access_token({"sub": str(user.id)})
+    return f"/api/events/projects/{project_id}?token={token}"
+
+
+def test_members_receive_task_and_member_deltas(client, db, make_user):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    create_projects(db, owner, [member], 1)
+    project_id = db.query(Project).first().id
+    headers = auth_headers(owner)
+
+    with client.websocket_connect(events_url(project_id, member)) as ws:
+        response = client.post(
+            "/api/tasks/",
+            json={"project_id": project_id, "title": "Ship", "assignees": [member.id]},
+            headers=headers,
+        )
+        task_id = response.json()["id"]
+
+        event = ws.receive_json()
+        assert event["type"] == "task.created"
+        assert event["data"]["tasks"][0]["assignees"] == [member.id]
+
+        client.put(f"/api/tasks/{task_id}", json={"status": "Done"}, headers=headers)
+        event = ws.receive_json()
+        assert event["type"] == "task.updated"
+        assert event["data"]["fields"] == {"status": "Done"}
+
+        # Losing membership ends the subscription
+        client.delete(
+            f"/api/projects/{project_id}/members/{member.id}", headers=headers
+        )
+        event = ws.receive_json()
+        assert event["type"] == "member.removed"
+
+        with pytest.raises(WebSocketDisconnect):
+            ws.receive_json()
+
+    assert broker.subscriber_count(project_id) == 0
+
+
+def test_non_members_and_bad_tokens_are_rejected(client, db, make_user):
+    owner = make_user("Owner")
+    outsider = make_user("Outsider")
+    create_projects(db, owner, [], 1)
+    project_id = db.query(Project).first().id
+
+    for url in (
+        events_url(project_id, outsider),
+        f"/api/events/projects/{project_id}?token=garbage",
+    ):
+        with pytest.raises(WebSocketDisconnect) as exc:
+            with client.websocket_connect(url):
+                pass
+        assert exc.value.code == 1008
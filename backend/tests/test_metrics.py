@@ -0,0 +1,38 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.db.pool_metrics import PoolMetrics, instrument_pool_class
+from tests.conftest import auth_headers
+
+
+def test_instrumented_pool_records_checkouts(tmp_path):
+    metrics = PoolMetrics()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrument_pool_class(QueuePool, metrics),
+        pool_size=2,
+    )
+
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    stats = metrics.snapshot(engine.pool)
+    engine.dispose()
+
+    assert stats["checkouts"] == 3
+    assert stats["checkout_latency_histogram"]["le_inf"] == 3
+    assert stats["size"] == 2
+    assert stats["checkedout"] == 0
+
+
+def test_pool_metrics_endpoint_is_admin_only(client, make_user):
+    admin = make_user("Admin", role="Admin")
+    user = make_user("Worker")
+
+    response = client.get("/api/metrics/pool", headers=auth_headers(user))
+    assert response.status_code == 403
+
+    response = client.get("/api/metrics/pool", headers=auth_headers(admin))
+    assert response.status_code == 200
+    assert set(response.json()) == {"config", "sync", "async"}
@@ -0,0 +1,128 @@
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    MetaData,
+    String,
+    Table,
+    Text,
+    create_engine,
+    inspect,
+    text,
+)
+
+from app.db.base import Base
+from app.db.migrations import include_name, upgrade_database
+
+
+def test_migrations_match_models(tmp_path):
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    upgrade_database(url)
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn, opts={"include_name": include_name})
+        diff = compare_metadata(context, Base.metadata)
+    engine.dispose()
+
+    assert diff == []
+
+
+def create_pre_migration_schema(engine):
+    """The schema create_all built before migrations: unnamed constraints."""
+    metadata = MetaData()
+    Table(
+        "roles",
+        metadata,
+        Column("id", String, primary_key=True),
+        Column("name", String, unique=True, nullable=False),
+        Column("description", String),
+    )
+    Table(
+        "users",
+        metadata,
+        Column("id", String, primary_key=True),
+        Column("email", String, unique=True, nullable=False),
+        Column("name", String, nullable=False),
+        Column("role_id", String, ForeignKey("roles.id")),
+        Column("created_at", DateTime),
+    )
+    Table(
+        "projects",
+        metadata,
+        Column("id", String, primary_key=True),
+        Column("name", String, nullable=False),
+        Column("description", Text),
+        Column("start_date", DateTime),
+        Column("end_date", DateTime),
+        Column("created_by_id", String, ForeignKey("users.id"), nullable=False),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+    )
+    Table(
+        "project_members",
+        metadata,
+        Column("project_id", String, ForeignKey("projects.id"), primary_key=True),
+        Column("user_id", String, ForeignKey("users.id"), primary_key=True),
+        Column("role", String),
+        Column("joined_at", DateTime),
+    )
+    Table(
+        "tasks",
+        metadata,
+        Column("id", String, primary_key=True),
+        Column("title", String, nullable=False),
+        Column("description", Text),
+        Column("due_date", DateTime),
+        Column("status", String),
+        Column("project_id", String, ForeignKey("projects.id"), nullable=False),
+        Column("created_by_id", String, ForeignKey("users.id"), nullable=False),
+        Column("created_at", DateTime),
+        Column("updated_at", DateTime),
+    )
+    Table(
+        "task_assignees",
+        metadata,
+        Column("task_id", String, ForeignKey("tasks.id"), primary_key=True),
+        Column("user_id", String, ForeignKey("users.id"), primary_key=True),
+    )
+    metadata.create_all(engine)
+
+
+def test_migrations_upgrade_a_pre_migration_database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    engine = create_engine(url)
+    create_pre_migration_schema(engine)
+    with engine.begin() as conn:
+        # Written before created_at had a default
+        conn.execute(text("INSERT INTO users (id, email, name) VALUES ('u', 'e', 'n')"))
+
+    upgrade_database(url)
+
+    inspector = inspect(engine)
+    foreign_keys = {
+        fk["name"]: fk["options"].get("ondelete")
+        for fk in inspector.get_foreign_keys("tasks")
+    }
+    with engine.connect() as conn:
+        user_indexes = {
+            name
+            for (name,) in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE tbl_name = 'users'")
+            )
+        }
+        missing_created_at = conn.execute(
+            text("SELECT COUNT(*) FROM users WHERE created_at IS NULL")
+        ).scalar()
+    engine.dispose()
+
+    # Backfilled for keyset cursors; rebuilding users kept its search indexes
+    assert missing_created_at == 0
+    assert {"ix_users_lower_name", "ix_users_lower_email"} <= user_indexes
+
+    assert foreign_keys == {
+        "tasks_project_id_fkey": "CASCADE",
+        "tasks_created_by_id_fkey": None,
+    }
@@ -0,0 +1,509 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from app.api import projects
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.task import Task, TaskAssignee
+from app.services.task_counters import recount_projects
+from tests.conftest import auth_headers
+
+
+def create_projects(db, owner, members, count):
+    start = datetime.utcnow()
+
+    for i in range(count):
+        project = Project(
+            name=f"Project {i}",
+            created_by_id=owner.id,
+            start_date=start,
+            end_date=start + timedelta(days=30),
+        )
+        db.add(project)
+        db.flush()
+
+        db.add(ProjectMember(project_id=project.id, user_id=owner.id, role="Owner"))
+        for member in members:
+            db.add(ProjectMember(project_id=project.id, user_id=member.id))
+
+    db.commit()
+
+
+def test_list_projects_query_count_is_constant(client, db, make_user, query_counter):
+    admin = make_user("Admin", role="Admin")
+    members = [make_user(f"Member{i}") for i in range(5)]
+
+    headers = auth_headers(admin)
+
+    create_projects(db, admin, members, 2)
+    query_counter.count = 0
+    response = client.get("/api/projects/", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    small = query_counter.count
+
+    create_projects(db, admin, members, 20)
+    query_counter.count = 0
+    response = client.get("/api/projects/", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 22
+
+    # principal (cached after the first call) + projects + creators
+    # + members + member users
+    assert query_counter.count <= 5
+    assert query_counter.count <= small
+
+
+def test_list_projects_only_returns_memberships(client, db, make_user):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    outsider = make_user("Outsider")
+
+    create_projects(db, owner, [member], 3)
+
+    response = client.get("/api/projects/", headers=auth_headers(member))
+    assert response.status_code == 200
+    projects = response.json()
+    assert len(projects) == 3
+    assert {m["name"] for m in projects[0]["members"]} == {"Owner", "Member"}
+    assert projects[0]["created_by"]["id"] == owner.id
+
+    response = client.get("/api/projects/", headers=auth_headers(outsider))
+    assert response.json() == []
+
+
+def test_project_detail_inlines_assignees_with_constant_queries(
+    client, db, make_user, query_counter
+):
+    owner = make_user("Owner")
+    members = [make_user(f"Member{i}") for i in range(3)]
+    headers = auth_headers(owner)
+    create_projects(db, owner, members, 1)
+    project = db.query(Project).first()
+
+    def add_tasks(count):
+        for i in range(count):
+            task = Task(
+                title=f"Task {i}", project_id=project.id, created_by_id=owner.id
+            )
+            db.add(task)
+            db.flush()
+            for member in members:
+                db.add(TaskAssignee(task_id=task.id, user_id=member.id))
+        db.commit()
+
+    add_tasks(2)
+    query_counter.count = 0
+    response = client.get(f"/api/projects/{project.id}", headers=headers)
+    assert response.status_code == 200
+    small = query_counter.count
+
+    add_tasks(25)
+    query_counter.count = 0
+    response = client.get(f"/api/projects/{project.id}", headers=headers)
+    assert response.status_code == 200
+    assert query_counter.count <= small
+
+    body = response.json()
+    assert len(body["tasks"]) == 27
+    assignee = body["tasks"][0]["assignees"][0]
+    assert assignee["name"].startswith("Member")
+    assert assignee["email"].endswith("@example.com")
+
+
+def test_only_owner_can_remove_members(client, db, make_user):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    other = make_user("Other")
+    create_projects(db, owner, [member, other], 1)
+    project = db.query(Project).first()
+    url = f"/api/projects/{project.id}/members/{other.id}"
+
+    assert client.delete(url, headers=auth_headers(member)).status_code == 403
+    assert client.delete(url, headers=auth_headers(owner)).status_code == 200
+    assert client.delete(url, headers=auth_headers(owner)).status_code == 404
+
+
+def test_timeline_and_member_checks_report_offending_counts(client, db, make_user):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    create_projects(db, owner, [member], 1)
+    project = db.query(Project).first()
+    headers = auth_headers(owner)
+
+    for days in (1, 20, 25):
+        task = Task(
+            title=f"Due in {days}",
+            project_id=project.id,
+            created_by_id=owner.id,
+            due_date=project.start_date + timedelta(days=days),
+        )
+        db.add(task)
+        db.flush()
+        db.add(TaskAssignee(task_id=task.id, user_id=member.id))
+    db.commit()
+
+    url = f"/api/projects/{project.id}"
+    end = project.start_date + timedelta(days=10)
+    response = client.put(
+        url, json={"name": "Renamed", "end_date": end.isoformat()}, headers=headers
+    )
+    assert response.status_code == 400
+    assert "2 task(s)" in response.json()["detail"]
+
+    end = project.start_date + timedelta(days=25)
+    response = client.put(
+        url, json={"name": "Renamed", "end_date": end.isoformat()}, headers=headers
+    )
+    assert response.status_code == 200
+
+    response = client.delete(f"{url}/members/{member.id}", headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "User has 3 active task(s)"
+
+
+def test_create_project_inserts_members_in_one_batch(
+    client, db, make_user, query_counter
+):
+    owner = make_user("Owner")
+    members = [make_user(f"Member{i}") for i in range(10)]
+    headers = auth_headers(owner)
+    payload = {
+        "name": "Batch",
+        "member_ids": [m.id for m in members] + [owner.id, members[0].id],
+        "start_date": "2024-01-01T00:00:00",
+        "end_date": "2024-02-01T00:00:00",
+    }
+
+    query_counter.count = 0
+    response = client.post("/api/projects/", json=payload, headers=headers)
+    assert response.status_code == 200
+    # auth + user check + project + one member batch + search document +
+    # two change-log batches + the reload (project, creator, members and
+    # their users), independent of the number of members
+    assert query_counter.count <= 12
+
+    # Same shape as the list; internal columns stay server-side
+    body = response.json()
+    assert len(body["members"]) == 11
+    assert body["task_counts"]["total"] == 0
+    assert "revision" not in body and "task_count" not in body
+
+    project = db.query(Project).filter(Project.name == "Batch").one()
+    assert db.query(ProjectMember).filter_by(project_id=project.id).count() == 11
+
+    payload["member_ids"] = ["missing"]
+    response = client.post("/api/projects/", json=payload, headers=headers)
+    assert response.status_code == 400
+
+
+def test_bulk_members_is_atomic_and_reports_skips(client, db, make_user):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    busy = make_user("Busy")
+    newcomer = make_user("Newcomer")
+    create_projects(db, owner, [member, busy], 1)
+    project = db.query(Project).first()
+
+    task = Task(title="Open", project_id=project.id, created_by_id=owner.id)
+    db.add(task)
+    db.flush()
+    db.add(TaskAssignee(task_id=task.id, user_id=busy.id))
+    db.commit()
+
+    url = f"/api/projects/{project.id}/members/bulk"
+    headers = auth_headers(owner)
+
+    response = client.post(
+        url, json={"add": [newcomer.id], "remove": [busy.id]}, headers=headers
+    )
+    assert response.status_code == 400
+    assert busy.id in response.json()["detail"]
+    assert db.query(ProjectMember).filter_by(user_id=newcomer.id).count() == 0
+
+    response = client.post(
+        url,
+        json={"add": [newcomer.id, member.id], "remove": [member.id]},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        url,
+        json={"add": [newcomer.id, busy.id], "remove": [member.id]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "added": [newcomer.id],
+        "removed": [member.id],
+        "skipped": [busy.id],
+    }
+
+    response = client.post(url, json={"remove": [owner.id]}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_project_stats_are_aggregated_in_sql(client, db, make_user, query_counter):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    outsider = make_user("Outsider")
+    create_projects(db, owner, [member], 2)
+    first, second = db.query(Project).order_by(Project.name).all()
+
+    past = datetime.utcnow() - timedelta(days=1)
+    tasks = [
+        Task(title="a", project_id=first.id, created_by_id=owner.id, status="Done"),
+        Task(title="b", project_id=first.id, created_by_id=owner.id, due_date=past),
+        Task(title="c", project_id=first.id, created_by_id=owner.id, status="New"),
+        Task(title="d", project_id=second.id, created_by_id=owner.id, status="New"),
+    ]
+    db.add_all(tasks)
+    db.flush()
+    db.add_all(
+        [
+            TaskAssignee(task_id=tasks[0].id, user_id=member.id),
+            TaskAssignee(task_id=tasks[1].id, user_id=member.id),
+            TaskAssignee(task_id=tasks[1].id, user_id=owner.id),
+        ]
+    )
+    db.commit()
+
+    headers = auth_headers(member)
+    url = f"/api/projects/{first.id}/stats"
+    query_counter.count = 0
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    assert query_counter.count <= 5
+
+    stats = response.json()
+    assert stats["total"] == 3
+    assert stats["by_status"] == {"New": 2, "In Progress": 0, "Blocked": 0, "Done": 1}
+    assert stats["overdue"] == 1
+    assert stats["unassigned"] == 1
+    assert stats["progress"] == 33
+    assert {w["name"]: (w["total"], w["open"]) for w in stats["workload"]} == {
+        "Member": (2, 1),
+        "Owner": (1, 1),
+    }
+
+    response = client.get("/api/projects/stats", headers=headers)
+    assert response.status_code == 200
+    assert {s["project_id"]: s["total"] for s in response.json()} == {
+        first.id: 3,
+        second.id: 1,
+    }
+
+    response = client.get(
+        "/api/projects/stats",
+        params={"ids": [first.id]},
+        headers=auth_headers(outsider),
+    )
+    assert response.status_code == 403
+
+
+def test_project_reads_answer_304_until_a_write(client, db, make_user):
+    owner = make_user("Owner")
+    newcomer = make_user("Newcomer")
+    create_projects(db, owner, [], 2)
+    project = db.query(Project).first()
+    headers = auth_headers(owner)
+
+    for url in ("/api/projects/", f"/api/projects/{project.id}"):
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        conditional = {**headers, "If-None-Match": etag}
+        response = client.get(url, headers=conditional)
+        assert response.status_code == 304
+        assert response.content == b""
+
+        client.post(
+            f"/api/projects/{project.id}/members",
+            json={"user_id": newcomer.id},
+            headers=headers,
+        )
+        client.delete(
+            f"/api/projects/{project.id}/members/{newcomer.id}", headers=headers
+        )
+
+        response = client.get(url, headers=conditional)
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+def test_large_project_lists_are_gzipped(client, db, make_user):
+    owner = make_user("Owner")
+    members = [make_user(f"Member{i}") for i in range(5)]
+    headers = {**auth_headers(owner), "Accept-Encoding": "gzip"}
+
+    create_projects(db, owner, members, 20)
+    response = client.get("/api/projects/", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 20
+
+    response = client.get("/health", headers=headers)
+    assert "content-encoding" not in response.headers
+
+
+def add_tasks(db, project, creator, assignees, count):
+    for i in range(count):
+        task = Task(title=f"Task {i}", project_id=project.id, created_by_id=creator.id)
+        db.add(task)
+        db.flush()
+        for user in assignees:
+            db.add(TaskAssignee(task_id=task.id, user_id=user.id))
+    db.commit()
+
+
+def test_delete_project_cascades_in_the_database(client, db, make_user, query_counter):
+    owner = make_user("Owner")
+    members = [make_user(f"Member{i}") for i in range(3)]
+    create_projects(db, owner, members, 2)
+    doomed, kept = db.query(Project).order_by(Project.name).all()
+    add_tasks(db, doomed, owner, members, 40)
+    add_tasks(db, kept, owner, members, 2)
+    doomed_id = doomed.id
+    url = f"/api/projects/{doomed_id}"
+    headers = auth_headers(owner)
+
+    query_counter.count = 0
+    assert client.delete(url, headers=headers).status_code == 200
+    # Independent of task count: no child rows are loaded or deleted one by one
+    assert query_counter.count <= 8
+
+    db.expire_all()
+    assert db.query(Task).count() == 2
+    assert db.query(TaskAssignee).count() == 6
+    assert db.query(ProjectMember).filter_by(project_id=doomed_id).count() == 0
+
+
+def test_background_delete_returns_a_job(client, db, make_user, monkeypatch):
+    monkeypatch.setattr(projects, "PROJECT_DELETE_BATCH_SIZE", 7)
+    owner = make_user("Owner")
+    member = make_user("Member")
+    create_projects(db, owner, [member], 1)
+    project = db.query(Project).first()
+    project_id = project.id
+    add_tasks(db, project, owner, [member], 20)
+    headers = auth_headers(owner)
+
+    response = client.delete(
+        f"/api/projects/{project_id}", params={"background": True}, headers=headers
+    )
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    # TestClient runs background tasks before returning the response
+    job = client.get(f"/api/jobs/{job_id}", headers=headers).json()
+    assert job["status"] == "done"
+    assert job["result"] == {"project_id": project_id, "deleted_tasks": 20}
+
+    db.expire_all()
+    assert db.query(Project).count() == 0
+    assert db.query(Task).count() == 0
+    assert db.query(TaskAssignee).count() == 0
+
+    # Only the job's creator (or an admin) can see it
+    response = client.get(f"/api/jobs/{job_id}", headers=auth_headers(member))
+    assert response.status_code == 404
+
+
+def test_task_counters_match_a_recount_and_serve_the_list(
+    client, db, make_user, async_engine
+):
+    owner = make_user("Owner")
+    create_projects(db, owner, [], 1)
+    project = db.query(Project).first()
+    project_id, start = project.id, project.start_date
+    headers = auth_headers(owner)
+
+    def due(days):
+        return (start + timedelta(days=days)).isoformat()
+
+    # Snapshot taken three days in: tasks due before then count as overdue
+    snapshot = start + timedelta(days=3)
+    recount_projects(db, now=snapshot)
+    db.commit()
+
+    ids = [
+        client.post(
+            "/api/tasks/",
+            json={"project_id": project_id, "title": f"T{days}", "due_date": due(days)},
+            headers=headers,
+        ).json()["id"]
+        for days in (1, 2, 5)
+    ]
+    client.post(
+        "/api/tasks/bulk",
+        json={
+            "tasks": [
+                {"project_id": project_id, "title": "B1", "due_date": due(1)},
+                {
+                    "project_id": project_id,
+                    "title": "B2",
+                    "due_date": due(1),
+                    "status": "Done",
+                },
+            ]
+        },
+        headers=headers,
+    )
+    client.put(f"/api/tasks/{ids[0]}", json={"status": "Blocked"}, headers=headers)
+    client.put(f"/api/tasks/{ids[1]}", json={"due_date": due(8)}, headers=headers)
+    client.put(f"/api/tasks/{ids[2]}", json={"status": "Done"}, headers=headers)
+    client.delete(f"/api/tasks/{ids[2]}", headers=headers)
+
+    columns = (
+        "task_count",
+        "new_count",
+        "in_progress_count",
+        "blocked_count",
+        "done_count",
+        "overdue_count",
+    )
+
+    def counters():
+        db.expire_all()
+        project = db.get(Project, project_id)
+        return {column: getattr(project, column) for column in columns}
+
+    maintained = counters()
+    assert maintained == {
+        "task_count": 4,
+        "new_count": 2,
+        "in_progress_count": 0,
+        "blocked_count": 1,
+        "done_count": 1,
+        # T1 (blocked) and B1; B2 is done, T2 moved past the snapshot
+        "overdue_count": 2,
+    }
+
+    recount_projects(db, now=snapshot)
+    db.commit()
+    assert counters() == maintained
+
+    # The list reads the counters and never touches the tasks table
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        body = client.get("/api/projects/", headers=headers).json()
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", capture)
+
+    assert body[0]["task_counts"]["total"] == 4
+    assert body[0]["task_counts"]["by_status"]["Blocked"] == 1
+    assert body[0]["task_counts"]["progress"] == 25
+    assert not any("FROM tasks" in statement for statement in statements)
+
+    # The detail serves the same counters
+    detail = client.get(f"/api/projects/{project_id}", headers=headers).json()
+    assert detail["task_counts"] == body[0]["task_counts"]
+    assert len(detail["tasks"]) == 4
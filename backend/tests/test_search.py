@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+
+from app.models.project import Project
+from app.models.task import Task
+from app.services.search_index import rebuild_search_index
+from tests.conftest import auth_headers
+from tests.test_projects import create_projects
+
+
+def search(client, user, q, **params):
+    response = client.get(
+        "/api/search", params={"q": q, **params}, headers=auth_headers(user)
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def titles(page):
+    return [hit["title"] for hit in page["items"]]
+
+
+def test_search_is_indexed_by_writes_and_scoped_to_members(client, make_user):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    outsider = make_user("Outsider")
+    headers = auth_headers(owner)
+    start = datetime.utcnow()
+
+    project_id = client.post(
+        "/api/projects/",
+        json={
+            "name": "Website redesign",
+            "description": "New landing pages",
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=30)).isoformat(),
+            "member_ids": [member.id],
+        },
+        headers=headers,
+    ).json()["id"]
+
+    task_id = client.post(
+        "/api/tasks/",
+        json={"project_id": project_id, "title": "Draft copy", "description": None},
+        headers=headers,
+    ).json()["id"]
+    client.post(
+        "/api/tasks/bulk",
+        json={
+            "tasks": [
+                {"project_id": project_id, "title": "Review designs"},
+                {
+                    "project_id": project_id,
+                    "title": "Ship it",
+                    "description": "after the design review",
+                },
+            ]
+        },
+        headers=headers,
+    )
+
+    # Prefix terms, all required; title matches rank above body matches
+    assert titles(search(client, member, "desig")) == ["Review designs", "Ship it"]
+    page = search(client, member, "review desig")
+    assert titles(page) == ["Review designs", "Ship it"]
+    assert page["items"][0]["entity"] == "task"
+    assert search(client, member, "landing")["items"][0] == {
+        "entity": "project",
+        "id": project_id,
+        "project_id": project_id,
+        "title": "Website redesign",
+    }
+
+    # Outsiders can't see the project's documents
+    assert search(client, outsider, "review")["items"] == []
+
+    # Updates reindex, deletes remove
+    client.put(f"/api/tasks/{task_id}", json={"title": "Final copy"}, headers=headers)
+    assert titles(search(client, member, "final")) == ["Final copy"]
+    assert search(client, member, "draft")["items"] == []
+
+    client.delete(f"/api/projects/{project_id}", headers=headers)
+    assert search(client, owner, "review")["items"] == []
+
+
+def test_search_paginates_and_ignores_query_syntax(client, make_user):
+    admin = make_user("Admin", role="Admin")
+    headers = auth_headers(admin)
+    start = datetime.utcnow()
+
+    for i in range(5):
+        client.post(
+            "/api/projects/",
+            json={
+                "name": f"Alpha {i}",
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(days=1)).isoformat(),
+            },
+            headers=headers,
+        )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = search(client, admin, "alpha", **params)
+        seen.extend(hit["id"] for hit in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(set(seen)) == 5
+
+    # FTS operators and quotes are treated as plain words
+    assert len(search(client, admin, 'alpha" OR NOT *')["items"]) == 0
+    assert len(search(client, admin, '"alpha*')["items"]) == 5
+    assert search(client, admin, "***")["items"] == []
+
+    response = client.get(
+        "/api/search", params={"q": "a", "cursor": "x"}, headers=headers
+    )
+    assert response.status_code == 400
+
+
+def test_rebuild_indexes_rows_written_outside_the_api(client, db, make_user):
+    owner = make_user("Owner")
+    create_projects(db, owner, [], 2)
+    first, second = db.query(Project).order_by(Project.name).all()
+    db.add(Task(title="Seeded task", project_id=first.id, created_by_id=owner.id))
+    db.commit()
+
+    # Inserted the way seed.py does: not indexed yet
+    assert search(client, owner, "seeded")["items"] == []
+
+    assert rebuild_search_index(db) == 3
+    db.commit()
+    assert titles(search(client, owner, "seeded")) == ["Seeded task"]
+    assert titles(search(client, owner, "project")) == ["Project 0", "Project 1"]
+
+    # A scoped rebuild leaves other projects' documents alone
+    second.name = "Renamed"
+    db.commit()
+    assert rebuild_search_index(db, [second.id]) == 1
+    db.commit()
+    assert titles(search(client, owner, "project")) == ["Project 0"]
+    assert titles(search(client, owner, "renamed")) == ["Renamed"]
@@ -0,0 +1,270 @@
+from datetime import datetime, timedelta, timezone
+
+from app.core.enums import TaskStatus
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.task import Task, TaskAssignee
+from tests.conftest import auth_headers
+
+
+def create_project(db, owner, members=()):
+    start = datetime.utcnow() - timedelta(days=10)
+    project = Project(
+        name="Board",
+        created_by_id=owner.id,
+        start_date=start,
+        end_date=start + timedelta(days=60),
+    )
+    db.add(project)
+    db.flush()
+
+    db.add(ProjectMember(project_id=project.id, user_id=owner.id, role="Owner"))
+    for member in members:
+        db.add(ProjectMember(project_id=project.id, user_id=member.id))
+
+    db.commit()
+    return project
+
+
+def create_task(db, project, creator, assignees=(), **fields):
+    task = Task(project_id=project.id, created_by_id=creator.id, **fields)
+    db.add(task)
+    db.flush()
+
+    for user in assignees:
+        db.add(TaskAssignee(task_id=task.id, user_id=user.id))
+
+    db.commit()
+    return task
+
+
+def test_my_tasks_filters_and_sorts_server_side(client, db, make_user):
+    user = make_user("Worker")
+    headers = auth_headers(user)
+    project = create_project(db, user)
+    other = create_project(db, user)
+    now = datetime.utcnow()
+
+    create_task(
+        db,
+        project,
+        user,
+        [user],
+        title="late",
+        status=TaskStatus.IN_PROGRESS.value,
+        due_date=now - timedelta(days=2),
+    )
+    create_task(
+        db,
+        project,
+        user,
+        [user],
+        title="done late",
+        status=TaskStatus.DONE.value,
+        due_date=now - timedelta(days=3),
+    )
+    create_task(
+        db,
+        project,
+        user,
+        [user],
+        title="soon",
+        status=TaskStatus.NEW.value,
+        due_date=now + timedelta(days=5),
+    )
+    create_task(db, other, user, [user], title="other", status=TaskStatus.NEW.value)
+    create_task(db, project, user, [], title="unassigned")
+
+    def titles(**params):
+        response = client.get("/api/tasks/my", params=params, headers=headers)
+        assert response.status_code == 200
+        return [t["title"] for t in response.json()]
+
+    assert sorted(titles()) == ["done late", "late", "other", "soon"]
+    assert titles(overdue=True) == ["late"]
+    assert sorted(titles(status=["New", "Done"])) == ["done late", "other", "soon"]
+    assert titles(project_id=other.id) == ["other"]
+    assert titles(due_from=now.isoformat(), sort="due_date") == ["soon"]
+    # Offset bounds are compared in UTC, like the stored due dates
+    eastern = timezone(timedelta(hours=-5))
+    soon = (now + timedelta(days=5)).replace(tzinfo=timezone.utc).astimezone(eastern)
+    assert titles(due_to=soon.isoformat(), sort="due_date") == [
+        "done late",
+        "late",
+        "soon",
+    ]
+    assert titles(project_id=project.id, sort="due_date") == [
+        "done late",
+        "late",
+        "soon",
+    ]
+
+    response = client.get(
+        "/api/tasks/my", params={"sort": "title", "limit": 2}, headers=headers
+    )
+    assert response.status_code == 400
+
+
+def test_create_task_checks_membership_from_auth_context(client, db, make_user):
+    owner = make_user("Owner")
+    outsider = make_user("Outsider")
+    project = create_project(db, owner)
+    payload = {"project_id": project.id, "title": "Plan sprint"}
+
+    response = client.post("/api/tasks/", json=payload, headers=auth_headers(outsider))
+    assert response.status_code == 403
+
+    response = client.post("/api/tasks/", json=payload, headers=auth_headers(owner))
+    assert response.status_code == 200
+    assert db.query(Task).filter(Task.project_id == project.id).count() == 1
+
+
+def test_bulk_create_validates_set_based_and_reports_per_item(
+    client, db, make_user, query_counter
+):
+    owner = make_user("Owner")
+    member = make_user("Member")
+    outsider = make_user("Outsider")
+    headers = auth_headers(owner)
+    project = create_project(db, owner, [member])
+    foreign = create_project(db, outsider)
+    in_range = (datetime.utcnow() + timedelta(days=1)).isoformat()
+
+    tasks = [
+        {"project_id": project.id, "title": f"Task {i}", "assignees": [member.id]}
+        for i in range(50)
+    ]
+    tasks += [
+        {"project_id": project.id, "title": "Bad", "assignees": [outsider.id]},
+        {"project_id": foreign.id, "title": "Not mine"},
+        {"project_id": "missing", "title": "Nowhere"},
+        {"project_id": project.id, "title": "Late", "due_date": "2999-01-01"},
+        {"project_id": project.id, "title": "Dated", "due_date": in_range},
+    ]
+
+    query_counter.count = 0
+    response = client.post("/api/tasks/bulk", json={"tasks": tasks}, headers=headers)
+    assert response.status_code == 200
+    assert query_counter.count <= 10
+
+    body = response.json()
+    assert body["created"] == 51
+    assert body["failed"] == 4
+    errors = {r["index"]: r["error"] for r in body["results"] if not r["ok"]}
+    assert errors == {
+        50: "Assignee must be a project member",
+        51: "Not a project member",
+        52: "Project not found",
+        53: "Due date must be within project timeline",
+    }
+
+    assert db.query(Task).filter(Task.project_id == project.id).count() == 51
+    assert (
+        db.query(TaskAssignee).filter(TaskAssignee.user_id == member.id).count() == 50
+    )
+
+
+def test_update_task_touches_only_assignee_delta(client, db, make_user):
+    owner = make_user("Owner")
+    alice = make_user("Alice")
+    bob = make_user("Bob")
+    carol = make_user("Carol")
+    headers = auth_headers(owner)
+    project = create_project(db, owner, [alice, bob, carol])
+    task = create_task(db, project, owner, [alice, bob], title="Ship it")
+    url = f"/api/tasks/{task.id}"
+
+    response = client.put(url, json={"assignees": [bob.id, alice.id]}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["changes"] == {
+        "fields": [],
+        "assignees_added": [],
+        "assignees_removed": [],
+    }
+
+    response = client.put(
+        url,
+        json={"title": "Ship it", "status": "Blocked", "assignees": [bob.id, carol.id]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["changes"] == {
+        "fields": ["status"],
+        "assignees_added": [carol.id],
+        "assignees_removed": [alice.id],
+    }
+
+    assignees = {
+        a.user_id for a in db.query(TaskAssignee).filter_by(task_id=task.id).all()
+    }
+    assert assignees == {bob.id, carol.id}
+
+
+def test_my_tasks_etag_changes_with_assignments(client, db, make_user):
+    user = make_user("Worker")
+    other = make_user("Other")
+    headers = auth_headers(user)
+    project = create_project(db, user, [other])
+    task = create_task(db, project, user, [user], title="mine")
+    task_id = task.id
+
+    response = client.get("/api/tasks/my", headers=headers)
+    etag = response.headers["etag"]
+    conditional = {**headers, "If-None-Match": etag}
+    assert client.get("/api/tasks/my", headers=conditional).status_code == 304
+
+    # Assignee-only change still moves the caller's ETag
+    client.put(
+        f"/api/tasks/{task_id}",
+        json={"assignees": [user.id, other.id]},
+        headers=headers,
+    )
+    response = client.get("/api/tasks/my", headers=conditional)
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_task_writes_are_validated_by_typed_models(
+    client, db, make_user, query_counter
+):
+    owner = make_user("Owner")
+    headers = auth_headers(owner)
+    project = create_project(db, owner)
+    project_id = project.id
+
+    # Warm the principal cache so only handler queries are counted
+    client.get("/api/tasks/my", headers=headers)
+
+    query_counter.count = 0
+    for body in (
+        {"project_id": project_id, "title": ""},
+        {"project_id": project_id, "title": "x", "status": "Someday"},
+        {"project_id": project_id, "title": "x", "due_date": "next week"},
+        {"title": "no project"},
+    ):
+        response = client.post("/api/tasks/", json=body, headers=headers)
+        assert response.status_code == 422
+    assert query_counter.count == 0
+
+    due = (datetime.utcnow() + timedelta(days=5)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    response = client.post(
+        "/api/tasks/",
+        json={"project_id": project_id, "title": "Ship", "due_date": due},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    task = response.json()
+    assert task["status"] == "New"
+    assert task["project_id"] == project_id
+
+    url = f"/api/tasks/{task['id']}"
+    response = client.put(url, json={"title": None}, headers=headers)
+    assert response.status_code == 422
+
+    # Only fields present in the body are applied; "" clears the date
+    response = client.put(url, json={"due_date": ""}, headers=headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["changes"]["fields"] == ["due_date"]
+    assert body["title"] == "Ship"
+    assert body["due_date"] is None
@@ -0,0 +1,194 @@
+from app.core.security import build_token_claims, create_access_token
+from app.models.project import Project
+from tests.conftest import auth_headers
+from tests.test_projects import create_projects
+
+
+def test_lookup_users_keyset_pagination(client, make_user):
+    admin = make_user("Admin", role="Admin")
+    for i in range(6):
+        make_user(f"User{i}")
+    headers = auth_headers(admin)
+
+    # Unpaginated response stays a plain list
+    response = client.get("/api/users/lookup", headers=headers)
+    assert isinstance(response.json(), list)
+    assert len(response.json()) == 7
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/users/lookup", params=params, headers=headers).json()
+        seen.extend(u["id"] for u in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == 7
+    assert len(set(seen)) == 7
+
+    # The pickers' request with an empty search box: first page only
+    page = client.get("/api/users/lookup", params={"limit": 20}, headers=headers).json()
+    assert len(page["items"]) == 7
+    assert page["next_cursor"] is None
+
+
+def test_lookup_users_search_ranks_prefix_matches_first(
+    client, db, make_user, query_counter
+):
+    admin = make_user("Admin", role="Admin")
+    annie = make_user("Annie")
+    make_user("Joanna")
+    make_user("Bob")
+    make_user("Max_Power")
+    make_user("Maxine")
+    headers = auth_headers(admin)
+
+    query_counter.count = 0
+    response = client.get("/api/users/lookup", params={"q": " ANN "}, headers=headers)
+    names = [u["name"] for u in response.json()]
+    # Prefix matches rank ahead of substring matches
+    assert names == ["Annie", "Joanna"]
+    # Principal + prefix query + substring top-up
+    assert query_counter.count <= 3
+
+    # Terms too short for the trigram indexes get prefix matches only
+    response = client.get("/api/users/lookup", params={"q": "an"}, headers=headers)
+    assert [u["name"] for u in response.json()] == ["Annie"]
+
+    # LIKE wildcards in the term match literally
+    response = client.get("/api/users/lookup", params={"q": "max_"}, headers=headers)
+    assert [u["name"] for u in response.json()] == ["Max_Power"]
+
+    # A full prefix page skips the substring query
+    response = client.get(
+        "/api/users/lookup", params={"q": "a", "limit": 1}, headers=headers
+    )
+    assert [u["name"] for u in response.json()] == ["Admin"]
+
+    # Scoped to one project's members; non-members are refused
+    outsider = make_user("Outsider")
+    create_projects(db, admin, [annie], 1)
+    project = db.query(Project).one()
+    params = {"q": "a", "project_id": project.id}
+    response = client.get("/api/users/lookup", params=params, headers=headers)
+    assert [u["name"] for u in response.json()] == ["Admin", "Annie"]
+
+    response = client.get(
+        "/api/users/lookup", params=params, headers=auth_headers(outsider)
+    )
+    assert response.status_code == 403
+
+    response = client.get(
+        "/api/users/lookup", params={"q": "a", "cursor": "x"}, headers=headers
+    )
+    assert response.status_code == 400
+
+
+def test_list_users_page_and_invalid_cursor(client, make_user):
+    admin = make_user("Admin", role="Admin")
+    make_user("Other")
+    headers = auth_headers(admin)
+
+    page = client.get("/api/users/", params={"limit": 1}, headers=headers).json()
+    assert len(page["items"]) == 1
+    assert page["items"][0]["role"]["name"]
+    assert page["next_cursor"]
+
+    response = client.get("/api/users/", params={"cursor": "bogus"}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_principal_is_cached_and_invalidated_on_update(
+    client, make_user, roles, query_counter
+):
+    admin = make_user("Admin", role="Admin")
+    user = make_user("Worker")
+    admin_headers = auth_headers(admin)
+    user_headers = auth_headers(user)
+
+    assert client.get("/api/roles/", headers=user_headers).status_code == 403
+
+    # Cached principal: the role check issues no query at all
+    query_counter.count = 0
+    assert client.get("/api/roles/", headers=user_headers).status_code == 403
+    assert query_counter.count == 0
+
+    response = client.put(
+        f"/api/users/{user.id}",
+        json={
+            "email": "worker@example.com",
+            "name": "Worker",
+            "role_id": roles["Admin"].id,
+        },
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+
+    assert client.get("/api/roles/", headers=user_headers).status_code == 200
+
+
+def test_role_claims_authorize_from_token_and_revoke_on_role_change(
+    client, db, make_user, roles, query_counter
+):
+    admin = make_user("Admin", role="Admin")
+    user = make_user("Reader", role="Read-Only")
+    admin_headers = auth_headers(admin)
+    token = create_access_token(build_token_claims(user))
+    user_headers = {"Authorization": f"Bearer {token}"}
+
+    # Role claim mismatch is rejected without touching the database
+    query_counter.count = 0
+    assert client.get("/api/users/", headers=user_headers).status_code == 403
+    assert query_counter.count == 0
+
+    response = client.put(
+        f"/api/users/{user.id}",
+        json={
+            "email": "reader@example.com",
+            "name": "Reader",
+            "role_id": roles["Admin"].id,
+        },
+        headers=admin_headers,
+    )
+    assert response.status_code == 200
+
+    # Old token still claims Read-Only at version 0 -> revoked
+    response = client.get("/api/users/lookup", headers=user_headers)
+    assert response.status_code == 401
+
+
+def test_newer_token_version_refreshes_a_stale_principal(client, db, make_user):
+    user = make_user("Worker")
+    old_headers = {
+        "Authorization": f"Bearer {create_access_token(build_token_claims(user))}"
+    }
+    assert client.get("/api/users/lookup", headers=old_headers).status_code == 200
+
+    # Role change handled by another worker: this process's cache is stale
+    user.token_version += 1
+    db.commit()
+    new_headers = {
+        "Authorization": f"Bearer {create_access_token(build_token_claims(user))}"
+    }
+
+    assert client.get("/api/users/lookup", headers=new_headers).status_code == 200
+    assert client.get("/api/users/lookup", headers=old_headers).status_code == 401
+
+
+def test_delete_user_reports_dependency_counts(client, db, make_user):
+    admin = make_user("Admin", role="Admin")
+    owner = make_user("Owner")
+    create_projects(db, owner, [], 2)
+    headers = auth_headers(admin)
+
+    response = client.delete(f"/api/users/{owner.id}", headers=headers)
+    assert response.status_code == 400
+    assert "2 created projects, 2 project memberships" in response.json()["detail"]
+
+    loner = make_user("Loner")
+    response = client.delete(f"/api/users/{loner.id}", headers=headers)
+    assert response.status_code == 200
@@ -0,0 +1,6 @@
+import { IDashboard } from "../types/project.type";
+import { http } from "./http";
+
+export function getDashboard() {
+  return http<IDashboard>("/api/dashboard");
+}
@@ -1,4 +1,4 @@
-import { IProject } from "../types/project.type";
+import { IProject, IProjectStats } from "../types/project.type";
 import { http } from "./http";
 
 export function getProjects() {
@@ -22,6 +22,17 @@ export const getProjectById = async (id: string) => {
   return http<IProject>(`/api/projects/${id}`);
 };
 
+export const getProjectStats = async (id: string) => {
+  return http<IProjectStats>(`/api/projects/${id}/stats`);
+};
+
+export function getProjectsStats(ids: string[] = []) {
+  const params = new URLSearchParams();
+  ids.forEach((id) => params.append("ids", id));
+  const query = params.toString();
+  return http<IProjectStats[]>(`/api/projects/stats${query ? `?${query}` : ""}`);
+}
+
 export function updateProject(
   id: string,
   data: {
@@ -1,8 +1,27 @@
 import { Task, TaskPayload } from "../types/task.type";
 import { http } from "./http";
 
-export const getMyTasks = async () => {
-  return http<Task[]>("/api/tasks/my");
+export type MyTasksParams = {
+  status?: string[];
+  project_id?: string;
+  due_from?: string;
+  due_to?: string;
+  overdue?: boolean;
+  sort?: string;
+};
+
+export const getMyTasks = async (params: MyTasksParams = {}) => {
+  const query = new URLSearchParams();
+
+  params.status?.forEach((s) => query.append("status", s));
+  if (params.project_id) query.set("project_id", params.project_id);
+  if (params.due_from) query.set("due_from", params.due_from);
+  if (params.due_to) query.set("due_to", params.due_to);
+  if (params.overdue) query.set("overdue", "true");
+  if (params.sort) query.set("sort", params.sort);
+
+  const qs = query.toString();
+  return http<Task[]>(`/api/tasks/my${qs ? `?${qs}` : ""}`);
 };
 
 export function createTask(data: TaskPayload) {
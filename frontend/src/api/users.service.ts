@@ -22,6 +22,32 @@ export const deleteUser = (id: string) =>
     method: "DELETE",
   });
 
-export const getUsersLookup = async () => {
-  return http<User[]>("/api/users/lookup");
+export type UsersLookupParams = {
+  q?: string;
+  limit?: number;
+  project_id?: string;
+};
+
+type UsersLookupPage = {
+  items: User[];
+  next_cursor: string | null;
+};
+
+// With q, the server returns the best `limit` matches (prefix matches first).
+// Without q, `limit` pages the full list; pickers only need the first page.
+export const getUsersLookup = async (
+  params: UsersLookupParams = {},
+): Promise<User[]> => {
+  const query = new URLSearchParams();
+
+  if (params.q) query.set("q", params.q);
+  if (params.limit) query.set("limit", String(params.limit));
+  if (params.project_id) query.set("project_id", params.project_id);
+
+  const qs = query.toString();
+  const data = await http<User[] | UsersLookupPage>(
+    `/api/users/lookup${qs ? `?${qs}` : ""}`,
+  );
+
+  return Array.isArray(data) ? data : data.items;
 };
@@ -12,6 +12,7 @@ export default function ProjectCard({ project }: { project: IProject }) {
   }
 
   const members = project.members ?? [];
+  const counts = project.task_counts;
   const visibleMembers = members.slice(0, 3);
   const remainingMembers = members.slice(3);
 
@@ -47,6 +48,21 @@ export default function ProjectCard({ project }: { project: IProject }) {
         )}
         <p className="text-xs text-muted">Owner: {project.created_by?.name}</p>
 
+        {/* Progress (from the project's task counters) */}
+        {counts && counts.total > 0 && (
+          <div className="flex items-center gap-2">
+            <div className="flex-1 h-1.5 bg-gray-200 rounded">
+              <div
+                className="h-1.5 bg-orange-500 rounded"
+                style={{ width: `${counts.progress}%` }}
+              />
+            </div>
+            <span className="text-xs text-muted">
+              {counts.by_status.Done ?? 0}/{counts.total} tasks
+            </span>
+          </div>
+        )}
+
         {/* Bottom Row */}
         <div className="flex justify-between items-center mt-2">
           {/* Member Avatars */}
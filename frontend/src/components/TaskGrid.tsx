@@ -11,7 +11,10 @@ import { FiEdit2, FiTrash2, FiCheck, FiX } from "react-icons/fi";
 import { useQueryClient } from "@tanstack/react-query";
 import { updateTask, deleteTask } from "../api/tasks.service";
 import toast from "react-hot-toast";
-import { PROJECT_DETAIL_QUERY } from "../constants/Query.constants";
+import {
+  DASHBOARD_QUERY,
+  PROJECT_DETAIL_QUERY,
+} from "../constants/Query.constants";
 import { useAuth } from "../contexts/AuthContext";
 import { isAdmin, isCreator } from "../utils/common";
 
@@ -108,6 +111,7 @@ export default function TaskGrid({
       queryClient.invalidateQueries({
         queryKey: [PROJECT_DETAIL_QUERY, projectId],
       });
+      queryClient.invalidateQueries({ queryKey: [DASHBOARD_QUERY] });
 
       onTaskUpdated?.(); // sync parent (MyTasksPage)
 
@@ -134,6 +138,7 @@ export default function TaskGrid({
       queryClient.invalidateQueries({
         queryKey: [PROJECT_DETAIL_QUERY, projectId],
       });
+      queryClient.invalidateQueries({ queryKey: [DASHBOARD_QUERY] });
 
       onTaskUpdated?.();
 
@@ -160,6 +165,7 @@ export default function TaskGrid({
       queryClient.invalidateQueries({
         queryKey: [PROJECT_DETAIL_QUERY, projectId],
       });
+      queryClient.invalidateQueries({ queryKey: [DASHBOARD_QUERY] });
 
       onTaskUpdated?.();
 
@@ -192,8 +198,9 @@ export default function TaskGrid({
       {filteredTasks.map((task) => {
         const isEditing = editingId === task.id;
 
-        const assigneeId = task.assignees?.[0]?.id;
-        const assigneeName = members.find((m) => m.id === assigneeId)?.name;
+        const assignee = task.assignees?.[0];
+        const assigneeName =
+          assignee?.name ?? members.find((m) => m.id === assignee?.id)?.name;
 
         return (
           <div
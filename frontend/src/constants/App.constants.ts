@@ -84,6 +84,7 @@ export const TITLES = { MY_TASKS: "Assigned to Me" };
 export const PLACEHOLDERS = {
   SEARCH_PROJECT: "Search Projects",
   SEARCH_TASK: "Search Tasks",
+  SEARCH_USERS: "Search users...",
   EMAIL_EXAMPLE: "name@example.com",
 };
 
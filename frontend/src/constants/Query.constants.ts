@@ -3,3 +3,4 @@ export const MY_TASKS_QUERY = "my-tasks";
 export const PROJECT_DETAIL_QUERY = "project-detail";
 export const USERS_QUERY = "users";
 export const ROLES_QUERY = "roles";
+export const DASHBOARD_QUERY = "dashboard";
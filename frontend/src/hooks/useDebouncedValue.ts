@@ -0,0 +1,15 @@
+import { useEffect, useState } from "react";
+
+const DEFAULT_DELAY_MS = 250;
+
+// Lags `value` until it has stopped changing for `delay` ms
+export function useDebouncedValue<T>(value: T, delay = DEFAULT_DELAY_MS) {
+  const [debounced, setDebounced] = useState(value);
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebounced(value), delay);
+    return () => clearTimeout(timer);
+  }, [value, delay]);
+
+  return debounced;
+}
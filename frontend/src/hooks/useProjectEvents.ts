@@ -0,0 +1,164 @@
+import { useEffect } from "react";
+import { QueryClient, useQueryClient } from "@tanstack/react-query";
+import { API_BASE_URL } from "../constants/Api.constants";
+import { PROJECT_DETAIL_QUERY } from "../constants/Query.constants";
+import { IProject } from "../types/project.type";
+import { Task } from "../types/task.type";
+import { getSession } from "../utils/session";
+
+const RECONNECT_DELAY_MS = 3000;
+const POLICY_VIOLATION = 1008;
+
+type ProjectEvent = {
+  type: string;
+  project_id: string;
+  data: any;
+};
+
+function eventsUrl(projectId: string, token: string) {
+  const url = new URL(API_BASE_URL || "/", window.location.origin);
+  url.protocol = url.protocol === "https:" ? "wss:" : "ws:";
+  url.pathname = `${url.pathname.replace(/\/$/, "")}/api/events/projects/${projectId}`;
+  url.search = new URLSearchParams({ token }).toString();
+  return url.toString();
+}
+
+/**
+ * Applies a server-pushed delta to the cached project detail.
+ * Returns null when the event can't be patched locally (refetch instead).
+ */
+function applyEvent(project: IProject, event: ProjectEvent): IProject | null {
+  const members: any[] = project.members ?? [];
+  const tasks: any[] = project.tasks ?? [];
+  const toAssignee = (id: string) => {
+    const m = members.find((member) => member.id === id);
+    return { id, name: m?.name, email: m?.email };
+  };
+
+  switch (event.type) {
+    case "task.created":
+      return {
+        ...project,
+        tasks: [
+          ...tasks,
+          ...event.data.tasks.map((t: any) => ({
+            ...t,
+            assignees: t.assignees.map(toAssignee),
+          })),
+        ],
+      };
+
+    case "task.updated":
+      return {
+        ...project,
+        tasks: tasks.map((t: Task) => {
+          if (t.id !== event.data.id) return t;
+          const removed = new Set(event.data.assignees_removed);
+          return {
+            ...t,
+            ...event.data.fields,
+            assignees: [
+              ...(t.assignees ?? []).filter((a) => !removed.has(a.id)),
+              ...event.data.assignees_added.map(toAssignee),
+            ],
+          };
+        }),
+      };
+
+    case "task.deleted":
+      return {
+        ...project,
+        tasks: tasks.filter((t: Task) => t.id !== event.data.id),
+      };
+
+    case "project.updated":
+      return { ...project, ...event.data.fields };
+
+    case "member.added":
+      return {
+        ...project,
+        members: [
+          ...members,
+          ...event.data.members.map((m: any) => ({ ...m, role: "Member" })),
+        ],
+      };
+
+    case "member.removed":
+      return {
+        ...project,
+        members: members.filter((m) => !event.data.user_ids.includes(m.id)),
+      };
+
+    default:
+      // project.deleted, resync or anything unknown
+      return null;
+  }
+}
+
+function handleEvent(
+  queryClient: QueryClient,
+  projectId: string,
+  event: ProjectEvent,
+) {
+  const key = [PROJECT_DETAIL_QUERY, projectId];
+  const project = queryClient.getQueryData<IProject>(key);
+  const patched = project ? applyEvent(project, event) : null;
+
+  if (patched) {
+    queryClient.setQueryData(key, patched);
+  } else {
+    queryClient.invalidateQueries({ queryKey: key });
+  }
+
+  // Counts are cheap to recompute server-side
+  if (event.type.startsWith("task.")) {
+    queryClient.invalidateQueries({ queryKey: [...key, "stats"], exact: true });
+  }
+}
+
+/**
+ * Subscribes to a project's change stream and patches the cached
+ * project detail in place, so collaborators see edits without refetching.
+ */
+export function useProjectEvents(projectId?: string) {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const token = getSession()?.token;
+    if (!projectId || !token) return;
+
+    let socket: WebSocket | null = null;
+    let retry: ReturnType<typeof setTimeout> | undefined;
+    let closed = false;
+
+    const connect = (isReconnect: boolean) => {
+      socket = new WebSocket(eventsUrl(projectId, token));
+
+      socket.onopen = () => {
+        // Events may have been missed while disconnected
+        if (isReconnect) {
+          queryClient.invalidateQueries({
+            queryKey: [PROJECT_DETAIL_QUERY, projectId],
+          });
+        }
+      };
+
+      socket.onmessage = (message) => {
+        handleEvent(queryClient, projectId, JSON.parse(message.data));
+      };
+
+      socket.onclose = (event) => {
+        if (closed || event.code === POLICY_VIOLATION) return;
+        retry = setTimeout(() => connect(true), RECONNECT_DELAY_MS);
+      };
+    };
+
+    connect(false);
+
+    return () => {
+      closed = true;
+      clearTimeout(retry);
+      socket?.close();
+    };
+  }, [projectId, queryClient]);
+}
@@ -1,45 +1,31 @@
 import React from "react";
 import { useQuery } from "@tanstack/react-query";
 import ProjectCard from "../components/ProjectCard";
-import { getProjects } from "../api/projects.service";
-import { getMyTasks } from "../api/tasks.service";
+import { getDashboard } from "../api/dashboard.service";
 import {
   EMPTY_STRING,
   ERR_MSG,
   PAGE_LOADING,
   TITLES,
 } from "../constants/App.constants";
-import { MY_TASKS_QUERY, PROJECTS_QUERY } from "../constants/Query.constants";
+import { DASHBOARD_QUERY } from "../constants/Query.constants";
 import TaskGrid from "../components/TaskGrid";
 
 export default function Dashboard() {
-  const {
-    data: projects,
-    isLoading: projectsLoading,
-    error: projectsError,
-  } = useQuery({
-    queryKey: [PROJECTS_QUERY],
-    queryFn: getProjects,
+  // Projects, counts and due-soon tasks arrive in a single request
+  const { data, isLoading, error } = useQuery({
+    queryKey: [DASHBOARD_QUERY],
+    queryFn: getDashboard,
   });
 
-  const {
-    data: tasks,
-    isLoading: tasksLoading,
-    error: tasksError,
-  } = useQuery({
-    queryKey: [MY_TASKS_QUERY],
-    queryFn: getMyTasks,
-  });
-
-  if (projectsLoading || tasksLoading) return <div>{PAGE_LOADING}</div>;
+  if (isLoading) return <div>{PAGE_LOADING}</div>;
 
-  if (projectsError instanceof Error)
-    return <div>{`${ERR_MSG.PROJECTS_LOADING} ${projectsError.message}`}</div>;
+  if (error instanceof Error)
+    return <div>{`${ERR_MSG.PROJECTS_LOADING} ${error.message}`}</div>;
 
-  if (tasksError instanceof Error)
-    return <div>{`${ERR_MSG.TASKS_LOADING} ${tasksError.message}`}</div>;
+  if (!data) return <div>{PAGE_LOADING}</div>;
 
-  if (!projects || !tasks) return <div>{PAGE_LOADING}</div>;
+  const { projects, due_soon: tasks } = data;
 
   return (
     <div>
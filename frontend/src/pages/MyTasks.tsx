@@ -11,6 +11,7 @@ import {
 } from "../constants/App.constants";
 import TaskGrid from "../components/TaskGrid";
 import { useQuery } from "@tanstack/react-query";
+import { MY_TASKS_QUERY } from "../constants/Query.constants";
 
 export default function MyTasksPage() {
   const [query, setQuery] = useState(EMPTY_STRING);
@@ -23,18 +24,19 @@ export default function MyTasksPage() {
     error,
     refetch,
   } = useQuery({
-    queryKey: ["my-tasks"],
-    queryFn: tasksApi.getMyTasks,
+    queryKey: [MY_TASKS_QUERY, statusFilter],
+    queryFn: () =>
+      tasksApi.getMyTasks({
+        status: statusFilter !== TASK_STATUS.ALL ? [statusFilter] : undefined,
+        sort: "due_date",
+      }),
   });
 
   // =========================
-  // FILTER
+  // FILTER (status is applied server-side)
   // =========================
   const filtered = useMemo(() => {
     return tasks.filter((t: Task) => {
-      if (statusFilter !== TASK_STATUS.ALL && t.status !== statusFilter)
-        return false;
-
       if (query.trim()) {
         const q = query.toLowerCase();
         return (t.title + " " + (t.description || EMPTY_STRING))
@@ -44,7 +46,7 @@ export default function MyTasksPage() {
 
       return true;
     });
-  }, [tasks, statusFilter, query]);
+  }, [tasks, query]);
 
   const onClear = () => {
     setQuery(EMPTY_STRING);
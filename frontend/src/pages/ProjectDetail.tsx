@@ -1,4 +1,4 @@
-import React, { useMemo, useState } from "react";
+import React, { useState } from "react";
 import { useParams, useNavigate } from "react-router-dom";
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import Breadcrumbs from "../components/Breadcrumbs";
@@ -9,11 +9,13 @@ import {
   ERR_MSG,
   FORM_LABEL,
   OTHERS,
+  PLACEHOLDERS,
   SIDEBAR_OPTIONS,
   TASK_STATUS,
 } from "../constants/App.constants";
 import {
   getProjectById,
+  getProjectStats,
   updateProject,
   deleteProject,
   addProjectMember,
@@ -22,11 +24,16 @@ import {
 import { getUsersLookup } from "../api/users.service";
 import { createTask } from "../api/tasks.service";
 import toast from "react-hot-toast";
-import { PROJECT_DETAIL_QUERY } from "../constants/Query.constants";
+import {
+  DASHBOARD_QUERY,
+  PROJECT_DETAIL_QUERY,
+} from "../constants/Query.constants";
 import TaskGrid from "../components/TaskGrid";
 import { useAuth } from "../contexts/AuthContext";
 import { TaskStatus } from "../types/task.type";
 import { isAdmin, canCreateTask } from "../utils/common";
+import { useProjectEvents } from "../hooks/useProjectEvents";
+import { useDebouncedValue } from "../hooks/useDebouncedValue";
 
 export default function ProjectDetail() {
   const { user } = useAuth();
@@ -38,6 +45,8 @@ export default function ProjectDetail() {
 
   const [showMemberModal, setShowMemberModal] = useState(false);
   const [selectedUser, setSelectedUser] = useState("");
+  const [userSearch, setUserSearch] = useState("");
+  const debouncedUserSearch = useDebouncedValue(userSearch.trim());
 
   const [removeMemberId, setRemoveMemberId] = useState<string | null>(null);
   const [showRemoveModal, setShowRemoveModal] = useState(false);
@@ -73,9 +82,22 @@ export default function ProjectDetail() {
     enabled: !!id,
   });
 
+  // Counts come from the server; invalidating the detail query refreshes them
+  const { data: stats } = useQuery({
+    queryKey: [PROJECT_DETAIL_QUERY, id, "stats"],
+    queryFn: () => getProjectStats(id!),
+    enabled: !!id,
+  });
+
+  // Live task/member deltas from collaborators patch the cache above
+  useProjectEvents(id);
+
+  // Server-side search; only fetched while the add-member modal is open
   const { data: allUsers = [] } = useQuery({
-    queryKey: ["users-lookup"],
-    queryFn: getUsersLookup,
+    queryKey: ["users-lookup", debouncedUserSearch],
+    queryFn: () => getUsersLookup({ q: debouncedUserSearch, limit: 20 }),
+    enabled: showMemberModal,
+    placeholderData: (previous) => previous,
   });
 
   const tasks = project?.tasks ?? [];
@@ -110,6 +132,7 @@ export default function ProjectDetail() {
       queryClient.invalidateQueries({
         queryKey: [PROJECT_DETAIL_QUERY, id],
       });
+      queryClient.invalidateQueries({ queryKey: [DASHBOARD_QUERY] });
       toast.success("Project updated");
       setIsEditing(false);
     },
@@ -130,8 +153,10 @@ export default function ProjectDetail() {
       queryClient.invalidateQueries({
         queryKey: [PROJECT_DETAIL_QUERY, id],
       });
+      queryClient.invalidateQueries({ queryKey: [DASHBOARD_QUERY] });
       setShowMemberModal(false);
       setSelectedUser("");
+      setUserSearch("");
     },
   });
 
@@ -142,6 +167,7 @@ export default function ProjectDetail() {
       queryClient.invalidateQueries({
         queryKey: [PROJECT_DETAIL_QUERY, id],
       });
+      queryClient.invalidateQueries({ queryKey: [DASHBOARD_QUERY] });
     },
     onError: (err: any) => {
       toast.error(
@@ -166,6 +192,7 @@ export default function ProjectDetail() {
     mutationFn: () => deleteProject(id!),
     onSuccess: () => {
       toast.success("Project deleted");
+      queryClient.invalidateQueries({ queryKey: [DASHBOARD_QUERY] });
       navigate(ROUTE_NAMES.PROJECTS);
     },
   });
@@ -179,6 +206,7 @@ export default function ProjectDetail() {
       queryClient.invalidateQueries({
         queryKey: [PROJECT_DETAIL_QUERY, id],
       });
+      queryClient.invalidateQueries({ queryKey: [DASHBOARD_QUERY] });
       toast.success("Task created");
       setShowTaskForm(false);
       setTaskDraft({
@@ -204,11 +232,7 @@ export default function ProjectDetail() {
   // =========================
   // PROGRESS
   // =========================
-  const progress = useMemo(() => {
-    if (!tasks.length) return 0;
-    const done = tasks.filter((t: any) => t.status === TASK_STATUS.DONE).length;
-    return Math.round((done / tasks.length) * 100);
-  }, [tasks]);
+  const progress = stats?.progress ?? 0;
 
   if (isLoading) return <div>Loading...</div>;
   if (error instanceof Error) return <div>{error.message}</div>;
@@ -447,6 +471,13 @@ export default function ProjectDetail() {
           <div className="bg-white p-5 rounded w-full max-w-md">
             <h2 className="text-lg font-semibold">{BUTTON_NAMES.ADD_MEMBER}</h2>
 
+            <input
+              value={userSearch}
+              onChange={(e) => setUserSearch(e.target.value)}
+              placeholder={PLACEHOLDERS.SEARCH_USERS}
+              className="border p-2 w-full mt-3"
+            />
+
             <select
               value={selectedUser}
               onChange={(e) => setSelectedUser(e.target.value)}
@@ -13,9 +13,10 @@ import {
 import { useMutation, useQueryClient, useQuery } from "@tanstack/react-query";
 import { getProjects, createProject } from "../api/projects.service";
 import { getUsersLookup } from "../api/users.service";
-import { PROJECTS_QUERY } from "../constants/Query.constants";
+import { DASHBOARD_QUERY, PROJECTS_QUERY } from "../constants/Query.constants";
 import toast from "react-hot-toast";
 import { useAuth } from "../contexts/AuthContext";
+import { useDebouncedValue } from "../hooks/useDebouncedValue";
 import { canCreateTask } from "../utils/common";
 
 type FormValues = {
@@ -31,11 +32,13 @@ export default function Projects() {
   // 🔍 project search
   const [q, setQ] = useState(EMPTY_STRING);
 
-  // 🔍 user search (FIXED)
+  // 🔍 user search (server-side, debounced)
   const [userSearch, setUserSearch] = useState("");
+  const debouncedUserSearch = useDebouncedValue(userSearch.trim());
 
   const [showForm, setShowForm] = useState(false);
-  const [selectedMembers, setSelectedMembers] = useState<string[]>([]);
+  // Kept as objects: selected users may drop out of the search results
+  const [selectedMembers, setSelectedMembers] = useState<any[]>([]);
 
   const queryClient = useQueryClient();
 
@@ -43,8 +46,10 @@ export default function Projects() {
   // USERS
   // =========================
   const { data: users = [] } = useQuery({
-    queryKey: ["users_lookup"],
-    queryFn: getUsersLookup,
+    queryKey: ["users_lookup", debouncedUserSearch],
+    queryFn: () => getUsersLookup({ q: debouncedUserSearch, limit: 20 }),
+    enabled: showForm,
+    placeholderData: (previous) => previous,
   });
 
   // =========================
@@ -59,6 +64,7 @@ export default function Projects() {
     mutationFn: createProject,
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: [PROJECTS_QUERY] });
+      queryClient.invalidateQueries({ queryKey: [DASHBOARD_QUERY] });
 
       setShowForm(false);
       reset();
@@ -119,15 +125,17 @@ export default function Projects() {
     mutation.mutate({
       name: data.title,
       description: data.description || EMPTY_STRING,
-      member_ids: selectedMembers,
+      member_ids: selectedMembers.map((m) => m.id),
       start_date: data.start_date,
       end_date: data.end_date,
     });
   };
 
-  const toggleMember = (id: string) => {
+  const toggleMember = (user: any) => {
     setSelectedMembers((prev) =>
-      prev.includes(id) ? prev.filter((m) => m !== id) : [...prev, id],
+      prev.some((m) => m.id === user.id)
+        ? prev.filter((m) => m.id !== user.id)
+        : [...prev, user],
     );
   };
 
@@ -211,25 +219,23 @@ export default function Projects() {
               <input
                 value={userSearch}
                 onChange={(e) => setUserSearch(e.target.value)}
-                placeholder="Search users..."
+                placeholder={PLACEHOLDERS.SEARCH_USERS}
                 className="w-full border px-2 py-1 mb-2 text-sm rounded"
               />
 
               {/* SELECTED */}
               {selectedMembers.length > 0 && (
                 <div className="flex flex-wrap gap-2 mb-2">
-                  {selectedMembers.map((id) => {
-                    const user = (users as any[]).find((u) => u.id === id);
-
+                  {selectedMembers.map((member) => {
                     return (
                       <span
-                        key={id}
+                        key={member.id}
                         className="flex items-center gap-1 px-2 py-1 bg-orange-100 text-orange-700 rounded text-xs"
                       >
-                        {user?.name}
+                        {member.name}
                         <button
                           type="button"
-                          onClick={() => toggleMember(id)}
+                          onClick={() => toggleMember(member)}
                           className="text-orange-700 hover:text-red-600"
                         >
                           ✕
@@ -242,29 +248,25 @@ export default function Projects() {
 
               {/* LIST */}
               <div className="max-h-40 overflow-y-auto border rounded">
-                {(users as any[])
-                  .filter((u) =>
-                    u.name.toLowerCase().includes(userSearch.toLowerCase()),
-                  )
-                  .map((u: any) => {
-                    const selected = selectedMembers.includes(u.id);
-
-                    return (
-                      <div
-                        key={u.id}
-                        onClick={() => toggleMember(u.id)}
-                        className={`px-3 py-2 text-sm cursor-pointer flex justify-between items-center
-                        ${
-                          selected
-                            ? "bg-orange-50 text-orange-700"
-                            : "hover:bg-gray-50"
-                        }`}
-                      >
-                        <span>{u.name}</span>
-                        {selected && <span>✓</span>}
-                      </div>
-                    );
-                  })}
+                {(users as any[]).map((u: any) => {
+                  const selected = selectedMembers.some((m) => m.id === u.id);
+
+                  return (
+                    <div
+                      key={u.id}
+                      onClick={() => toggleMember(u)}
+                      className={`px-3 py-2 text-sm cursor-pointer flex justify-between items-center
+                      ${
+                        selected
+                          ? "bg-orange-50 text-orange-700"
+                          : "hover:bg-gray-50"
+                      }`}
+                    >
+                      <span>{u.name}</span>
+                      {selected && <span>✓</span>}
+                    </div>
+                  );
+                })}
               </div>
             </div>
             {/* ================= ACTIONS ================= */}
@@ -14,4 +14,41 @@ export interface IProject {
   updated_at?: string;
   created_by?: User;
   members?: User[];
+  task_counts?: IProjectTaskCounts;
+}
+
+export interface IProjectWorkload {
+  user_id: string;
+  name: string;
+  total: number;
+  open: number;
+}
+
+export interface IProjectStats {
+  project_id: string;
+  total: number;
+  by_status: Record<string, number>;
+  overdue: number;
+  unassigned: number;
+  progress: number;
+  workload: IProjectWorkload[];
+}
+
+// Maintained per-project counters; overdue is a snapshot as of overdue_as_of
+export type IProjectTaskCounts = Pick<
+  IProjectStats,
+  "total" | "by_status" | "overdue" | "progress"
+> & { overdue_as_of?: string | null };
+
+export interface IDashboardProject extends IProject {
+  task_counts: Pick<
+    IProjectStats,
+    "total" | "by_status" | "overdue" | "progress"
+  >;
+}
+
+export interface IDashboard {
+  projects: IDashboardProject[];
+  due_soon: Task[];
+  status_totals: Record<string, number>;
 }